@@ -0,0 +1,110 @@
+"""
+Memory and time to materialise products: plain classes with hand-indexed
+sqlite3.Row access (before) versus __slots__ models built by the shared
+row-factory mapper (after)
+Usage: python -m benchmarks.models [--rows 1000000]
+"""
+import argparse
+import gc
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from database.models import Product, row_factory, model_columns
+
+class LegacyProduct:
+    """Product as it was before __slots__"""
+    def __init__(self, product_id=None, name="", description="", category="", price=0.0,
+                 cost=0.0, stock_quantity=0, supplier_id=None, image_path="", created_at=None):
+        self.product_id = product_id
+        self.name = name
+        self.description = description
+        self.category = category
+        self.price = price
+        self.cost = cost
+        self.stock_quantity = stock_quantity
+        self.supplier_id = supplier_id
+        self.image_path = image_path
+        self.created_at = created_at or datetime.now().isoformat()
+
+def build_database(db_path: str, rows: int):
+    """Create a products table with ``rows`` rows"""
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE products (
+            product_id INTEGER PRIMARY KEY, name TEXT, description TEXT, category TEXT,
+            price REAL, cost REAL, stock_quantity INTEGER, supplier_id INTEGER,
+            image_path TEXT, created_at TEXT
+        )
+    ''')
+    created_at = datetime.now().isoformat()
+    conn.executemany('INSERT INTO products VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                     ((i, f"Bag {i}", "Benchmark bag", f"Category {i % 20}", 1000.0 + i % 500,
+                       600.0, i % 50, i % 10 + 1, "", created_at) for i in range(1, rows + 1)))
+    conn.commit()
+    conn.close()
+
+def load_legacy(conn):
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.execute('SELECT * FROM products')
+    return [LegacyProduct(row['product_id'], row['name'], row['description'],
+                          row['category'], row['price'], row['cost'],
+                          row['stock_quantity'], row['supplier_id'],
+                          row['image_path'], row['created_at']) for row in cursor.fetchall()]
+
+def load_mapped(conn):
+    cursor = conn.cursor()
+    cursor.row_factory = row_factory(Product)
+    cursor.execute(f'SELECT {model_columns(Product)} FROM products')
+    return cursor.fetchall()
+
+def measure(loader, conn):
+    """Return (seconds, peak bytes, retained bytes) for one full load"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    products = loader(conn)
+    elapsed = time.perf_counter() - started
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del products
+    return elapsed, peak, retained
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark product materialisation")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="girlush_bench_")
+    try:
+        db_path = os.path.join(work_dir, "models.db")
+        build_database(db_path, args.rows)
+        conn = sqlite3.connect(db_path)
+
+        # Time without tracemalloc (it slows allocation down) then measure memory
+        results = []
+        for label, loader in (("before (dict + Row)", load_legacy),
+                              ("after (slots + mapper)", load_mapped)):
+            gc.collect()
+            started = time.perf_counter()
+            loader(conn)
+            elapsed = time.perf_counter() - started
+            _, peak, retained = measure(loader, conn)
+            results.append((label, elapsed, peak, retained))
+        conn.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("=" * 70)
+    print(f"MATERIALISING {args.rows:,} PRODUCTS")
+    print("=" * 70)
+    print(f"{'Variant':<26}{'Time (s)':>12}{'Peak (MB)':>14}{'Retained (MB)':>16}")
+    for label, elapsed, peak, retained in results:
+        print(f"{label:<26}{elapsed:>12.2f}{peak / 2**20:>14.1f}{retained / 2**20:>16.1f}")
+
+if __name__ == "__main__":
+    main()
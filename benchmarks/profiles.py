@@ -0,0 +1,90 @@
+"""
+Checkout throughput per storage tuning profile
+Usage: python -m benchmarks.profiles [--checkouts 300] [--lines 3]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import config
+from database.database_manager import DatabaseManager
+from database.models import Product, User, Customer
+from controllers.cart_controller import CartController
+from controllers.order_controller import OrderController
+
+def seed_database(db: DatabaseManager, products: int, checkouts: int, lines: int) -> int:
+    """Create products with enough stock for every checkout and one customer"""
+    for i in range(products):
+        db.create_product(Product(name=f"Benchmark Bag {i}", description="Benchmark product",
+                                  category="Benchmark", price=1000 + i, cost=600,
+                                  stock_quantity=checkouts * lines + 10))
+    user_id = db.create_user(User(email="bench@example.com", password="x",
+                                  name="Bench Customer", role="customer"))
+    db.create_customer(Customer(user_id=user_id, address="Kampala"))
+    return user_id
+
+def run_checkouts(db: DatabaseManager, user_id: int, products: int, checkouts: int, lines: int) -> float:
+    """Run add-to-cart plus checkout round trips; return checkouts per second"""
+    cart = CartController(db)
+    orders = OrderController(db)
+    customer = db.get_customer_by_user_id(user_id)
+
+    started = time.perf_counter()
+    for n in range(checkouts):
+        for line in range(lines):
+            cart.add_to_cart(user_id, (n + line) % products + 1, 1)
+        items = cart.get_cart_items(user_id)
+        success, message, _ = orders.create_order(user_id, customer.customer_id, items,
+                                                   'cash', customer.address)
+        if not success:
+            raise RuntimeError(message)
+    return checkouts / (time.perf_counter() - started)
+
+def run_reads(db: DatabaseManager, products: int, reads: int) -> float:
+    """Run product lookups; return reads per second"""
+    started = time.perf_counter()
+    for n in range(reads):
+        db.get_product_by_id(n % products + 1)
+    return reads / (time.perf_counter() - started)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark checkout throughput per database profile")
+    parser.add_argument('--checkouts', type=int, default=300)
+    parser.add_argument('--lines', type=int, default=3, help="cart lines per checkout")
+    parser.add_argument('--products', type=int, default=50)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="girlush_bench_")
+    results = []
+    try:
+        for name, profile in config.DATABASE_PROFILES.items():
+            db_path = os.path.join(work_dir, f"{name}.db")
+            if profile['query_only']:
+                # Read-only profiles get a database prepared by a writable profile
+                seeder = DatabaseManager(db_path, profile='durable')
+                seed_database(seeder, args.products, 1, 1)
+                seeder.close()
+                db = DatabaseManager(db_path, profile=name)
+                reads = run_reads(db, args.products, args.checkouts * 20)
+                results.append((name, None, reads))
+            else:
+                db = DatabaseManager(db_path, profile=name)
+                user_id = seed_database(db, args.products, args.checkouts, args.lines)
+                throughput = run_checkouts(db, user_id, args.products, args.checkouts, args.lines)
+                reads = run_reads(db, args.products, args.checkouts * 20)
+                results.append((name, throughput, reads))
+            db.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("=" * 60)
+    print(f"CHECKOUT THROUGHPUT ({args.checkouts} checkouts x {args.lines} lines)")
+    print("=" * 60)
+    print(f"{'Profile':<18}{'Checkouts/s':>16}{'Reads/s':>16}")
+    for name, throughput, reads in results:
+        checkout_text = f"{throughput:,.1f}" if throughput is not None else "read-only"
+        print(f"{name:<18}{checkout_text:>16}{reads:>16,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+"""
+Latency of every DatabaseManager and controller operation at several data scales
+Usage: python -m benchmarks.suite [--scales 1k 100k 10m] [--output results.json]
+                                  [--baseline benchmarks/baseline.json] [--tolerance 0.25]
+                                  [--save-baseline] [--only REGEX]
+
+Fixture databases are generated once per scale with populate_database and
+cached in --fixture-dir; each run works on a throwaway copy. Every operation
+is sampled until --iterations calls or --budget seconds, and p50/p95/p99 are
+reported in milliseconds. With a baseline file the run exits with status 1
+when an operation's --metric grows by more than --tolerance (and by more than
+--min-delta-ms, which keeps sub-millisecond noise from failing the run).
+Operations that read whole tables are skipped above --full-scan-limit orders.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from database.database_manager import DatabaseManager
+from database.models import User, Product, Customer, Order, OrderItem, CartItem, Supplier
+from controllers.auth_controller import AuthController
+from controllers.product_controller import ProductController
+from controllers.order_controller import OrderController
+from controllers.customer_controller import CustomerController
+from controllers.cart_controller import CartController
+from populate_database import DatasetGenerator
+
+SCALES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000, '10m': 10_000_000}
+FIXTURE_END_DATE = datetime(2025, 12, 31)
+BENCH_PASSWORD = "benchmark"
+
+# Read-only operations run first, on the untouched fixture
+READ_PREFIXES = ('get_', 'search_', 'stock_at', 'verify_', 'validate_', 'hash_', 'is_', 'login')
+
+# Connection plumbing rather than data operations
+NOT_BENCHMARKED = {'get_connection', 'connection', 'transaction', 'close', 'init_database',
+                   'is_read_only', 'get_pool_stats', 'get_trace_stats', 'get_catalogue_stats',
+                   'get_change_stats', 'get_search_cache_stats'}
+
+def fixture_sizes(orders: int) -> Dict[str, int]:
+    """Catalogue and customer base that go with an order history of ``orders``"""
+    return {
+        'suppliers': max(10, orders // 20_000),
+        'products': max(200, orders // 50),
+        'customers': max(200, orders // 10),
+        'orders': orders,
+        'carts': max(20, orders // 1_000),
+    }
+
+def build_fixture(path: str, orders: int, seed: int):
+    """Generate the fixture database for one scale"""
+    db = DatabaseManager(path)
+    generator = DatasetGenerator(db, seed=seed, end_date=FIXTURE_END_DATE)
+    started = time.perf_counter()
+    sizes = fixture_sizes(orders)
+    generator.generate(sizes['suppliers'], sizes['products'], sizes['customers'],
+                       sizes['orders'], sizes['carts'])
+    with db.connection() as conn:
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    db.close()
+    print(f"  built fixture: {generator.rows_written:,} rows "
+          f"in {time.perf_counter() - started:.1f}s")
+
+def fixture_path(fixture_dir: str, orders: int, seed: int) -> str:
+    """Cached fixture for a scale, generated on first use"""
+    os.makedirs(fixture_dir, exist_ok=True)
+    path = os.path.join(fixture_dir, f"orders_{orders}_seed{seed}.db")
+    if not os.path.exists(path):
+        building = path + ".building"
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(building + suffix):
+                os.remove(building + suffix)
+        build_fixture(building, orders, seed)
+        os.replace(building, path)
+    return path
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted ``samples``"""
+    rank = max(1, math.ceil(pct / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+class Benchmark:
+    """One timed operation; ``setup`` runs untimed before each call and returns its arguments"""
+    def __init__(self, name: str, run: Callable, setup: Optional[Callable] = None,
+                 full_scan: bool = False):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.full_scan = full_scan
+
+    def measure(self, iterations: int, budget: float, min_samples: int) -> List[float]:
+        """Return sorted call durations in milliseconds"""
+        self.run(*(self.setup() if self.setup else ()))  # warm-up
+        samples = []
+        deadline = time.perf_counter() + budget
+        while len(samples) < iterations and (len(samples) < min_samples or time.perf_counter() < deadline):
+            args = self.setup() if self.setup else ()
+            started = time.perf_counter()
+            self.run(*args)
+            samples.append((time.perf_counter() - started) * 1000)
+        return sorted(samples)
+
+class BenchContext:
+    """Database, controllers and sample keys shared by the benchmarks of one scale"""
+    def __init__(self, db: DatabaseManager, seed: int):
+        self.db = db
+        self.auth = AuthController(db)
+        self.products = ProductController(db)
+        self.orders = OrderController(db)
+        self.customers = CustomerController(db)
+        self.cart = CartController(db)
+        self.serial = 0
+
+        with db.connection() as conn:
+            self.max_product_id = conn.execute('SELECT MAX(product_id) FROM products').fetchone()[0]
+            self.max_order_id = conn.execute('SELECT MAX(order_id) FROM orders').fetchone()[0]
+            self.customer_user_ids = [row[0] for row in conn.execute(
+                "SELECT user_id FROM users WHERE role = 'customer' ORDER BY user_id LIMIT 1000")]
+            cart_row = conn.execute('SELECT user_id FROM cart LIMIT 1').fetchone()
+            category_row = conn.execute('SELECT category FROM products LIMIT 1').fetchone()
+            first_day, last_day = conn.execute(
+                'SELECT MIN(order_date), MAX(order_date) FROM orders').fetchone()
+        self.category = category_row[0] if category_row else ""
+        self.first_day = first_day or datetime.now().isoformat()
+        self.last_day = last_day or datetime.now().isoformat()
+
+        # A customer and a product of our own, so writes never run out of stock
+        self.email = f"bench{seed}@example.com"
+        self.auth.register(self.email, BENCH_PASSWORD, "Bench Customer", "0700000000", "Plot 1", "Kampala")
+        self.user = db.get_user_by_email(self.email)
+        self.customer = db.get_customer_by_user_id(self.user.user_id)
+        self.product_id = db.create_product(Product(name="Benchmark Bag", description="Benchmark product",
+                                                    category="Benchmark", price=1000.0, cost=600.0,
+                                                    stock_quantity=10 ** 9))
+        self.cart_user_id = cart_row[0] if cart_row else self.user.user_id
+        self.rng_state = seed
+
+    def next_serial(self) -> int:
+        self.serial += 1
+        return self.serial
+
+    def pick(self, upper: int) -> int:
+        """Deterministic pseudo-random id in 1..upper"""
+        self.rng_state = (self.rng_state * 1103515245 + 12345) % 2 ** 31
+        return self.rng_state % max(upper, 1) + 1
+
+    def random_product_id(self) -> int:
+        return self.pick(self.max_product_id or 1)
+
+    def random_order_id(self) -> int:
+        return self.pick(self.max_order_id or 1)
+
+    def random_user_id(self) -> int:
+        return self.customer_user_ids[self.pick(len(self.customer_user_ids)) - 1]
+
+    # ----- setup helpers -----
+    def new_user(self) -> User:
+        return User(email=f"bench-user{self.next_serial()}@example.com", password="x",
+                    name="Bench User", role="customer")
+
+    def new_product(self) -> Product:
+        return Product(name=f"Bench Product {self.next_serial()}", description="Benchmark product",
+                       category="Benchmark", price=1500.0, cost=900.0, stock_quantity=50)
+
+    def pending_order_id(self) -> int:
+        return self.db.create_order(
+            Order(customer_id=self.customer.customer_id, user_id=self.user.user_id,
+                  total_amount=1000.0, payment_method='cash'),
+            [OrderItem(product_id=self.product_id, quantity=1, unit_price=1000.0, subtotal=1000.0)])
+
+    def empty_cart(self) -> tuple:
+        """Clear the bench cart; returns no call arguments"""
+        self.db.clear_cart(self.user.user_id)
+        return ()
+
+    def filled_cart(self) -> int:
+        """Reset the bench cart to one line; returns its cart_id"""
+        self.db.clear_cart(self.user.user_id)
+        self.db.add_to_cart(CartItem(user_id=self.user.user_id, product_id=self.product_id, quantity=1))
+        return self.db.get_cart_items(self.user.user_id)[0]['cart_id']
+
+    def product_rows(self, count: int) -> List[Dict[str, Any]]:
+        rows = []
+        for product in (self.db.get_product_by_id(self.random_product_id()) for _ in range(count)):
+            if product:
+                rows.append(product.to_dict())
+        return rows
+
+def database_benchmarks(ctx: BenchContext) -> List[Benchmark]:
+    db = ctx.db
+    uid = ctx.user.user_id
+    return [
+        # Users
+        Benchmark('create_user', db.create_user, lambda: (ctx.new_user(),)),
+        Benchmark('get_user_by_email', lambda: db.get_user_by_email(ctx.email)),
+        Benchmark('get_user_by_id', lambda: db.get_user_by_id(ctx.random_user_id())),
+        Benchmark('get_all_users', db.get_all_users, full_scan=True),
+        Benchmark('get_users_page', db.get_users_page),
+        Benchmark('update_user', db.update_user, lambda: (db.get_user_by_id(uid),)),
+        Benchmark('delete_user', db.delete_user, lambda: (db.create_user(ctx.new_user()),)),
+        # Products
+        Benchmark('create_product', db.create_product, lambda: (ctx.new_product(),)),
+        Benchmark('get_product_by_id', lambda: db.get_product_by_id(ctx.random_product_id())),
+        Benchmark('get_all_products', db.get_all_products),
+        Benchmark('get_products_page', db.get_products_page),
+        Benchmark('get_in_stock_products_page', db.get_in_stock_products_page),
+        Benchmark('get_products_by_category', lambda: db.get_products_by_category(ctx.category)),
+        Benchmark('get_low_stock_products', db.get_low_stock_products),
+        Benchmark('get_categories', db.get_categories),
+        Benchmark('search_products', lambda: db.search_products("leather tote", 50)),
+        Benchmark('search_products_with_snippets',
+                  lambda: db.search_products_with_snippets("leather tote", 50)),
+        Benchmark('rank_product_search', lambda: db.rank_product_search("leather tote")),
+        Benchmark('update_product', db.update_product, lambda: (db.get_product_by_id(ctx.product_id),)),
+        Benchmark('delete_product', db.delete_product, lambda: (db.create_product(ctx.new_product()),)),
+        Benchmark('update_stock', lambda: db.update_stock(ctx.product_id, 1, "Benchmark")),
+        Benchmark('create_products_bulk', db.create_products_bulk,
+                  lambda: ([ctx.new_product() for _ in range(100)],)),
+        Benchmark('update_products_bulk', db.update_products_bulk,
+                  lambda: ([Product(**row) for row in ctx.product_rows(100)],)),
+        Benchmark('stock_at', lambda: db.stock_at(ctx.random_product_id(), ctx.last_day)),
+        Benchmark('get_inventory_transactions',
+                  lambda: db.get_inventory_transactions(ctx.random_product_id())),
+        # Customers
+        Benchmark('create_customer', db.create_customer,
+                  lambda: (Customer(user_id=db.create_user(ctx.new_user()), city="Kampala"),)),
+        Benchmark('get_customer_by_user_id', lambda: db.get_customer_by_user_id(ctx.random_user_id())),
+        Benchmark('get_all_customers', db.get_all_customers, full_scan=True),
+        Benchmark('get_customers_page', db.get_customers_page),
+        Benchmark('update_customer', lambda: db.update_customer(ctx.customer)),
+        Benchmark('search_customers', lambda: db.search_customers("nakato")),
+        Benchmark('search_customers_page', lambda: db.search_customers_page("grace n")),
+        # Orders
+        Benchmark('create_order', db.create_order, lambda: (
+            Order(customer_id=ctx.customer.customer_id, user_id=uid, total_amount=1000.0,
+                  payment_method='cash'),
+            [OrderItem(product_id=ctx.product_id, quantity=1, unit_price=1000.0, subtotal=1000.0)])),
+        Benchmark('checkout_from_cart', lambda _: db.checkout_from_cart(uid, 'cash'),
+                  lambda: (ctx.filled_cart(),)),
+        Benchmark('get_order_by_id', lambda: db.get_order_by_id(ctx.random_order_id())),
+        Benchmark('get_all_orders', db.get_all_orders, full_scan=True),
+        Benchmark('get_orders_page', db.get_orders_page),
+        Benchmark('get_orders_by_user', lambda: db.get_orders_by_user(ctx.random_user_id())),
+        Benchmark('update_order_status', lambda order_id: db.update_order_status(order_id, 'processing'),
+                  lambda: (ctx.pending_order_id(),)),
+        # Cart
+        Benchmark('add_to_cart', lambda: db.add_to_cart(
+            CartItem(user_id=uid, product_id=ctx.product_id, quantity=1)), ctx.empty_cart),
+        Benchmark('get_cart_items', lambda: db.get_cart_items(ctx.cart_user_id)),
+        Benchmark('update_cart_item_quantity', lambda cart_id: db.update_cart_item_quantity(cart_id, 2),
+                  lambda: (ctx.filled_cart(),)),
+        Benchmark('remove_from_cart', db.remove_from_cart, lambda: (ctx.filled_cart(),)),
+        Benchmark('clear_cart', lambda _: db.clear_cart(uid), lambda: (ctx.filled_cart(),)),
+        # Suppliers
+        Benchmark('create_supplier', lambda: db.create_supplier(
+            Supplier(name=f"Bench Supplier {ctx.next_serial()}"))),
+        Benchmark('create_suppliers_bulk', db.create_suppliers_bulk, lambda: (
+            [Supplier(name=f"Bench Supplier {ctx.next_serial()}") for _ in range(20)],)),
+        Benchmark('get_all_suppliers', db.get_all_suppliers),
+        # Reporting
+        Benchmark('get_dashboard_stats', db.get_dashboard_stats),
+        Benchmark('verify_stats_counters', db.verify_stats_counters, full_scan=True),
+        Benchmark('verify_sales_rollup', db.verify_sales_rollup, full_scan=True),
+        Benchmark('rebuild_stats_counters', db.rebuild_stats_counters, full_scan=True),
+        Benchmark('get_sales_data', lambda: db.get_sales_data(ctx.first_day[:10], ctx.last_day[:10])),
+        Benchmark('rebuild_sales_rollup', db.rebuild_sales_rollup, full_scan=True),
+    ]
+
+def controller_benchmarks(ctx: BenchContext) -> List[Benchmark]:
+    auth, products, orders, customers, cart = ctx.auth, ctx.products, ctx.orders, ctx.customers, ctx.cart
+    uid = ctx.user.user_id
+    cid = ctx.customer.customer_id
+    line = [{'product_id': ctx.product_id, 'quantity': 1}]
+    benchmarks = [
+        Benchmark('AuthController.hash_password', lambda: auth.hash_password(BENCH_PASSWORD)),
+        Benchmark('AuthController.login', lambda: auth.login(ctx.email, BENCH_PASSWORD)),
+        Benchmark('AuthController.register', lambda: auth.register(
+            f"bench-register{ctx.next_serial()}@example.com", BENCH_PASSWORD, "Bench Register")),
+        Benchmark('AuthController.change_password',
+                  lambda: auth.change_password(uid, BENCH_PASSWORD, BENCH_PASSWORD)),
+        Benchmark('AuthController.is_admin', lambda: auth.is_admin(ctx.user)),
+        Benchmark('AuthController.is_staff', lambda: auth.is_staff(ctx.user)),
+        Benchmark('AuthController.is_customer', lambda: auth.is_customer(ctx.user)),
+
+        Benchmark('CartController.add_to_cart', lambda: cart.add_to_cart(uid, ctx.product_id, 1),
+                  ctx.empty_cart),
+        Benchmark('CartController.get_cart_items', lambda: cart.get_cart_items(ctx.cart_user_id)),
+        Benchmark('CartController.update_quantity', lambda cart_id: cart.update_quantity(cart_id, 2),
+                  lambda: (ctx.filled_cart(),)),
+        Benchmark('CartController.update_cart_quantity',
+                  lambda cart_id: cart.update_cart_quantity(cart_id, 2), lambda: (ctx.filled_cart(),)),
+        Benchmark('CartController.remove_from_cart', cart.remove_from_cart, lambda: (ctx.filled_cart(),)),
+        Benchmark('CartController.clear_cart', lambda _: cart.clear_cart(uid), lambda: (ctx.filled_cart(),)),
+        Benchmark('CartController.get_cart_total', lambda: cart.get_cart_total(ctx.cart_user_id)),
+        Benchmark('CartController.get_cart_count', lambda: cart.get_cart_count(ctx.cart_user_id)),
+
+        Benchmark('CustomerController.get_customer_by_user_id',
+                  lambda: customers.get_customer_by_user_id(ctx.random_user_id())),
+        Benchmark('CustomerController.get_all_customers', customers.get_all_customers, full_scan=True),
+        Benchmark('CustomerController.get_customers_page', customers.get_customers_page),
+        Benchmark('CustomerController.update_customer_profile',
+                  lambda: customers.update_customer_profile(cid, "0700000000", "Plot 1", "Kampala")),
+        Benchmark('CustomerController.search_customers', lambda: customers.search_customers("nakato")),
+        Benchmark('CustomerController.search_customers_page',
+                  lambda: customers.search_customers_page("nakato")),
+
+        Benchmark('OrderController.create_order', lambda: orders.create_order(uid, cid, line, 'cash')),
+        Benchmark('OrderController.checkout_from_cart', lambda _: orders.checkout_from_cart(uid, 'cash'),
+                  lambda: (ctx.filled_cart(),)),
+        Benchmark('OrderController.get_order', lambda: orders.get_order(ctx.random_order_id())),
+        Benchmark('OrderController.get_all_orders', orders.get_all_orders, full_scan=True),
+        Benchmark('OrderController.get_orders_page', orders.get_orders_page),
+        Benchmark('OrderController.get_user_orders', lambda: orders.get_user_orders(ctx.random_user_id())),
+        Benchmark('OrderController.update_order_status',
+                  lambda order_id: orders.update_order_status(order_id, 'processing'),
+                  lambda: (ctx.pending_order_id(),)),
+        Benchmark('OrderController.get_pending_orders', orders.get_pending_orders, full_scan=True),
+        Benchmark('OrderController.get_completed_orders', orders.get_completed_orders, full_scan=True),
+
+        Benchmark('ProductController.create_product', lambda: products.create_product(
+            f"Bench Product {ctx.next_serial()}", "Benchmark product", "Benchmark", 1500.0, 900.0, 50)),
+        Benchmark('ProductController.update_product', lambda product: products.update_product(
+            product.product_id, product.name, product.description, product.category, product.price,
+            product.cost, product.stock_quantity), lambda: (ctx.db.get_product_by_id(ctx.product_id),)),
+        Benchmark('ProductController.validate_product',
+                  lambda: products.validate_product("Bench Product", "Benchmark", 1500.0, 50)),
+        Benchmark('ProductController.create_products_bulk', products.create_products_bulk,
+                  lambda: ([ctx.new_product().to_dict() for _ in range(100)],)),
+        Benchmark('ProductController.update_products_bulk', products.update_products_bulk,
+                  lambda: (ctx.product_rows(100),)),
+        Benchmark('ProductController.create_suppliers_bulk', products.create_suppliers_bulk,
+                  lambda: ([{'name': f"Bench Supplier {ctx.next_serial()}"} for _ in range(20)],)),
+        Benchmark('ProductController.delete_product', products.delete_product,
+                  lambda: (ctx.db.create_product(ctx.new_product()),)),
+        Benchmark('ProductController.get_product', lambda: products.get_product(ctx.random_product_id())),
+        Benchmark('ProductController.get_all_products', products.get_all_products),
+        Benchmark('ProductController.get_products_page', products.get_products_page),
+        Benchmark('ProductController.get_in_stock_products_page', products.get_in_stock_products_page),
+        Benchmark('ProductController.search_products', lambda: products.search_products("leather tote", 50)),
+        Benchmark('ProductController.search_products_with_snippets',
+                  lambda: products.search_products_with_snippets("leather tote", 50)),
+        Benchmark('ProductController.get_products_by_category',
+                  lambda: products.get_products_by_category(ctx.category)),
+        Benchmark('ProductController.get_low_stock_products', products.get_low_stock_products),
+        Benchmark('ProductController.update_stock', lambda: products.update_stock(ctx.product_id, 1)),
+        Benchmark('ProductController.get_categories', products.get_categories),
+    ]
+    return benchmarks
+
+def all_benchmarks(ctx: BenchContext) -> List[Benchmark]:
+    benchmarks = database_benchmarks(ctx)
+    for benchmark in benchmarks:
+        benchmark.name = f"DatabaseManager.{benchmark.name}"
+    return benchmarks + controller_benchmarks(ctx)
+
+def uncovered(benchmarks: List[Benchmark]) -> List[str]:
+    """Public operations that have no benchmark yet"""
+    names = {benchmark.name for benchmark in benchmarks}
+    missing = []
+    for cls in (DatabaseManager, AuthController, CartController, CustomerController,
+                OrderController, ProductController):
+        for attr in dir(cls):
+            if attr.startswith('_') or attr in NOT_BENCHMARKED or not callable(getattr(cls, attr)):
+                continue
+            if f"{cls.__name__}.{attr}" not in names:
+                missing.append(f"{cls.__name__}.{attr}")
+    return missing
+
+def run_scale(label: str, orders: int, args) -> Dict[str, Dict[str, Any]]:
+    """Benchmark every operation against a copy of the fixture for one scale"""
+    print(f"\nScale {label} ({orders:,} orders)")
+    fixture = fixture_path(args.fixture_dir, orders, args.seed)
+    work_dir = tempfile.mkdtemp(prefix="girlush_bench_")
+    results = {}
+    try:
+        db_path = os.path.join(work_dir, "bench.db")
+        shutil.copyfile(fixture, db_path)
+        db = DatabaseManager(db_path)
+        ctx = BenchContext(db, args.seed)
+        benchmarks = sorted(all_benchmarks(ctx),
+                            key=lambda b: not b.name.split('.')[-1].startswith(READ_PREFIXES))
+        only = re.compile(args.only) if args.only else None
+        for benchmark in benchmarks:
+            if only and not only.search(benchmark.name):
+                continue
+            if benchmark.full_scan and orders > args.full_scan_limit:
+                results[benchmark.name] = {'skipped': 'full scan'}
+                continue
+            samples = benchmark.measure(args.iterations, args.budget, args.min_samples)
+            results[benchmark.name] = {
+                'samples': len(samples),
+                'p50_ms': round(percentile(samples, 50), 4),
+                'p95_ms': round(percentile(samples, 95), 4),
+                'p99_ms': round(percentile(samples, 99), 4),
+            }
+            print(f"  {benchmark.name:<55}{results[benchmark.name]['p50_ms']:>10.3f}"
+                  f"{results[benchmark.name]['p95_ms']:>10.3f}{results[benchmark.name]['p99_ms']:>10.3f}")
+        db.close()
+        for name in uncovered(benchmarks):
+            print(f"  ! no benchmark for {name}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], metric: str, tolerance: float,
+            min_delta_ms: float) -> List[str]:
+    """Describe every operation that got slower than the baseline allows"""
+    regressions = []
+    for scale, operations in results['scales'].items():
+        for name, current in operations.items():
+            previous = baseline.get('scales', {}).get(scale, {}).get(name)
+            if not previous or metric not in previous or metric not in current:
+                continue
+            before, after = previous[metric], current[metric]
+            if after > before * (1 + tolerance) and after - before > min_delta_ms:
+                regressions.append(f"{scale} {name}: {metric} {before:.3f}ms -> {after:.3f}ms "
+                                   f"(+{(after / before - 1) * 100 if before else math.inf:.0f}%)")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every DatabaseManager and controller operation")
+    parser.add_argument('--scales', nargs='+', default=['1k', '100k'], choices=list(SCALES),
+                        help="fixture sizes by order count (10m takes a while to build the first time)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--fixture-dir', default=os.path.join(os.path.dirname(__file__), 'fixtures'))
+    parser.add_argument('--iterations', type=int, default=200, help="max samples per operation")
+    parser.add_argument('--min-samples', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=2.0, help="seconds per operation")
+    parser.add_argument('--full-scan-limit', type=int, default=1_000_000,
+                        help="skip whole-table operations above this many orders")
+    parser.add_argument('--only', help="regex selecting operations to run")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON results file")
+    parser.add_argument('--baseline', default=os.path.join(os.path.dirname(__file__), 'baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the baseline")
+    parser.add_argument('--metric', default='p95_ms', choices=['p50_ms', 'p95_ms', 'p99_ms'])
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument('--min-delta-ms', type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    results = {
+        'meta': {
+            'created': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'seed': args.seed,
+        },
+        'scales': {},
+    }
+    print(f"{'Operation':<57}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for label in args.scales:
+        results['scales'][label] = run_scale(label, SCALES[label], args)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✓ Results written to {args.output}")
+
+    if args.save_baseline:
+        shutil.copyfile(args.output, args.baseline)
+        print(f"✓ Baseline saved to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.metric, args.tolerance, args.min_delta_ms)
+    if regressions:
+        print(f"\n✗ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+    print(f"\n✓ No regressions beyond {args.tolerance:.0%} ({args.metric})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
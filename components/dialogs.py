@@ -2,7 +2,7 @@
 Dialog components for Girlush Collections
 """
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import config
 from assets.styles import *
 
@@ -91,12 +91,14 @@ class InputDialog(tk.Toplevel):
 
 class ProductDialog(tk.Toplevel):
     """Dialog for adding/editing products"""
-    def __init__(self, parent, title: str, product=None, suppliers=None):
+    def __init__(self, parent, title: str, product=None, suppliers=None, thumbnails=None):
         super().__init__(parent)
         self.title(title)
         self.result = None
         self.product = product
         self.suppliers = suppliers or []
+        self.thumbnails = thumbnails
+        self.photo = None
         
         # Configure window
         self.configure(bg=config.BG_COLOR)
@@ -181,6 +183,22 @@ class ProductDialog(tk.Toplevel):
         self.stock_entry = tk.Entry(frame, **ENTRY_STYLE)
         self.stock_entry.pack(fill=tk.X, pady=(0, 10))
         
+        # Image
+        tk.Label(frame, text="Image:", **LABEL_STYLE).pack(anchor='w')
+        image_frame = tk.Frame(frame, bg=config.BG_COLOR)
+        image_frame.pack(fill=tk.X, pady=(0, 5))
+        
+        self.image_entry = tk.Entry(image_frame, **ENTRY_STYLE)
+        self.image_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.image_entry.bind('<FocusOut>', lambda e: self.show_thumbnail())
+        
+        browse_btn = tk.Button(image_frame, text="Browse...", command=self.browse_image,
+                               **BUTTON_SECONDARY_STYLE)
+        browse_btn.pack(side=tk.LEFT, padx=(5, 0))
+        
+        self.image_label = tk.Label(frame, bg=config.BG_COLOR)
+        self.image_label.pack(anchor='w', pady=(0, 10))
+        
         # Buttons
         btn_frame = tk.Frame(frame, bg=config.BG_COLOR)
         btn_frame.pack(pady=15)
@@ -200,6 +218,33 @@ class ProductDialog(tk.Toplevel):
             self.price_entry.insert(0, str(self.product.price))
             self.cost_entry.insert(0, str(self.product.cost))
             self.stock_entry.insert(0, str(self.product.stock_quantity))
+            self.image_entry.insert(0, self.product.image_path or '')
+            self.show_thumbnail()
+    
+    def browse_image(self):
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Choose Product Image",
+            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.bmp *.webp"), ("All files", "*.*")]
+        )
+        if path:
+            self.image_entry.delete(0, tk.END)
+            self.image_entry.insert(0, path)
+            self.show_thumbnail()
+    
+    def show_thumbnail(self):
+        """Preview the image named in the image field"""
+        path = self.image_entry.get().strip()
+        self.photo = None
+        self.image_label.config(image='')
+        if self.thumbnails:
+            self.thumbnails.request(self, path, lambda photo: self.set_thumbnail(path, photo))
+    
+    def set_thumbnail(self, path, photo):
+        # Ignore a preview that arrives after the field was changed again
+        if path == self.image_entry.get().strip():
+            self.photo = photo
+            self.image_label.config(image=photo)
     
     def on_save(self):
         try:
@@ -209,7 +254,8 @@ class ProductDialog(tk.Toplevel):
                 'category': self.category_entry.get().strip(),
                 'price': float(self.price_entry.get()),
                 'cost': float(self.cost_entry.get()),
-                'stock_quantity': int(self.stock_entry.get())
+                'stock_quantity': int(self.stock_entry.get()),
+                'image_path': self.image_entry.get().strip()
             }
             self.destroy()
         except ValueError:
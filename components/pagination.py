@@ -0,0 +1,99 @@
+"""
+Pagination bar for Girlush Collections
+Drives the keyset-paginated *_page methods so a view only loads one page of rows
+"""
+import tkinter as tk
+from typing import Callable, Optional, Tuple
+import config
+from assets.styles import *
+from database.models import Page
+
+class PaginationBar(tk.Frame):
+    """
+    Prev / Next buttons for a keyset-paginated listing.
+
+    ``fetch_page(cursor, backwards)`` returns a Page and ``render(items)``
+    fills the view with that page's rows. With a ``worker`` the page is
+    fetched in the background and a newer request replaces an older one.
+    """
+    def __init__(self, parent, fetch_page: Callable[[Optional[Tuple], bool], Page],
+                 render: Callable[[list], None], worker=None):
+        super().__init__(parent, bg=config.BG_COLOR)
+        self.fetch_page = fetch_page
+        self.render = render
+        self.worker = worker
+        self._task = None
+
+        self.page: Optional[Page] = None
+        self.page_number = 1
+        # Cursor and direction that produced the current page, for reload()
+        self._cursor: Optional[Tuple] = None
+        self._backwards = False
+
+        self.prev_button = tk.Button(self, text="< Prev", command=self.prev_page,
+                                     **BUTTON_SECONDARY_STYLE)
+        self.prev_button.pack(side=tk.LEFT)
+
+        self.page_label = tk.Label(self, text="", **LABEL_STYLE)
+        self.page_label.pack(side=tk.LEFT, padx=15)
+
+        self.next_button = tk.Button(self, text="Next >", command=self.next_page,
+                                     **BUTTON_SECONDARY_STYLE)
+        self.next_button.pack(side=tk.LEFT)
+
+    def first_page(self):
+        self.page_number = 1
+        self._load(None, False)
+
+    def next_page(self):
+        if self.page and self.page.has_next:
+            self.page_number += 1
+            self._load(self.page.next_cursor, False)
+
+    def prev_page(self):
+        if self.page and self.page.has_prev:
+            self.page_number = max(1, self.page_number - 1)
+            self._load(self.page.prev_cursor, True)
+
+    def reload(self):
+        """Re-fetch the current page, e.g. after an edit or delete"""
+        self._load(self._cursor, self._backwards)
+
+    def cancel(self):
+        """Drop a page request still in flight"""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+            if self.page:
+                self._update_controls()
+
+    def _load(self, cursor: Optional[Tuple], backwards: bool):
+        self.cancel()
+        self._cursor = cursor
+        self._backwards = backwards
+        if self.worker is None:
+            self._show_page(self.fetch_page(cursor, backwards))
+            return
+
+        self.prev_button.config(state=tk.DISABLED)
+        self.next_button.config(state=tk.DISABLED)
+        self.page_label.config(text="Loading...")
+        self._task = self.worker.run(self, self.fetch_page, cursor, backwards,
+                                     on_done=self._show_page)
+
+    def _show_page(self, page: Page):
+        self._task = None
+        if not page.items and self.page_number > 1:
+            # The page emptied under us (e.g. its last row was deleted)
+            self.first_page()
+            return
+        self.page = page
+        if not page.has_prev:
+            self.page_number = 1
+        self.render(page.items)
+        self._update_controls()
+
+    def _update_controls(self):
+        self.prev_button.config(state=tk.NORMAL if self.page.has_prev else tk.DISABLED)
+        self.next_button.config(state=tk.NORMAL if self.page.has_next else tk.DISABLED)
+        self.page_label.config(text=f"Page {self.page_number}")
@@ -0,0 +1,123 @@
+"""
+Keyed Treeview binder for Girlush Collections
+Refreshes a Treeview by applying only the rows that changed since the last refresh
+"""
+from tkinter import ttk
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+def _longest_increasing_run(positions: List[int]) -> set:
+    """Indexes into ``positions`` of one longest strictly increasing subsequence"""
+    tails: List[int] = []  # tails[k]: index ending the best run of length k + 1
+    previous = [-1] * len(positions)
+    for index, position in enumerate(positions):
+        low, high = 0, len(tails)
+        while low < high:
+            middle = (low + high) // 2
+            if positions[tails[middle]] < position:
+                low = middle + 1
+            else:
+                high = middle
+        if low > 0:
+            previous[index] = tails[low - 1]
+        if low == len(tails):
+            tails.append(index)
+        else:
+            tails[low] = index
+    run = set()
+    index = tails[-1] if tails else -1
+    while index != -1:
+        run.add(index)
+        index = previous[index]
+    return run
+
+class TreeBinder:
+    """
+    Keeps a flat Treeview showing a list of rows, keyed by primary key.
+
+    ``key(row)`` names the row (it becomes the item id) and
+    ``values(row)`` / ``tags(row)`` give what is displayed. update() diffs
+    the new rows against the ones on screen and only inserts, deletes,
+    moves and rewrites the items that changed, so a refresh costs Tk calls
+    in proportion to the changes rather than the length of the list.
+    Rows that keep their relative order are never moved. The selection
+    survives for rows that are still listed and the row at the top of the
+    view stays at the top.
+
+    The binder assumes it is the only thing adding or removing items.
+    """
+    def __init__(self, tree: ttk.Treeview, key: Callable[[Any], Any],
+                 values: Callable[[Any], tuple], tags: Optional[Callable[[Any], tuple]] = None):
+        self.tree = tree
+        self.key = key
+        self.values = values
+        self.tags = tags
+        self._order: List[str] = []  # item ids top to bottom
+        self._shown: Dict[str, Tuple[tuple, tuple]] = {}  # item id -> (values, tags)
+
+    def update(self, rows: Iterable[Any]) -> Dict[str, int]:
+        """
+        Show ``rows`` in order
+        Returns: how many items were inserted, updated, moved and deleted
+        """
+        tree = self.tree
+        new_order: List[str] = []
+        new_shown: Dict[str, Tuple[tuple, tuple]] = {}
+        for row in rows:
+            iid = str(self.key(row))
+            if iid in new_shown:
+                continue  # First occurrence wins; item ids must be unique
+            new_order.append(iid)
+            new_shown[iid] = (tuple(self.values(row)), tuple(self.tags(row)) if self.tags else ())
+
+        counts = {'inserted': 0, 'updated': 0, 'moved': 0, 'deleted': 0}
+        if new_order == self._order and new_shown == self._shown:
+            return counts
+
+        selection = tree.selection()
+        top = tree.yview()[0]
+        anchor = self._order[int(top * len(self._order))] if 0 < top < 1 else None
+
+        deleted = [iid for iid in self._order if iid not in new_shown]
+        if deleted:
+            tree.delete(*deleted)
+            counts['deleted'] = len(deleted)
+
+        # Rows kept in their relative order stay put; the rest are detached and
+        # re-attached at their new index, so the kept ones are always in place
+        old_position = {iid: position for position, iid in enumerate(self._order)}
+        kept = [iid for iid in new_order if iid in old_position]
+        in_place = _longest_increasing_run([old_position[iid] for iid in kept])
+        stay = {kept[index] for index in in_place}
+        moving = [iid for iid in kept if iid not in stay]
+        if moving:
+            tree.detach(*moving)
+
+        for index, iid in enumerate(new_order):
+            values, tags = new_shown[iid]
+            if iid not in old_position:
+                tree.insert('', index, iid=iid, values=values, tags=tags)
+                counts['inserted'] += 1
+                continue
+            if iid not in stay:
+                tree.move(iid, '', index)
+                counts['moved'] += 1
+            if self._shown[iid] != (values, tags):
+                tree.item(iid, values=values, tags=tags)
+                counts['updated'] += 1
+
+        self._order = new_order
+        self._shown = new_shown
+
+        kept_selection = tuple(iid for iid in selection if iid in new_shown)
+        if kept_selection != tuple(tree.selection()):
+            tree.selection_set(kept_selection)
+        # Keep the row that was at the top of the view there
+        if anchor in new_shown:
+            tree.yview_moveto(new_order.index(anchor) / len(new_order))
+        elif top:
+            tree.yview_moveto(top)
+        return counts
+
+    def clear(self):
+        """Remove every row"""
+        self.update(())
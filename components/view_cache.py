@@ -0,0 +1,126 @@
+"""
+View cache for Girlush Collections dashboards
+Keeps built views alive between menu clicks and only reloads their data when
+the tables behind them were written
+"""
+import tkinter as tk
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import config
+
+# Views bind the mouse wheel application-wide for their own canvas
+MOUSEWHEEL = '<MouseWheel>'
+
+class CachedView:
+    """A built view with the tables it shows and the change stamp it was loaded at"""
+    def __init__(self, widget: tk.Widget, tables: Tuple[str, ...],
+                 refresh: Optional[Callable[[tk.Widget], None]], stamp: Tuple, wheel: str):
+        self.widget = widget
+        self.tables = tables
+        self.refresh = refresh
+        self.stamp = stamp
+        self.wheel = wheel  # the view's mouse wheel binding
+
+class ViewCache:
+    """
+    Up to ``max_views`` views of one dashboard's content area, most recently
+    shown last.
+
+    show() packs a cached view again, or builds it the first time. A cached
+    view is refreshed only if the ChangeDetector's version of its tables
+    moved since it was last loaded. The stamp is taken before the load
+    starts, so a write that lands mid-load costs one extra refresh rather
+    than a stale view. The view's own edits also move the stamp and cost
+    one refresh on the next visit. Shown beyond ``max_views``, the least
+    recently shown view is destroyed.
+
+    While a view is hidden the mouse wheel goes back to whatever it
+    scrolled before the view was shown.
+    """
+    def __init__(self, container: tk.Widget, changes, worker, max_views: int = config.VIEW_CACHE_SIZE):
+        self.container = container
+        self.changes = changes
+        self.worker = worker
+        self.max_views = max(1, max_views)
+        self.current: Optional[str] = None
+        self._views: "OrderedDict[str, CachedView]" = OrderedDict()
+        self._wheel = ''  # binding to restore when the current view is hidden
+
+        # Statistics
+        self._builds = 0
+        self._reuses = 0
+        self._refreshes = 0
+        self._evictions = 0
+
+    def show(self, name: str, build: Callable[[], tk.Widget], tables: Iterable[str] = (),
+             refresh: Optional[Callable[[tk.Widget], None]] = None) -> tk.Widget:
+        """
+        Show the view called ``name``, building it with ``build()`` if it is not cached
+        ``refresh(view)`` reloads a cached view whose ``tables`` changed
+        """
+        self.hide()
+        self._wheel = self.container.bind_all(MOUSEWHEEL)
+        entry = self._views.get(name)
+        if entry is None:
+            tables = tuple(tables)
+            stamp = self.changes.version(tables)
+            widget = build()
+            widget.pack(fill=tk.BOTH, expand=True)
+            entry = CachedView(widget, tables, refresh, stamp, self.container.bind_all(MOUSEWHEEL))
+            self._views[name] = entry
+            self._builds += 1
+        else:
+            entry.widget.pack(fill=tk.BOTH, expand=True)
+            self.container.bind_all(MOUSEWHEEL, entry.wheel)
+            self._reuses += 1
+            stamp = self.changes.version(entry.tables)
+            if stamp != entry.stamp:
+                entry.stamp = stamp
+                if entry.refresh:
+                    entry.refresh(entry.widget)
+                    self._refreshes += 1
+        self._views.move_to_end(name)
+        self.current = name
+        self._evict()
+        return entry.widget
+
+    def hide(self):
+        """Hide the current view, keeping it for later"""
+        if self.current is None:
+            return
+        entry = self._views.get(self.current)
+        self.current = None
+        if entry is not None:
+            entry.widget.pack_forget()
+            self.container.bind_all(MOUSEWHEEL, self._wheel)
+
+    def holds(self, widget: tk.Widget) -> bool:
+        """Check whether ``widget`` is one of the cached views"""
+        return any(entry.widget is widget for entry in self._views.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get view cache statistics"""
+        return {
+            'cached': list(self._views),
+            'max_views': self.max_views,
+            'builds': self._builds,
+            'reuses': self._reuses,
+            'refreshes': self._refreshes,
+            'evictions': self._evictions
+        }
+
+    def _evict(self):
+        while len(self._views) > self.max_views:
+            name, entry = next(iter(self._views.items()))
+            if name == self.current:
+                break
+            del self._views[name]
+            self._destroy(entry)
+            self._evictions += 1
+            # Views unbind the mouse wheel when destroyed; give it back to the current one
+            if self.current is not None:
+                self.container.bind_all(MOUSEWHEEL, self._views[self.current].wheel)
+
+    def _destroy(self, entry: CachedView):
+        self.worker.cancel_within(entry.widget)
+        entry.widget.destroy()
@@ -0,0 +1,141 @@
+"""
+Virtualised card grid for Girlush Collections
+Scrolls through thousands of items while only building the cards that fit on screen
+"""
+import math
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, List, Optional
+import config
+
+class VirtualGrid(tk.Frame):
+    """
+    Scrollable grid of fixed-size cards that only builds enough cards to fill
+    the viewport plus ``buffer_rows`` above and below it.
+
+    ``create_card(parent)`` builds an empty card and ``bind_card(card, item)``
+    shows an item on it. Cards are recycled as the user scrolls: a card whose
+    row leaves the viewport is rebound to the row coming into view, so a
+    scroll costs one bind per new row rather than a widget per item.
+    ``load_more()`` is called when the viewport nears the last item; the
+    caller fetches the next page and passes it to extend().
+    """
+    def __init__(self, parent, create_card: Callable[[tk.Misc], tk.Widget],
+                 bind_card: Callable[[tk.Widget, Any], None], row_height: int, columns: int = 3,
+                 buffer_rows: int = 1, load_more: Optional[Callable[[], None]] = None,
+                 padding: int = 10):
+        super().__init__(parent, bg=config.BG_COLOR)
+        self.create_card = create_card
+        self.bind_card = bind_card
+        self.row_height = row_height
+        self.columns = columns
+        self.buffer_rows = buffer_rows
+        self.load_more = load_more
+        self.padding = padding
+
+        self.items: List[Any] = []
+        self._cards: List[tk.Widget] = []
+        self._windows: List[int] = []  # canvas window id of each card
+        self._bound: List[Optional[int]] = []  # index of the item each card shows
+        self._placed: List[Optional[tuple]] = []  # (x, y) each card's window was moved to
+        self._card_width = 0
+
+        self.canvas = tk.Canvas(self, bg=config.BG_COLOR, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._scroll)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.bind('<Configure>', lambda e: self._layout())
+
+        # Enable mousewheel scrolling
+        def on_mousewheel(event):
+            self._scroll('scroll', int(-1 * (event.delta / 120)), 'units')
+        self.canvas.bind_all("<MouseWheel>", on_mousewheel)
+
+        # Cleanup
+        def on_destroy(event):
+            if event.widget is self:
+                self.canvas.unbind_all("<MouseWheel>")
+        self.bind('<Destroy>', on_destroy)
+
+        self.canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+    def set_items(self, items: List[Any]):
+        """Show ``items`` from the top"""
+        self.items = list(items)
+        self._bound = [None] * len(self._cards)
+        self.canvas.yview_moveto(0)
+        self._layout()
+
+    def extend(self, items: List[Any]):
+        """Append the next page of items"""
+        self.items.extend(items)
+        self._layout()
+
+    def refresh(self):
+        """Rebind every card, e.g. after the items were edited in place"""
+        self._bound = [None] * len(self._cards)
+        self._layout()
+
+    def _scroll(self, *args):
+        self.canvas.yview(*args)
+        self._layout()
+
+    def _layout(self):
+        """Place and bind the cards for the rows around the viewport"""
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1:
+            return  # Not mapped yet; <Configure> lays it out
+
+        rows = math.ceil(len(self.items) / self.columns)
+        self.canvas.configure(scrollregion=(0, 0, width, max(rows * self.row_height, height)))
+
+        pool_rows = math.ceil(height / self.row_height) + 1 + 2 * self.buffer_rows
+        self._grow(pool_rows * self.columns)
+        column_width = width / self.columns
+        card_width = max(1, int(column_width) - 2 * self.padding)
+        if card_width != self._card_width:
+            self._card_width = card_width
+            for window in self._windows:
+                self.canvas.itemconfigure(window, width=card_width)
+
+        top = self.canvas.canvasy(0)
+        first_row = max(0, int(top // self.row_height) - self.buffer_rows)
+        shown = set()
+        for row in range(first_row, first_row + pool_rows):
+            # A row always lands on the same cards, so rows still in view keep theirs
+            slot_row = row % pool_rows
+            for column in range(self.columns):
+                slot = slot_row * self.columns + column
+                index = row * self.columns + column
+                if index >= len(self.items):
+                    continue
+                shown.add(slot)
+                if self._bound[slot] != index:
+                    self.bind_card(self._cards[slot], self.items[index])
+                    self._bound[slot] = index
+                position = (column * column_width + self.padding, row * self.row_height + self.padding)
+                if self._placed[slot] != position:
+                    self.canvas.coords(self._windows[slot], *position)
+                    self.canvas.itemconfigure(self._windows[slot], state='normal')
+                    self._placed[slot] = position
+
+        for slot, window in enumerate(self._windows):
+            if slot not in shown and self._placed[slot] is not None:
+                self.canvas.itemconfigure(window, state='hidden')
+                self._placed[slot] = None
+
+        if self.load_more and (first_row + pool_rows) * self.columns >= len(self.items):
+            self.load_more()
+
+    def _grow(self, count: int):
+        """Build cards until there are ``count``"""
+        while len(self._cards) < count:
+            card = self.create_card(self.canvas)
+            window = self.canvas.create_window(0, 0, window=card, anchor='nw', state='hidden',
+                                               width=max(1, self._card_width),
+                                               height=self.row_height - 2 * self.padding)
+            self._cards.append(card)
+            self._windows.append(window)
+            self._bound.append(None)
+            self._placed.append(None)
@@ -11,6 +11,54 @@ WINDOW_TITLE = f"{APP_NAME} - Inventory Management"
 # Database Settings
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATABASE_PATH = os.path.join(BASE_DIR, "girlush_inventory.db")
+DB_POOL_SIZE = 5  # Max pooled connections (one per thread at a time)
+DB_POOL_TIMEOUT = 30.0  # Seconds to wait for a free connection
+DB_WORKER_THREADS = 2  # Background threads running database calls for the UI
+DB_WORKER_POLL_MS = 30  # How often the UI checks for finished background calls
+CHANGE_POLL_MS = 1000  # How often open views check for writes by other terminals
+SEARCH_DEBOUNCE_MS = 250  # Pause in typing before a search box queries the database
+SEARCH_CACHE_SIZE = 32  # Product search results kept per session for narrowing longer queries
+VIEW_CACHE_SIZE = 4  # Built views each dashboard keeps for switching back without rebuilding
+
+# Storage tuning profiles applied to every new connection
+# journal_mode None leaves the database's current journal mode untouched
+DATABASE_PROFILES = {
+    # Rollback journal and an fsync on every commit - safest, slowest
+    'durable': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'mmap_size': 0,
+        'cache_size': -2000,  # KiB when negative
+        'temp_store': 'DEFAULT',
+        'busy_timeout': 5000,  # ms
+        'query_only': False
+    },
+    # WAL lets readers run alongside a writer; commits skip the fsync
+    'balanced-wal': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -16000,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+        'query_only': False
+    },
+    # Browse-only terminals sharing the shop database
+    'kiosk-readonly': {
+        'journal_mode': None,
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -32000,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 10000,
+        'query_only': True
+    }
+}
+DATABASE_PROFILE = 'balanced-wal'
+BULK_CHUNK_SIZE = 500  # Rows per transaction in bulk writes
+INVENTORY_CHECKPOINT_INTERVAL = 50  # Ledger rows per product between stock checkpoints
+PRODUCT_CACHE_MAX_PRODUCTS = None  # In-memory catalogue cap (LRU beyond it); None holds every product
+PRODUCT_CACHE_CHECK_INTERVAL = 0.5  # Seconds between data_version checks for other processes' writes
 
 # UI Settings
 WINDOW_WIDTH = 1200
@@ -53,3 +101,16 @@ DEFAULT_ADMIN_NAME = "Admin"
 # Logging
 LOG_DIR = os.path.join(BASE_DIR, "logs")
 LOG_FILE = os.path.join(LOG_DIR, "app.log")
+
+# SQL tracing (opt-in): every statement is logged to LOG_FILE with its calling
+# DatabaseManager method, row count and duration; statements slower than
+# SLOW_QUERY_MS also go to SLOW_QUERY_LOG with their query plan
+SQL_TRACE_ENABLED = False
+SLOW_QUERY_MS = 100
+SLOW_QUERY_LOG = os.path.join(LOG_DIR, "slow_queries.log")
+
+# Product image thumbnails (need Pillow; without it products show no image)
+THUMBNAIL_SIZE = (120, 120)  # px, every thumbnail is padded to exactly this size
+THUMBNAIL_CACHE_DIR = os.path.join(BASE_DIR, "cache", "thumbnails")
+THUMBNAIL_MEMORY_ITEMS = 200  # Decoded thumbnails kept in memory (LRU)
+THUMBNAIL_THREADS = 2  # Background threads generating thumbnails
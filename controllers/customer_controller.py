@@ -4,7 +4,7 @@ Handles customer management operations
 """
 from typing import List, Optional, Tuple, Dict, Any
 from database.database_manager import DatabaseManager
-from database.models import Customer
+from database.models import Customer, Page
 
 class CustomerController:
     def __init__(self, db_manager: DatabaseManager):
@@ -18,6 +18,10 @@ class CustomerController:
         """Get all customers with user information"""
         return self.db.get_all_customers()
 
+    def get_customers_page(self, cursor: Optional[Tuple] = None, backwards: bool = False) -> Page:
+        """Get one page of customers with user information, newest first"""
+        return self.db.get_customers_page(cursor, backwards)
+
     def update_customer_profile(self, customer_id: int, phone: str, 
                                 address: str, city: str) -> Tuple[bool, str]:
         """Update customer profile"""
@@ -33,16 +37,11 @@ class CustomerController:
         else:
             return False, "Failed to update profile"
 
-    def search_customers(self, query: str) -> List[Dict[str, Any]]:
-        """Search customers by name, email, or phone"""
-        all_customers = self.db.get_all_customers()
-        query_lower = query.lower()
-        
-        results = []
-        for customer in all_customers:
-            if (query_lower in customer.get('name', '').lower() or
-                query_lower in customer.get('email', '').lower() or
-                query_lower in customer.get('phone', '').lower()):
-                results.append(customer)
-        
-        return results
+    def search_customers(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Search customers by name, email, or phone, best matches first"""
+        return self.db.search_customers(query, limit)
+
+    def search_customers_page(self, query: str, cursor: Optional[Tuple] = None,
+                              backwards: bool = False) -> Page:
+        """Get one page of customer search results"""
+        return self.db.search_customers_page(query, cursor, backwards)
@@ -4,8 +4,8 @@ Handles order management operations
 """
 from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime
-from database.database_manager import DatabaseManager
-from database.models import Order, OrderItem
+from database.database_manager import DatabaseManager, CheckoutError, OrderStatusError
+from database.models import Order, OrderItem, Page
 
 class OrderController:
     def __init__(self, db_manager: DatabaseManager):
@@ -30,9 +30,6 @@ class OrderController:
             if not product:
                 return False, f"Product not found: {item['product_id']}", None
 
-            if product.stock_quantity < item['quantity']:
-                return False, f"Insufficient stock for {product.name}", None
-
             subtotal = product.price * item['quantity']
             total_amount += subtotal
 
@@ -53,7 +50,12 @@ class OrderController:
             shipping_address=shipping_address
         )
 
-        order_id = self.db.create_order(order, order_items)
+        # Stock is checked and reserved atomically inside the order transaction
+        try:
+            order_id = self.db.create_order(order, order_items)
+        except CheckoutError as e:
+            return False, str(e), None
+
         if order_id:
             # Clear cart
             self.db.clear_cart(user_id)
@@ -61,6 +63,21 @@ class OrderController:
         else:
             return False, "Failed to create order", None
 
+    def checkout_from_cart(self, user_id: int, payment_method: str,
+                           shipping_address: Optional[str] = None) -> Tuple[bool, str, Optional[int]]:
+        """
+        Place an order for everything in the user's cart in one transaction
+        Returns: (success, message, order_id)
+        """
+        try:
+            order_id = self.db.checkout_from_cart(user_id, payment_method, shipping_address)
+        except CheckoutError as e:
+            return False, str(e), None
+        except Exception as e:
+            print(f"Error during checkout: {e}")
+            return False, "Failed to create order", None
+        return True, "Order created successfully", order_id
+
     def get_order(self, order_id: int) -> Optional[Dict[str, Any]]:
         """Get order details"""
         return self.db.get_order_by_id(order_id)
@@ -69,6 +86,10 @@ class OrderController:
         """Get all orders"""
         return self.db.get_all_orders()
 
+    def get_orders_page(self, cursor: Optional[Tuple] = None, backwards: bool = False) -> Page:
+        """Get one page of orders, newest first"""
+        return self.db.get_orders_page(cursor, backwards)
+
     def get_user_orders(self, user_id: int) -> List[Dict[str, Any]]:
         """Get orders for a specific user"""
         return self.db.get_orders_by_user(user_id)
@@ -79,7 +100,13 @@ class OrderController:
         if status not in valid_statuses:
             return False, "Invalid status"
 
-        if self.db.update_order_status(order_id, status):
+        # The order's current status is checked inside the update's transaction
+        try:
+            updated = self.db.update_order_status(order_id, status)
+        except OrderStatusError as e:
+            return False, str(e)
+
+        if updated:
             return True, f"Order status updated to {status}"
         else:
             return False, "Failed to update order status"
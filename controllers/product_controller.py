@@ -2,28 +2,50 @@
 Product Controller for Girlush Collections
 Handles product management operations
 """
-from typing import List, Optional, Tuple
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Dict, Any
+import config
 from database.database_manager import DatabaseManager
-from database.models import Product
+from database.models import Product, Supplier, Page
+
+def _search_text(product: Product) -> str:
+    """
+    Words of a product's indexed columns folded as the search index's unicode61
+    tokenizer folds them (lower case, accents removed, nothing else), each
+    preceded by a space so " word" finds prefixes
+    """
+    text = f"{product.name or ''} {product.description or ''} {product.category or ''}"
+    # Canonical decomposition only: the tokenizer doesn't apply compatibility
+    # mappings, and casefold() would turn "ß" into "ss" where the index keeps "ß"
+    text = unicodedata.normalize('NFD', text)
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' ' + ' '.join(re.findall(r'[^\W_]+', text.lower()))
 
 class ProductController:
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
 
+        # Search results of this session: query -> (ranked products, complete)
+        self._search_cache: "OrderedDict[str, Tuple[List[Product], bool]]" = OrderedDict()
+        self._search_version = None
+        self._search_texts: Dict[int, str] = {}  # product_id -> _search_text()
+        self._search_lock = threading.Lock()
+        self._search_hits = 0
+        self._search_narrowed = 0
+        self._search_misses = 0
+
     def create_product(self, name: str, description: str, category: str, 
                       price: float, cost: float, stock_quantity: int,
                       supplier_id: Optional[int] = None, 
                       image_path: str = "") -> Tuple[bool, str]:
         """Create a new product"""
         # Validate input
-        if not name or not category:
-            return False, "Name and category are required"
-
-        if price <= 0:
-            return False, "Price must be greater than 0"
-
-        if stock_quantity < 0:
-            return False, "Stock quantity cannot be negative"
+        error = self.validate_product(name, category, price, stock_quantity)
+        if error:
+            return False, error
 
         product = Product(
             name=name,
@@ -48,14 +70,9 @@ class ProductController:
                       image_path: str = "") -> Tuple[bool, str]:
         """Update product information"""
         # Validate input
-        if not name or not category:
-            return False, "Name and category are required"
-
-        if price <= 0:
-            return False, "Price must be greater than 0"
-
-        if stock_quantity < 0:
-            return False, "Stock quantity cannot be negative"
+        error = self.validate_product(name, category, price, stock_quantity)
+        if error:
+            return False, error
 
         product = Product(
             product_id=product_id,
@@ -74,6 +91,110 @@ class ProductController:
         else:
             return False, "Failed to update product"
 
+    def validate_product(self, name: str, category: str, price: float,
+                         stock_quantity: int) -> Optional[str]:
+        """Return an error message for invalid product fields, or None"""
+        if not name or not category:
+            return "Name and category are required"
+
+        if price <= 0:
+            return "Price must be greater than 0"
+
+        if stock_quantity < 0:
+            return "Stock quantity cannot be negative"
+
+        return None
+
+    def create_products_bulk(self, rows: List[Dict[str, Any]]) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Create many products at once
+        Each row is a dict of create_product arguments.
+        Returns: one (product_id, error) pair per row, in order
+        """
+        results: List[Tuple[Optional[int], Optional[str]]] = [(None, None)] * len(rows)
+        valid_indexes = []
+        products = []
+        for i, row in enumerate(rows):
+            error = self.validate_product(row.get('name'), row.get('category'),
+                                          row.get('price', 0), row.get('stock_quantity', 0))
+            if error:
+                results[i] = (None, error)
+                continue
+            valid_indexes.append(i)
+            products.append(Product(
+                name=row['name'],
+                description=row.get('description', ''),
+                category=row['category'],
+                price=row['price'],
+                cost=row.get('cost', 0.0),
+                stock_quantity=row.get('stock_quantity', 0),
+                supplier_id=row.get('supplier_id'),
+                image_path=row.get('image_path', '')
+            ))
+
+        for i, result in zip(valid_indexes, self.db.create_products_bulk(products)):
+            results[i] = result
+        return results
+
+    def update_products_bulk(self, rows: List[Dict[str, Any]]) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Update many products at once
+        Each row is a dict of update_product arguments including product_id.
+        Returns: one (product_id, error) pair per row, in order
+        """
+        results: List[Tuple[Optional[int], Optional[str]]] = [(None, None)] * len(rows)
+        valid_indexes = []
+        products = []
+        for i, row in enumerate(rows):
+            error = self.validate_product(row.get('name'), row.get('category'),
+                                          row.get('price', 0), row.get('stock_quantity', 0))
+            if not error and not row.get('product_id'):
+                error = "Product ID is required"
+            if error:
+                results[i] = (None, error)
+                continue
+            valid_indexes.append(i)
+            products.append(Product(
+                product_id=row['product_id'],
+                name=row['name'],
+                description=row.get('description', ''),
+                category=row['category'],
+                price=row['price'],
+                cost=row.get('cost', 0.0),
+                stock_quantity=row.get('stock_quantity', 0),
+                supplier_id=row.get('supplier_id'),
+                image_path=row.get('image_path', '')
+            ))
+
+        for i, result in zip(valid_indexes, self.db.update_products_bulk(products)):
+            results[i] = result
+        return results
+
+    def create_suppliers_bulk(self, rows: List[Dict[str, Any]]) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Create many suppliers at once
+        Returns: one (supplier_id, error) pair per row, in order
+        """
+        results: List[Tuple[Optional[int], Optional[str]]] = [(None, None)] * len(rows)
+        valid_indexes = []
+        suppliers = []
+        for i, row in enumerate(rows):
+            if not row.get('name'):
+                results[i] = (None, "Supplier name is required")
+                continue
+            valid_indexes.append(i)
+            suppliers.append(Supplier(
+                name=row['name'],
+                contact_person=row.get('contact_person', ''),
+                email=row.get('email', ''),
+                phone=row.get('phone', ''),
+                address=row.get('address', '')
+            ))
+
+        for i, result in zip(valid_indexes, self.db.create_suppliers_bulk(suppliers)):
+            results[i] = result
+        return results
+
     def delete_product(self, product_id: int) -> Tuple[bool, str]:
         """Delete a product"""
         if self.db.delete_product(product_id):
@@ -89,9 +210,139 @@ class ProductController:
         """Get all products"""
         return self.db.get_all_products()
 
-    def search_products(self, query: str) -> List[Product]:
-        """Search products"""
-        return self.db.search_products(query)
+    def get_products_page(self, cursor: Optional[Tuple] = None, backwards: bool = False) -> Page:
+        """Get one page of products, newest first"""
+        return self.db.get_products_page(cursor, backwards)
+
+    def get_in_stock_products_page(self, cursor: Optional[Tuple] = None, backwards: bool = False,
+                                   limit: int = config.ITEMS_PER_PAGE) -> Page:
+        """Get one page of in-stock products, newest first"""
+        return self.db.get_in_stock_products_page(cursor, backwards, limit)
+
+    def search_products(self, query: str, limit: Optional[int] = None) -> List[Product]:
+        """
+        Search products, best matches first
+        A query that extends a cached one (e.g. "tote" after "tot") is answered
+        by filtering the cached results; the database only ranks the matches,
+        by id, so the order is the one a fresh search gives. New queries, and
+        any query after products were written, go to the database.
+        """
+        with self._search_lock:
+            version = self.db.changes.version(('products',))
+            if version != self._search_version:
+                self._search_cache.clear()
+                self._search_texts.clear()
+                self._search_version = version
+
+            entry = self._search_cache.get(query)
+            if entry is not None:
+                results, complete = entry
+                if complete or (limit is not None and len(results) >= limit):
+                    self._search_cache.move_to_end(query)
+                    self._search_hits += 1
+                    return results[:limit]
+
+            narrowed = self._narrow_search(query)
+
+        if narrowed is not None:
+            results = self._rank_narrowed(query, narrowed)
+            if results is not None:
+                with self._search_lock:
+                    self._search_narrowed += 1
+                    if self.db.changes.version(('products',)) == version == self._search_version:
+                        self._cache_search(query, results, True)
+                return results[:limit]
+
+        self._search_misses += 1
+        results = self.db.search_products(query, limit)
+        with self._search_lock:
+            # Don't cache results that products written meanwhile may have outdated
+            if self.db.changes.version(('products',)) == version == self._search_version:
+                self._cache_search(query, results, limit is None or len(results) < limit)
+        return list(results)
+
+    def get_search_cache_stats(self) -> Dict[str, Any]:
+        """Get search cache statistics"""
+        with self._search_lock:
+            lookups = self._search_hits + self._search_narrowed + self._search_misses
+            return {
+                'size': len(self._search_cache),
+                'hits': self._search_hits,
+                'narrowed': self._search_narrowed,
+                'misses': self._search_misses,
+                'hit_rate': (self._search_hits + self._search_narrowed) / lookups if lookups else 0.0
+            }
+
+    def _narrow_search(self, query: str) -> Optional[List[Product]]:
+        """Filter the smallest complete cached result that ``query`` narrows, or None"""
+        if self.db.fts_enabled:
+            words = re.findall(r'\w+', query)
+            # Words are matched as prefixes; only plain ASCII words are checked here
+            if not words or not all(word.isascii() and word.isalnum() for word in words):
+                return None
+            words = [word.lower() for word in words]
+        elif not query.isascii():
+            return None  # LIKE only ignores case for ASCII
+
+        best = None
+        for cached_query, (results, complete) in self._search_cache.items():
+            if not complete or (best is not None and len(results) >= len(best)):
+                continue
+            if self.db.fts_enabled:
+                cached_words = [word.lower() for word in re.findall(r'\w+', cached_query)]
+                if not cached_words:
+                    continue  # Searched with LIKE instead; its results are no superset
+                # Every cached word must be a prefix of a new word
+                narrows = all(any(word.startswith(cached) for word in words) for cached in cached_words)
+            else:
+                narrows = cached_query.lower() in query.lower()
+            if narrows:
+                best = results
+        if best is None:
+            return None
+
+        if self.db.fts_enabled:
+            prefixes = [' ' + word for word in words]
+            texts = self._search_texts
+
+            def matches(product):
+                text = texts.get(product.product_id)
+                if text is None:
+                    text = texts[product.product_id] = _search_text(product)
+                return all(prefix in text for prefix in prefixes)
+        else:
+            needle = query.lower()
+
+            def matches(product):
+                return any(needle in (text or '').lower()
+                           for text in (product.name, product.description, product.category))
+        return [product for product in best if matches(product)]
+
+    def _rank_narrowed(self, query: str, products: List[Product]) -> Optional[List[Product]]:
+        """
+        Put narrowed results in the order the database ranks ``query`` in
+        A cached query's ranking is not the new query's; LIKE results are
+        in name order, which any subset keeps.
+        Returns: None if the database could not rank them
+        """
+        if not self.db.fts_enabled or len(products) < 2:
+            return products
+        ranked = self.db.rank_product_search(query)
+        if ranked is None:
+            return None
+        position = {product_id: index for index, product_id in enumerate(ranked)}
+        return sorted(products, key=lambda product: position.get(product.product_id, len(position)))
+
+    def _cache_search(self, query: str, results: List[Product], complete: bool):
+        self._search_cache[query] = (list(results), complete)
+        self._search_cache.move_to_end(query)
+        while len(self._search_cache) > config.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+
+    def search_products_with_snippets(self, query: str,
+                                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Search products, returning each match with a highlighted snippet"""
+        return self.db.search_products_with_snippets(query, limit)
 
     def get_products_by_category(self, category: str) -> List[Product]:
         """Get products by category"""
@@ -99,8 +350,7 @@ class ProductController:
 
     def get_low_stock_products(self, threshold: int = 10) -> List[Product]:
         """Get products with low stock"""
-        all_products = self.db.get_all_products()
-        return [p for p in all_products if p.stock_quantity < threshold]
+        return self.db.get_low_stock_products(threshold)
 
     def update_stock(self, product_id: int, quantity_change: int) -> Tuple[bool, str]:
         """Update product stock"""
@@ -119,6 +369,4 @@ class ProductController:
 
     def get_categories(self) -> List[str]:
         """Get all unique product categories"""
-        products = self.db.get_all_products()
-        categories = set(p.category for p in products if p.category)
-        return sorted(list(categories))
+        return self.db.get_categories()
@@ -0,0 +1,238 @@
+"""
+In-memory product catalogue for Girlush Collections
+Read-through cache of products indexed by id, category and stock level
+"""
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from database.change_detector import ChangeDetector
+from database.models import Product, model_columns
+
+PRODUCT_COLUMNS = model_columns(Product)
+
+def _copy(product: Product) -> Product:
+    """Hand out copies so callers can't edit the cached object"""
+    return Product(*(getattr(product, column) for column in Product.__slots__))
+
+class ProductCatalogue:
+    """
+    Products held in memory, indexed by id, category and stock level.
+
+    Lookups by id read through to the database. Category, low-stock and
+    category-list queries are answered from the indexes once the whole
+    catalogue is loaded, which only happens while it fits in
+    ``max_products``; above the cap the catalogue is an LRU cache of recently
+    used products and those queries return None so the caller asks SQL.
+
+    DatabaseManager reports its own writes through invalidate(). Product
+    writes it did not make - another DatabaseManager or another process -
+    move the ChangeDetector's external version of ``products``, and the next
+    check empties the catalogue; writes to other tables leave it alone.
+    peek() serves hits without checking for ``check_interval`` seconds after
+    a check, so another process's writes can look that old; every other
+    method checks first.
+    """
+    def __init__(self, changes: ChangeDetector, max_products: Optional[int] = None,
+                 check_interval: float = 0.0):
+        self.changes = changes
+        self.max_products = max_products
+        self.check_interval = check_interval
+        self._checked_at = float('-inf')
+        self._lock = threading.RLock()
+        self._products: "OrderedDict[int, Product]" = OrderedDict()
+        self._by_category: Dict[str, Set[int]] = {}
+        self._by_stock: List[Tuple[int, int]] = []  # sorted (stock_quantity, product_id)
+        self._complete = False  # every product is loaded, so the indexes are authoritative
+        self._stale: Set[int] = set()  # written since cached; re-read before use
+        self._version = changes.external_version(('products',))
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._clears = 0
+
+    def peek(self, product_id: int) -> Optional[Product]:
+        """Cached product if other writers were checked for recently, else None"""
+        with self._lock:
+            if time.monotonic() - self._checked_at > self.check_interval:
+                return None
+            product = self._products.get(product_id)
+            if product is None or product_id in self._stale:
+                return None
+            self._products.move_to_end(product_id)
+            self._hits += 1
+            return _copy(product)
+
+    def get(self, conn, product_id: int) -> Optional[Product]:
+        """Get a product by id, reading through to the database on a miss"""
+        with self._lock:
+            self._check_changes()
+            product = self._products.get(product_id)
+            if product is not None and product_id not in self._stale:
+                self._products.move_to_end(product_id)
+                self._hits += 1
+                return _copy(product)
+
+            self._misses += 1
+            row = conn.execute(f'SELECT {PRODUCT_COLUMNS} FROM products WHERE product_id = ?',
+                               (product_id,)).fetchone()
+            if conn.in_transaction:
+                # Uncommitted rows never enter the catalogue
+                return Product(*row) if row else None
+            self._stale.discard(product_id)
+            if row is None:
+                self._remove(product_id)
+                return None
+            product = Product(*row)
+            self._store(product)
+            self._evict()
+            return _copy(product)
+
+    def products_in_category(self, conn, category: str) -> Optional[List[Product]]:
+        """Products of a category ordered by name, or None if the catalogue can't answer"""
+        with self._lock:
+            if not self._load_all(conn):
+                return None
+            products = [self._products[product_id] for product_id in self._by_category.get(category, ())]
+            return [_copy(product) for product in sorted(products, key=lambda p: p.name)]
+
+    def low_stock(self, conn, threshold: int) -> Optional[List[Product]]:
+        """Products with stock below ``threshold``, lowest first, or None"""
+        with self._lock:
+            if not self._load_all(conn):
+                return None
+            end = bisect.bisect_left(self._by_stock, (threshold,))
+            return [_copy(self._products[product_id]) for _, product_id in self._by_stock[:end]]
+
+    def categories(self, conn) -> Optional[List[str]]:
+        """Sorted non-empty categories, or None"""
+        with self._lock:
+            if not self._load_all(conn):
+                return None
+            return sorted(category for category in self._by_category if category)
+
+    def invalidate(self, product_ids: Iterable[int]):
+        """Forget products written since they were cached"""
+        with self._lock:
+            for product_id in product_ids:
+                self._invalidations += 1
+                if self._complete:
+                    # Keep the indexes complete; the row is re-read before it is served
+                    self._stale.add(product_id)
+                else:
+                    self._remove(product_id)
+
+    def clear(self):
+        """Empty the catalogue"""
+        with self._lock:
+            self._reset()
+            self._clears += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._products),
+                'max_products': self.max_products,
+                'complete': self._complete,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'invalidations': self._invalidations,
+                'clears': self._clears
+            }
+
+    def _check_changes(self):
+        """Empty the catalogue if someone else wrote products since the last check"""
+        version = self.changes.external_version(('products',))
+        self._checked_at = time.monotonic()
+        if version != self._version:
+            self._version = version
+            if self._products:
+                self.clear()
+
+    def _load_all(self, conn) -> bool:
+        """Make sure every product is loaded; False if over the cap or inside a transaction"""
+        self._check_changes()
+        if conn.in_transaction:
+            return False
+        if self._complete:
+            self._refresh_stale(conn)
+            return True
+        if self.max_products is not None:
+            count = conn.execute('SELECT COUNT(*) FROM products').fetchone()[0]
+            if count > self.max_products:
+                return False
+
+        rows = conn.execute(f'SELECT {PRODUCT_COLUMNS} FROM products').fetchall()
+        self._reset()
+        for row in rows:
+            product = Product(*row)
+            self._products[product.product_id] = product
+            self._by_category.setdefault(product.category, set()).add(product.product_id)
+            self._by_stock.append((product.stock_quantity, product.product_id))
+        self._by_stock.sort()
+        self._complete = True
+        return True
+
+    def _refresh_stale(self, conn):
+        """Re-read products written since they were cached"""
+        if not self._stale:
+            return
+        ids = list(self._stale)
+        self._stale.clear()
+        found = set()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            for row in conn.execute(f'''
+                SELECT {PRODUCT_COLUMNS} FROM products
+                WHERE product_id IN ({', '.join('?' * len(chunk))})
+            ''', chunk):
+                product = Product(*row)
+                found.add(product.product_id)
+                self._store(product)
+        for product_id in ids:
+            if product_id not in found:
+                self._remove(product_id)  # deleted
+        self._evict()
+
+    def _reset(self):
+        self._products.clear()
+        self._by_category.clear()
+        self._by_stock.clear()
+        self._stale.clear()
+        self._complete = False
+
+    def _store(self, product: Product):
+        self._remove(product.product_id)
+        self._products[product.product_id] = product
+        self._by_category.setdefault(product.category, set()).add(product.product_id)
+        bisect.insort(self._by_stock, (product.stock_quantity, product.product_id))
+
+    def _remove(self, product_id: int):
+        product = self._products.pop(product_id, None)
+        if product is None:
+            return
+        ids = self._by_category.get(product.category)
+        if ids is not None:
+            ids.discard(product_id)
+            if not ids:
+                del self._by_category[product.category]
+        key = (product.stock_quantity, product_id)
+        index = bisect.bisect_left(self._by_stock, key)
+        if index < len(self._by_stock) and self._by_stock[index] == key:
+            del self._by_stock[index]
+
+    def _evict(self):
+        """Drop least recently used products above the cap"""
+        if self.max_products is None:
+            return
+        while len(self._products) > self.max_products:
+            product_id = next(iter(self._products))
+            self._remove(product_id)
+            self._stale.discard(product_id)
+            self._complete = False
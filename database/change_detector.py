@@ -0,0 +1,209 @@
+"""
+Change detection for Girlush Collections Inventory Management System
+Tells caches and open views which tables were written since they last looked,
+including writes by other terminals sharing the database file
+"""
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+import config
+from database.migrations import TRACKED_TABLES
+
+def read_change_counters(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Current value of every table's change counter"""
+    return dict(conn.execute('SELECT table_name, change_count FROM table_changes').fetchall())
+
+class ChangeDetector:
+    """
+    Polls the per-table change counters kept in ``table_changes``.
+
+    The detector reads through its own connection, which never writes, so
+    its PRAGMA data_version moves on every commit made by any connection in
+    any process. A poll costs one PRAGMA while nothing was committed and
+    one small SELECT when something was.
+
+    Every table has two versions. ``version()`` moves on any write to the
+    table; ``external_version()`` only moves on writes this process did not
+    acknowledge, which is what a cache that already invalidates its own
+    writes needs. DatabaseManager acknowledges the counter ranges written by
+    its transactions; a poll that lands between a commit and its
+    acknowledgement counts the write as external, which only costs a
+    needless refresh.
+
+    Subscribers are called on the Tk thread by the after() loop started with
+    start(); poll() and the version methods are safe from any thread.
+    Databases without ``table_changes`` (a read-only terminal on an old
+    schema) report every table as changed on every commit.
+    """
+    def __init__(self, db_path: str, tables: Iterable[str] = TRACKED_TABLES):
+        self.db_path = db_path
+        self.tables = tuple(tables)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA query_only = ON')
+        self.enabled = self._has_counters()
+        self._data_version = self._read_data_version()
+        self._counts = self._read_counts()
+        self._external = {table: 0 for table in self.tables}
+        self._acknowledged: Dict[str, List[Tuple[int, int]]] = {}  # own (before, after) ranges
+        self._unpublished: Set[str] = set()
+        self._subscribers: List[Tuple[Set[str], Callable[[Set[str]], None]]] = []
+        self._widget = None
+        self._interval_ms = config.CHANGE_POLL_MS
+        self._after_id = None
+
+        # Statistics
+        self._polls = 0
+        self._reads = 0
+        self._changes = 0
+        self._external_changes = 0
+
+    def poll(self) -> Set[str]:
+        """Tables written since the previous poll"""
+        with self._lock:
+            if self._conn is None:
+                return set()
+            self._polls += 1
+            data_version = self._read_data_version()
+            if data_version == self._data_version:
+                return set()
+            self._data_version = data_version
+            if not self.enabled:
+                self.enabled = self._has_counters()
+
+            self._reads += 1
+            counts = self._read_counts()
+            changed = set()
+            for table in self.tables:
+                before, after = self._counts.get(table), counts.get(table)
+                if before == after:
+                    continue
+                changed.add(table)
+                if not self._covered(table, before, after):
+                    self._external[table] += 1
+                    self._external_changes += 1
+            self._counts = counts
+            self._changes += len(changed)
+            self._unpublished |= changed
+            return changed
+
+    def version(self, tables: Iterable[str]) -> Tuple[Any, ...]:
+        """Stamp of ``tables`` that changes whenever any of them is written"""
+        with self._lock:
+            self.poll()
+            return tuple(self._counts.get(table) for table in tables)
+
+    def external_version(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        """Stamp of ``tables`` that changes when another connection or process writes them"""
+        with self._lock:
+            self.poll()
+            return tuple(self._external.get(table, 0) for table in tables)
+
+    def acknowledge(self, before: Dict[str, int], after: Dict[str, int]):
+        """Record counter ranges written by a committed transaction of this process"""
+        with self._lock:
+            for table, count in after.items():
+                start = before.get(table)
+                if start is not None and count != start:
+                    self._acknowledged.setdefault(table, []).append((start, count))
+
+    def subscribe(self, tables: Iterable[str], callback: Callable[[Set[str]], None]) -> Callable[[], None]:
+        """
+        Call ``callback(changed_tables)`` after a tick that saw any of ``tables`` written
+        Returns: a function that cancels the subscription
+        """
+        entry = (set(tables), callback)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+
+    def start(self, widget, interval_ms: int = config.CHANGE_POLL_MS):
+        """Poll every ``interval_ms`` on ``widget``'s Tk event loop and notify subscribers"""
+        self.stop()
+        self._widget = widget
+        self._interval_ms = interval_ms
+        self._after_id = widget.after(interval_ms, self._tick)
+
+    def stop(self):
+        """Stop the polling loop started by start()"""
+        if self._after_id is not None and self._widget is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass  # Window already destroyed
+        self._after_id = None
+        self._widget = None
+
+    def close(self):
+        """Stop polling and close the detector's connection"""
+        self.stop()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._subscribers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get polling statistics"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'polls': self._polls,
+                'counter_reads': self._reads,
+                'table_changes': self._changes,
+                'external_changes': self._external_changes,
+                'subscribers': len(self._subscribers)
+            }
+
+    def _tick(self):
+        self._after_id = None
+        try:
+            self.poll()
+            self._publish()
+        except sqlite3.Error as e:
+            print(f"Error polling for database changes: {e}")
+        if self._widget is not None:
+            self._after_id = self._widget.after(self._interval_ms, self._tick)
+
+    def _publish(self):
+        """Hand the tables changed since the last tick to interested subscribers"""
+        with self._lock:
+            changed, self._unpublished = self._unpublished, set()
+            subscribers = list(self._subscribers)
+        if not changed:
+            return
+        for tables, callback in subscribers:
+            if tables & changed:
+                callback(tables & changed)
+
+    def _covered(self, table: str, before: Optional[int], after: Optional[int]) -> bool:
+        """Check whether acknowledged ranges account for every write from ``before`` to ``after``"""
+        ranges = self._acknowledged.get(table)
+        if not ranges or before is None or after is None:
+            return False
+        position = before
+        for start, end in sorted(ranges):
+            if start == position:
+                position = end
+        # Ranges at or below what has been seen can't explain anything later
+        self._acknowledged[table] = [(start, end) for start, end in ranges if end > after]
+        return position == after
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def _has_counters(self) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'table_changes'"
+        ).fetchone() is not None
+
+    def _read_counts(self) -> Dict[str, Any]:
+        if self.enabled:
+            return read_change_counters(self._conn)
+        # Without counters every commit could have touched any table
+        return {table: self._data_version for table in self.tables}
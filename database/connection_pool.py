@@ -0,0 +1,141 @@
+"""
+Connection pool for Girlush Collections Inventory Management System
+Hands out long-lived SQLite connections so CRUD calls stop reconnecting
+"""
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, List
+
+class ConnectionPool:
+    """
+    Small pool of reusable SQLite connections.
+
+    Each thread holds at most one connection at a time: nested checkouts on the
+    same thread get the connection that thread already holds, so a method can
+    call another DatabaseManager method without opening a second connection.
+    When every connection is busy, callers wait up to ``timeout`` seconds.
+    """
+    def __init__(self, connect: Callable[[], sqlite3.Connection], pool_size: int = 5,
+                 timeout: float = 30.0):
+        self._connect = connect
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+
+        self._condition = threading.Condition()
+        self._idle: List[sqlite3.Connection] = []
+        self._all: List[sqlite3.Connection] = []
+        self._local = threading.local()
+        self._closed = False
+
+        # Statistics
+        self._checkouts = 0
+        self._reused = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._created = 0
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the duration of the ``with`` block"""
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            # Re-entrant checkout on the same thread
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            self._release(conn)
+
+    def in_transaction(self) -> bool:
+        """Check whether this thread holds a connection with an open transaction"""
+        held = getattr(self._local, 'conn', None)
+        return held is not None and held.in_transaction
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._condition:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool is closed")
+            self._checkouts += 1
+
+            if self._idle:
+                self._reused += 1
+                return self._idle.pop()
+
+            if len(self._all) < self.pool_size:
+                conn = self._connect()
+                self._all.append(conn)
+                self._created += 1
+                return conn
+
+            # Every connection is checked out - wait for one to come back
+            self._waits += 1
+            started = time.perf_counter()
+            deadline = started + self.timeout
+            while not self._idle:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or self._closed:
+                    raise sqlite3.OperationalError(
+                        f"Timed out after {self.timeout}s waiting for a database connection")
+                self._condition.wait(remaining)
+            waited = time.perf_counter() - started
+            self._wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+            self._reused += 1
+            return self._idle.pop()
+
+    def _release(self, conn: sqlite3.Connection):
+        # Never hand a half-finished transaction to the next caller
+        if conn.in_transaction:
+            conn.rollback()
+        with self._condition:
+            if self._closed:
+                conn.close()
+                self._all.remove(conn)
+                return
+            self._idle.append(conn)
+            self._condition.notify()
+
+    def close(self):
+        """Close idle connections; busy ones are closed when returned"""
+        with self._condition:
+            self._closed = True
+            for conn in self._idle:
+                conn.close()
+                self._all.remove(conn)
+            self._idle.clear()
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool usage statistics"""
+        with self._condition:
+            return {
+                'pool_size': self.pool_size,
+                'live_connections': len(self._all),
+                'idle_connections': len(self._idle),
+                'in_use': len(self._all) - len(self._idle),
+                'connections_created': self._created,
+                'checkouts': self._checkouts,
+                'reused': self._reused,
+                'waits': self._waits,
+                'total_wait_time': self._wait_time,
+                'max_wait_time': self._max_wait_time,
+                'avg_wait_time': self._wait_time / self._waits if self._waits else 0.0
+            }
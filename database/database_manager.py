@@ -4,156 +4,235 @@ Handles all database operations and CRUD functionality
 """
 import sqlite3
 import hashlib
+import re
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Callable
 import config
-from database.models import User, Product, Customer, Order, OrderItem, Supplier, CartItem
+from database import migrations
+from database.catalogue import ProductCatalogue
+from database.change_detector import ChangeDetector, read_change_counters
+from database.connection_pool import ConnectionPool
+from database.sql_trace import SqlTracer
+from database.models import (User, Product, Customer, Order, OrderItem, Supplier, CartItem,
+                             Page, row_factory, model_columns)
+
+USER_COLUMNS = model_columns(User)
+PRODUCT_COLUMNS = model_columns(Product)
+CUSTOMER_COLUMNS = model_columns(Customer)
+SUPPLIER_COLUMNS = model_columns(Supplier)
+
+# Product search rank: name hits above category hits above description hits
+PRODUCT_SEARCH_RANK = 'bm25(products_fts, 10.0, 1.0, 5.0)'
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string above every string starting with ``prefix``"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+class CheckoutError(Exception):
+    """Raised when an order cannot be placed; the transaction is rolled back"""
+
+class OrderStatusError(Exception):
+    """Raised when an order's status cannot be changed; the transaction is rolled back"""
+
+class InsufficientStockError(CheckoutError):
+    """Raised when an order line asks for more units than are in stock"""
+    def __init__(self, product_id: int, product_name: str, requested: int, available: int):
+        self.product_id = product_id
+        self.product_name = product_name
+        self.requested = requested
+        self.available = available
+        super().__init__(f"Insufficient stock for {product_name}: "
+                         f"{requested} requested, {available} available")
 
 class DatabaseManager:
-    def __init__(self, db_path: str = config.DATABASE_PATH):
+    def __init__(self, db_path: str = config.DATABASE_PATH, pool_size: int = config.DB_POOL_SIZE,
+                 profile: str = config.DATABASE_PROFILE, trace: bool = config.SQL_TRACE_ENABLED):
+        if profile not in config.DATABASE_PROFILES:
+            raise ValueError(f"Unknown database profile: {profile}")
         self.db_path = db_path
+        self.tracer = SqlTracer() if trace else None
+        self.profile_name = profile
+        self.profile = config.DATABASE_PROFILES[profile]
+        self.pool = ConnectionPool(self.get_connection, pool_size, config.DB_POOL_TIMEOUT)
+        # Products written by a transaction still open on a connection, by id(connection)
+        self._pending_products: Dict[int, set] = {}
+        self.changes = ChangeDetector(db_path)
+        self.catalogue = ProductCatalogue(self.changes, config.PRODUCT_CACHE_MAX_PRODUCTS,
+                                          config.PRODUCT_CACHE_CHECK_INTERVAL)
         self.init_database()
+        self.fts_enabled = self._table_exists('products_fts')
+        self.customer_fts_enabled = self._table_exists('users_fts')
 
     def get_connection(self):
-        """Create and return a database connection"""
-        conn = sqlite3.connect(self.db_path)
+        """Create and return a new database connection tuned by the active profile"""
+        connect = self.tracer.connect if self.tracer else sqlite3.connect
+        conn = connect(self.db_path, check_same_thread=False,
+                       timeout=self.profile['busy_timeout'] / 1000)
         conn.row_factory = sqlite3.Row
+        self._apply_profile(conn)
         return conn
 
-    def init_database(self):
-        """Initialize database tables"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    def _apply_profile(self, conn):
+        """Apply the storage tuning pragmas of the active profile"""
+        profile = self.profile
+        conn.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout'])}")
+        if profile['journal_mode'] and not profile['query_only']:
+            conn.execute(f"PRAGMA journal_mode = {profile['journal_mode']}")
+        conn.execute(f"PRAGMA synchronous = {profile['synchronous']}")
+        conn.execute(f"PRAGMA mmap_size = {int(profile['mmap_size'])}")
+        conn.execute(f"PRAGMA cache_size = {int(profile['cache_size'])}")
+        conn.execute(f"PRAGMA temp_store = {profile['temp_store']}")
+        if profile['query_only']:
+            conn.execute("PRAGMA query_only = ON")
 
-        # Users table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE NOT NULL,
-                password TEXT NOT NULL,
-                name TEXT NOT NULL,
-                role TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        ''')
+    def is_read_only(self) -> bool:
+        """Check whether the active profile forbids writes"""
+        return bool(self.profile['query_only'])
 
-        # Products table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS products (
-                product_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                description TEXT,
-                category TEXT,
-                price REAL NOT NULL,
-                cost REAL,
-                stock_quantity INTEGER NOT NULL,
-                supplier_id INTEGER,
-                image_path TEXT,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (supplier_id) REFERENCES suppliers(supplier_id)
-            )
-        ''')
+    def connection(self):
+        """Check out a pooled connection: ``with self.connection() as conn:``"""
+        return self.pool.connection()
 
-        # Customers table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS customers (
-                customer_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER UNIQUE,
-                phone TEXT,
-                address TEXT,
-                city TEXT,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (user_id) REFERENCES users(user_id)
-            )
-        ''')
+    @contextmanager
+    def transaction(self):
+        """
+        Run the block in one BEGIN IMMEDIATE transaction
+        Commits on success and rolls back on any exception. Nested use joins
+        the transaction already open on this thread.
+        """
+        with self.connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute('BEGIN IMMEDIATE')
+            # Holding the write lock, so the counters only move by what this block writes
+            counters = read_change_counters(conn) if self.changes.enabled else None
+            try:
+                yield conn
+                if counters is not None:
+                    written = read_change_counters(conn)
+                    conn.commit()
+                    self.changes.acknowledge(counters, written)
+                else:
+                    conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                # Cached products stay valid until the transaction is over
+                self.catalogue.invalidate(self._pending_products.pop(id(conn), ()))
 
-        # Orders table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS orders (
-                order_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                customer_id INTEGER,
-                user_id INTEGER,
-                order_date TEXT NOT NULL,
-                total_amount REAL NOT NULL,
-                status TEXT NOT NULL,
-                payment_method TEXT,
-                shipping_address TEXT,
-                FOREIGN KEY (customer_id) REFERENCES customers(customer_id),
-                FOREIGN KEY (user_id) REFERENCES users(user_id)
-            )
-        ''')
+    def _products_changed(self, conn, product_ids):
+        """Drop written products from the catalogue once ``conn`` has committed"""
+        if conn.in_transaction:
+            self._pending_products.setdefault(id(conn), set()).update(product_ids)
+        else:
+            self.catalogue.invalidate(product_ids)
 
-        # Order Items table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS order_items (
-                item_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                order_id INTEGER NOT NULL,
-                product_id INTEGER NOT NULL,
-                quantity INTEGER NOT NULL,
-                unit_price REAL NOT NULL,
-                subtotal REAL NOT NULL,
-                FOREIGN KEY (order_id) REFERENCES orders(order_id),
-                FOREIGN KEY (product_id) REFERENCES products(product_id)
-            )
-        ''')
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics"""
+        return self.pool.get_stats()
 
-        # Suppliers table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS suppliers (
-                supplier_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                contact_person TEXT,
-                email TEXT,
-                phone TEXT,
-                address TEXT,
-                created_at TEXT NOT NULL
-            )
-        ''')
+    def get_trace_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-method SQL timings (empty unless tracing is enabled)"""
+        return self.tracer.get_stats() if self.tracer else {}
 
-        # Cart table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS cart (
-                cart_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                product_id INTEGER NOT NULL,
-                quantity INTEGER NOT NULL,
-                added_at TEXT NOT NULL,
-                FOREIGN KEY (user_id) REFERENCES users(user_id),
-                FOREIGN KEY (product_id) REFERENCES products(product_id)
-            )
-        ''')
+    def get_catalogue_stats(self) -> Dict[str, Any]:
+        """Get product catalogue cache statistics"""
+        return self.catalogue.get_stats()
 
-        # Sales table (for reporting)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sales (
-                sale_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                order_id INTEGER NOT NULL,
-                sale_date TEXT NOT NULL,
-                total_amount REAL NOT NULL,
-                profit REAL,
-                FOREIGN KEY (order_id) REFERENCES orders(order_id)
-            )
-        ''')
+    def get_change_stats(self) -> Dict[str, Any]:
+        """Get change detector statistics"""
+        return self.changes.get_stats()
 
-        # Inventory Transactions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS inventory_transactions (
-                transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                product_id INTEGER NOT NULL,
-                transaction_type TEXT NOT NULL,
-                quantity INTEGER NOT NULL,
-                transaction_date TEXT NOT NULL,
-                notes TEXT,
-                FOREIGN KEY (product_id) REFERENCES products(product_id)
-            )
-        ''')
+    def close(self):
+        """Close all pooled connections"""
+        self.pool.close()
+        self.catalogue.clear()
+        self.changes.close()
+
+    def init_database(self):
+        """Apply pending schema migrations; a warm start runs no DDL"""
+        if self.is_read_only():
+            return  # Read-only terminals use the schema as they find it
+        with self.connection() as conn:
+            if migrations.migrate(conn):
+                # Create default admin user if not exists
+                self._create_default_admin(conn.cursor())
+                conn.commit()
 
-        conn.commit()
+            # The low stock count depends on the threshold it was counted with
+            row = conn.execute('SELECT low_stock_threshold FROM stats_counters WHERE id = 1').fetchone()
+            if row is None or row[0] != config.LOW_STOCK_THRESHOLD:
+                self.rebuild_stats_counters(config.LOW_STOCK_THRESHOLD)
 
-        # Create default admin user if not exists
-        self._create_default_admin(cursor)
-        conn.commit()
-        conn.close()
+    def _fetch_models(self, model_cls, sql: str, params: tuple = ()) -> list:
+        """Run a query and build ``model_cls`` objects straight from the row tuples"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = row_factory(model_cls)
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def _fetch_model(self, model_cls, sql: str, params: tuple = ()):
+        """Run a query and build one ``model_cls`` object, or None"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = row_factory(model_cls)
+            cursor.execute(sql, params)
+            return cursor.fetchone()
+
+    def _keyset_page(self, select_sql: str, sort_column: str, id_column: str,
+                     key: Callable[[Any], Tuple], cursor: Optional[Tuple], backwards: bool,
+                     limit: int, model_cls=None, condition: str = '') -> Page:
+        """
+        Fetch one page of ``select_sql`` newest first, ordered by
+        (sort_column, id_column) DESC. Only ``limit + 1`` rows are read: the
+        cursor seeks straight to the page through the sort index.
+        ``condition`` is an optional extra WHERE clause without parameters.
+        """
+        if cursor is None:
+            where, params, order = condition, (), 'DESC'
+        elif backwards:
+            where, params, order = f'({sort_column}, {id_column}) > (?, ?)', tuple(cursor), 'ASC'
+        else:
+            where, params, order = f'({sort_column}, {id_column}) < (?, ?)', tuple(cursor), 'DESC'
+        if condition and cursor is not None:
+            where = f'{condition} AND {where}'
+        if where:
+            where = f'WHERE {where}'
+
+        sql = f'''
+            {select_sql}
+            {where}
+            ORDER BY {sort_column} {order}, {id_column} {order}
+            LIMIT ?
+        '''
+        with self.connection() as conn:
+            db_cursor = conn.cursor()
+            if model_cls:
+                db_cursor.row_factory = row_factory(model_cls)
+            db_cursor.execute(sql, params + (limit + 1,))
+            rows = db_cursor.fetchall()
+
+        items = rows[:limit] if model_cls else [dict(row) for row in rows[:limit]]
+        has_more = len(rows) > limit
+        if backwards and cursor is not None:
+            items.reverse()
+            return Page(items,
+                        next_cursor=key(items[-1]) if items else tuple(cursor),
+                        prev_cursor=key(items[0]) if has_more else None)
+        return Page(items,
+                    next_cursor=key(items[-1]) if has_more else None,
+                    prev_cursor=key(items[0]) if cursor is not None and items else None)
+
+    def _table_exists(self, name: str) -> bool:
+        """Check whether a table exists in the schema"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,))
+            return cursor.fetchone() is not None
 
     def _create_default_admin(self, cursor):
         """Create default admin user"""
@@ -170,559 +249,1091 @@ class DatabaseManager:
     # ===== USER OPERATIONS =====
     def create_user(self, user: User) -> Optional[int]:
         """Create a new user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute('''
-                INSERT INTO users (email, password, name, role, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (user.email, user.password, user.name, user.role, user.created_at))
-            conn.commit()
-            return cursor.lastrowid
-        except sqlite3.IntegrityError:
-            return None
-        finally:
-            conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('''
+                    INSERT INTO users (email, password, name, role, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (user.email, user.password, user.name, user.role, user.created_at))
+                conn.commit()
+                return cursor.lastrowid
+            except sqlite3.IntegrityError:
+                return None
 
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM users WHERE email = ?', (email,))
-        row = cursor.fetchone()
-        conn.close()
-        if row:
-            return User(row['user_id'], row['email'], row['password'], 
-                       row['name'], row['role'], row['created_at'])
-        return None
+        return self._fetch_model(User, f'SELECT {USER_COLUMNS} FROM users WHERE email = ?', (email,))
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM users WHERE user_id = ?', (user_id,))
-        row = cursor.fetchone()
-        conn.close()
-        if row:
-            return User(row['user_id'], row['email'], row['password'], 
-                       row['name'], row['role'], row['created_at'])
-        return None
+        return self._fetch_model(User, f'SELECT {USER_COLUMNS} FROM users WHERE user_id = ?', (user_id,))
 
     def get_all_users(self) -> List[User]:
         """Get all users"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM users ORDER BY created_at DESC')
-        rows = cursor.fetchall()
-        conn.close()
-        return [User(row['user_id'], row['email'], row['password'], 
-                    row['name'], row['role'], row['created_at']) for row in rows]
+        return self._fetch_models(User, f'SELECT {USER_COLUMNS} FROM users ORDER BY created_at DESC')
+
+    def get_users_page(self, cursor: Optional[Tuple] = None, backwards: bool = False,
+                       limit: int = config.ITEMS_PER_PAGE) -> Page:
+        """Get one page of users, newest first"""
+        return self._keyset_page(f'SELECT {USER_COLUMNS} FROM users', 'created_at', 'user_id',
+                                 lambda u: (u.created_at, u.user_id), cursor, backwards, limit,
+                                 model_cls=User)
 
     def update_user(self, user: User) -> bool:
         """Update user information"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute('''
-                UPDATE users SET email = ?, name = ?, role = ?
-                WHERE user_id = ?
-            ''', (user.email, user.name, user.role, user.user_id))
-            conn.commit()
-            return True
-        except:
-            return False
-        finally:
-            conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('''
+                    UPDATE users SET email = ?, name = ?, role = ?
+                    WHERE user_id = ?
+                ''', (user.email, user.name, user.role, user.user_id))
+                conn.commit()
+                return True
+            except:
+                return False
 
     def delete_user(self, user_id: int) -> bool:
         """Delete user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute('DELETE FROM users WHERE user_id = ?', (user_id,))
-            conn.commit()
-            return True
-        except:
-            return False
-        finally:
-            conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('DELETE FROM users WHERE user_id = ?', (user_id,))
+                conn.commit()
+                return True
+            except:
+                return False
 
     # ===== PRODUCT OPERATIONS =====
     def create_product(self, product: Product) -> Optional[int]:
         """Create a new product"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
         try:
-            cursor.execute('''
-                INSERT INTO products (name, description, category, price, cost, 
-                                     stock_quantity, supplier_id, image_path, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (product.name, product.description, product.category, product.price,
-                  product.cost, product.stock_quantity, product.supplier_id,
-                  product.image_path, product.created_at))
-            conn.commit()
-            return cursor.lastrowid
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT INTO products (name, description, category, price, cost, 
+                                         stock_quantity, supplier_id, image_path, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (product.name, product.description, product.category, product.price,
+                      product.cost, product.stock_quantity, product.supplier_id,
+                      product.image_path, product.created_at))
+                product_id = cursor.lastrowid
+                self._products_changed(conn, [product_id])
+                if product.stock_quantity:
+                    self._record_movements(cursor, [(product_id, 'restock', product.stock_quantity,
+                                                     'Initial stock')])
+                return product_id
         except Exception as e:
             print(f"Error creating product: {e}")
             return None
-        finally:
-            conn.close()
 
     def get_product_by_id(self, product_id: int) -> Optional[Product]:
-        """Get product by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM products WHERE product_id = ?', (product_id,))
-        row = cursor.fetchone()
-        conn.close()
-        if row:
-            return Product(row['product_id'], row['name'], row['description'],
-                          row['category'], row['price'], row['cost'],
-                          row['stock_quantity'], row['supplier_id'],
-                          row['image_path'], row['created_at'])
-        return None
+        """Get product by ID, from the in-memory catalogue when cached"""
+        if not self.pool.in_transaction():
+            product = self.catalogue.peek(product_id)
+            if product is not None:
+                return product
+        with self.connection() as conn:
+            return self.catalogue.get(conn, product_id)
 
     def get_all_products(self) -> List[Product]:
         """Get all products"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM products ORDER BY created_at DESC')
-        rows = cursor.fetchall()
-        conn.close()
-        return [Product(row['product_id'], row['name'], row['description'],
-                       row['category'], row['price'], row['cost'],
-                       row['stock_quantity'], row['supplier_id'],
-                       row['image_path'], row['created_at']) for row in rows]
+        return self._fetch_models(Product, f'SELECT {PRODUCT_COLUMNS} FROM products ORDER BY created_at DESC')
+
+    def get_products_page(self, cursor: Optional[Tuple] = None, backwards: bool = False,
+                          limit: int = config.ITEMS_PER_PAGE) -> Page:
+        """Get one page of products, newest first"""
+        return self._keyset_page(f'SELECT {PRODUCT_COLUMNS} FROM products', 'created_at', 'product_id',
+                                 lambda p: (p.created_at, p.product_id), cursor, backwards, limit,
+                                 model_cls=Product)
+
+    def get_in_stock_products_page(self, cursor: Optional[Tuple] = None, backwards: bool = False,
+                                   limit: int = config.ITEMS_PER_PAGE) -> Page:
+        """Get one page of products that are in stock, newest first"""
+        return self._keyset_page(f'SELECT {PRODUCT_COLUMNS} FROM products', 'created_at', 'product_id',
+                                 lambda p: (p.created_at, p.product_id), cursor, backwards, limit,
+                                 model_cls=Product, condition='stock_quantity > 0')
 
     def get_products_by_category(self, category: str) -> List[Product]:
         """Get products by category"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM products WHERE category = ? ORDER BY name', (category,))
-        rows = cursor.fetchall()
-        conn.close()
-        return [Product(row['product_id'], row['name'], row['description'],
-                       row['category'], row['price'], row['cost'],
-                       row['stock_quantity'], row['supplier_id'],
-                       row['image_path'], row['created_at']) for row in rows]
-
-    def search_products(self, query: str) -> List[Product]:
-        """Search products by name or description"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        search_term = f'%{query}%'
-        cursor.execute('''
-            SELECT * FROM products 
-            WHERE name LIKE ? OR description LIKE ? OR category LIKE ?
-            ORDER BY name
-        ''', (search_term, search_term, search_term))
-        rows = cursor.fetchall()
-        conn.close()
-        return [Product(row['product_id'], row['name'], row['description'],
-                       row['category'], row['price'], row['cost'],
-                       row['stock_quantity'], row['supplier_id'],
-                       row['image_path'], row['created_at']) for row in rows]
+        with self.connection() as conn:
+            products = self.catalogue.products_in_category(conn, category)
+        if products is not None:
+            return products
+        return self._fetch_models(Product, f'''
+            SELECT {PRODUCT_COLUMNS} FROM products WHERE category = ? ORDER BY name
+        ''', (category,))
+
+    def get_low_stock_products(self, threshold: int = config.LOW_STOCK_THRESHOLD) -> List[Product]:
+        """Get products with stock below ``threshold``, lowest stock first"""
+        with self.connection() as conn:
+            products = self.catalogue.low_stock(conn, threshold)
+        if products is not None:
+            return products
+        return self._fetch_models(Product, f'''
+            SELECT {PRODUCT_COLUMNS} FROM products WHERE stock_quantity < ?
+            ORDER BY stock_quantity, product_id
+        ''', (threshold,))
+
+    def get_categories(self) -> List[str]:
+        """Get all unique product categories, sorted"""
+        with self.connection() as conn:
+            categories = self.catalogue.categories(conn)
+            if categories is None:
+                categories = [row[0] for row in conn.execute('''
+                    SELECT DISTINCT category FROM products
+                    WHERE category IS NOT NULL AND category != ''
+                    ORDER BY category
+                ''')]
+            return categories
+
+    def search_products(self, query: str, limit: Optional[int] = None) -> List[Product]:
+        """Search products by name, description or category, best matches first"""
+        return [result['product'] for result in self.search_products_with_snippets(query, limit)]
+
+    def search_products_with_snippets(self, query: str,
+                                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search products, returning dicts with 'product', 'snippet' and 'score'
+        Uses the FTS5 index (prefix match, bm25 ranking) when available
+        """
+        match = self._fts_match_expression(query)
+        if self.fts_enabled and match:
+            try:
+                return self._search_products_fts(match, limit)
+            except sqlite3.OperationalError as e:
+                print(f"Full-text search failed, using LIKE: {e}")
+        return self._search_products_like(query, limit)
+
+    def rank_product_search(self, query: str) -> Optional[List[int]]:
+        """
+        Ids of the products matching ``query``, best first, without loading the products
+        Returns: None when the full-text index can't rank the query
+        """
+        match = self._fts_match_expression(query)
+        if not self.fts_enabled or not match:
+            return None
+        try:
+            with self.connection() as conn:
+                rows = conn.execute(f'''
+                    SELECT rowid FROM products_fts
+                    WHERE products_fts MATCH ?
+                    ORDER BY {PRODUCT_SEARCH_RANK}
+                ''', (match,)).fetchall()
+            return [row[0] for row in rows]
+        except sqlite3.OperationalError as e:
+            print(f"Error ranking product search: {e}")
+            return None
+
+    def _fts_match_expression(self, query: str) -> Optional[str]:
+        """Turn free text into an FTS5 expression where every word is a prefix"""
+        words = re.findall(r'\w+', query)
+        if not words:
+            return None
+        return ' '.join(f'"{word}"*' for word in words)
+
+    def _search_products_fts(self, match: str, limit: Optional[int]) -> List[Dict[str, Any]]:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(f'''
+                SELECT {model_columns(Product, 'p')},
+                       snippet(products_fts, -1, '[', ']', '...', 10) AS snippet,
+                       {PRODUCT_SEARCH_RANK} AS score
+                FROM products_fts
+                JOIN products p ON p.product_id = products_fts.rowid
+                WHERE products_fts MATCH ?
+                ORDER BY score
+                LIMIT ?
+            ''', (match, limit if limit is not None else -1))
+            return [{'product': Product(*row[:-2]), 'snippet': row[-2], 'score': row[-1]}
+                    for row in cursor.fetchall()]
+
+    def _search_products_like(self, query: str, limit: Optional[int]) -> List[Dict[str, Any]]:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            search_term = f'%{query}%'
+            cursor.row_factory = row_factory(Product)
+            cursor.execute(f'''
+                SELECT {PRODUCT_COLUMNS} FROM products 
+                WHERE name LIKE ? OR description LIKE ? OR category LIKE ?
+                ORDER BY name
+                LIMIT ?
+            ''', (search_term, search_term, search_term, limit if limit is not None else -1))
+            return [{'product': product, 'snippet': product.description or '', 'score': 0.0}
+                    for product in cursor.fetchall()]
 
     def update_product(self, product: Product) -> bool:
-        """Update product information"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        """Update product information; a changed stock level is logged as an adjustment"""
         try:
-            cursor.execute('''
-                UPDATE products 
-                SET name = ?, description = ?, category = ?, price = ?, cost = ?,
-                    stock_quantity = ?, supplier_id = ?, image_path = ?
-                WHERE product_id = ?
-            ''', (product.name, product.description, product.category, product.price,
-                  product.cost, product.stock_quantity, product.supplier_id,
-                  product.image_path, product.product_id))
-            conn.commit()
-            return True
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT stock_quantity FROM products WHERE product_id = ?',
+                               (product.product_id,))
+                row = cursor.fetchone()
+                cursor.execute('''
+                    UPDATE products 
+                    SET name = ?, description = ?, category = ?, price = ?, cost = ?,
+                        stock_quantity = ?, supplier_id = ?, image_path = ?
+                    WHERE product_id = ?
+                ''', (product.name, product.description, product.category, product.price,
+                      product.cost, product.stock_quantity, product.supplier_id,
+                      product.image_path, product.product_id))
+                self._products_changed(conn, [product.product_id])
+                if row and row['stock_quantity'] != product.stock_quantity:
+                    self._record_movements(cursor, [(product.product_id, 'adjustment',
+                                                     product.stock_quantity - row['stock_quantity'],
+                                                     'Product edited')])
+                return True
         except Exception as e:
             print(f"Error updating product: {e}")
             return False
-        finally:
-            conn.close()
 
     def delete_product(self, product_id: int) -> bool:
         """Delete product"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
         try:
-            cursor.execute('DELETE FROM products WHERE product_id = ?', (product_id,))
-            conn.commit()
+            with self.transaction() as conn:
+                conn.execute('DELETE FROM products WHERE product_id = ?', (product_id,))
+                self._products_changed(conn, [product_id])
             return True
         except:
             return False
-        finally:
-            conn.close()
 
-    def update_stock(self, product_id: int, quantity_change: int) -> bool:
-        """Update product stock quantity"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    def update_stock(self, product_id: int, quantity_change: int, notes: str = "") -> bool:
+        """Update product stock quantity; increases are restocks, decreases adjustments"""
         try:
-            cursor.execute('''
-                UPDATE products 
-                SET stock_quantity = stock_quantity + ?
-                WHERE product_id = ?
-            ''', (quantity_change, product_id))
-            conn.commit()
-            return True
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    UPDATE products 
+                    SET stock_quantity = stock_quantity + ?
+                    WHERE product_id = ?
+                ''', (quantity_change, product_id))
+                if cursor.rowcount != 1:
+                    return False
+                self._record_movements(cursor, [(product_id,
+                                                 'restock' if quantity_change > 0 else 'adjustment',
+                                                 quantity_change, notes)])
+                return True
         except:
             return False
-        finally:
-            conn.close()
+
+    def create_products_bulk(self, products: List[Product],
+                             chunk_size: int = config.BULK_CHUNK_SIZE) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Insert many products with executemany, one transaction per chunk
+        Returns: one (product_id, error) pair per input product, in order
+        """
+        rows = [(p.name, p.description, p.category, p.price, p.cost, p.stock_quantity,
+                 p.supplier_id, p.image_path, p.created_at) for p in products]
+
+        def record_initial_stock(cursor, inserted):
+            self._products_changed(cursor.connection, [product_id for product_id, _ in inserted])
+            self._record_movements(cursor, [(product_id, 'restock', row[5], 'Initial stock')
+                                            for product_id, row in inserted if row[5]])
+
+        return self._insert_bulk('products', ('name', 'description', 'category', 'price', 'cost',
+                                              'stock_quantity', 'supplier_id', 'image_path',
+                                              'created_at'), rows, chunk_size,
+                                 after_insert=record_initial_stock)
+
+    def update_products_bulk(self, products: List[Product],
+                             chunk_size: int = config.BULK_CHUNK_SIZE) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Update many products with executemany, one transaction per chunk
+        Returns: one (product_id, error) pair per input product, in order
+        """
+        results = []
+        for start in range(0, len(products), chunk_size):
+            chunk = products[start:start + chunk_size]
+            try:
+                with self.transaction() as conn:
+                    cursor = conn.cursor()
+                    ids = [p.product_id for p in chunk]
+                    cursor.execute(f'''
+                        SELECT product_id, stock_quantity FROM products
+                        WHERE product_id IN ({', '.join('?' * len(ids))})
+                    ''', ids)
+                    existing = {row['product_id']: row['stock_quantity'] for row in cursor.fetchall()}
+                    cursor.executemany('''
+                        UPDATE products 
+                        SET name = ?, description = ?, category = ?, price = ?, cost = ?,
+                            stock_quantity = ?, supplier_id = ?, image_path = ?
+                        WHERE product_id = ?
+                    ''', [(p.name, p.description, p.category, p.price, p.cost, p.stock_quantity,
+                           p.supplier_id, p.image_path, p.product_id)
+                          for p in chunk if p.product_id in existing])
+                    self._products_changed(conn, existing)
+                    self._record_movements(cursor, [
+                        (p.product_id, 'adjustment', p.stock_quantity - existing[p.product_id],
+                         'Bulk update')
+                        for p in chunk
+                        if p.product_id in existing and p.stock_quantity != existing[p.product_id]])
+                results.extend((p.product_id, None) if p.product_id in existing
+                               else (None, f"Product not found: {p.product_id}") for p in chunk)
+            except sqlite3.Error as e:
+                print(f"Error updating products: {e}")
+                results.extend((None, str(e)) for _ in chunk)
+        return results
+
+    def _insert_bulk(self, table: str, columns: Tuple[str, ...], rows: List[tuple],
+                     chunk_size: int, after_insert: Optional[Callable] = None
+                     ) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Insert rows with executemany in chunked transactions
+        A chunk that fails is retried row by row so only the bad rows report errors.
+        ``after_insert(cursor, [(id, row), ...])`` runs inside each chunk's transaction.
+        """
+        sql = f'''
+            INSERT INTO {table} ({', '.join(columns)})
+            VALUES ({', '.join('?' * len(columns))})
+        '''
+        results = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            try:
+                with self.transaction() as conn:
+                    cursor = conn.cursor()
+                    # BEGIN IMMEDIATE holds the write lock, so AUTOINCREMENT
+                    # hands this chunk a contiguous run of ids
+                    cursor.execute('SELECT seq FROM sqlite_sequence WHERE name = ?', (table,))
+                    row = cursor.fetchone()
+                    first_id = (row['seq'] if row else 0) + 1
+                    cursor.executemany(sql, chunk)
+                    if after_insert:
+                        after_insert(cursor, [(first_id + i, row) for i, row in enumerate(chunk)])
+                results.extend((first_id + i, None) for i in range(len(chunk)))
+            except sqlite3.Error:
+                results.extend(self._insert_rows_individually(sql, chunk, after_insert))
+        return results
+
+    def _insert_rows_individually(self, sql: str, rows: List[tuple],
+                                  after_insert: Optional[Callable] = None
+                                  ) -> List[Tuple[Optional[int], Optional[str]]]:
+        """Insert rows one at a time under savepoints, collecting per-row errors"""
+        results = []
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            for row in rows:
+                cursor.execute('SAVEPOINT bulk_row')
+                try:
+                    cursor.execute(sql, row)
+                    row_id = cursor.lastrowid
+                    if after_insert:
+                        after_insert(cursor, [(row_id, row)])
+                    results.append((row_id, None))
+                except sqlite3.Error as e:
+                    cursor.execute('ROLLBACK TO bulk_row')
+                    results.append((None, str(e)))
+                cursor.execute('RELEASE bulk_row')
+        return results
+
+    # ===== INVENTORY LEDGER =====
+    def _record_movements(self, cursor, movements: List[Tuple[int, str, int, str]],
+                          transaction_date: Optional[str] = None):
+        """
+        Append (product_id, transaction_type, quantity, notes) rows to the ledger
+        Call inside the transaction that changes the stock. Products that have
+        gathered enough movements since their last checkpoint get a new one.
+        """
+        if not movements:
+            return
+        # Every stock change passes through here
+        self._products_changed(cursor.connection, {m[0] for m in movements})
+        transaction_date = transaction_date or datetime.now().isoformat()
+        cursor.executemany('''
+            INSERT INTO inventory_transactions (product_id, transaction_type, quantity,
+                                                transaction_date, notes)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(product_id, transaction_type, quantity, transaction_date, notes)
+              for product_id, transaction_type, quantity, notes in movements])
+        self._checkpoint_stock(cursor, {m[0] for m in movements}, transaction_date)
+
+    def _checkpoint_stock(self, cursor, product_ids, transaction_date: str,
+                          interval: int = config.INVENTORY_CHECKPOINT_INTERVAL):
+        """Write a checkpoint (quantity = absolute stock) for products due one"""
+        ids = list(product_ids)
+        cursor.execute(f'''
+            INSERT INTO inventory_transactions (product_id, transaction_type, quantity,
+                                                transaction_date, notes)
+            SELECT p.product_id, 'checkpoint', p.stock_quantity, ?, NULL
+            FROM products p
+            WHERE p.product_id IN ({', '.join('?' * len(ids))})
+              AND (
+                SELECT COUNT(*) FROM (
+                    SELECT 1 FROM inventory_transactions t
+                    WHERE t.product_id = p.product_id
+                      AND t.transaction_id > COALESCE((
+                          SELECT MAX(c.transaction_id) FROM inventory_transactions c
+                          WHERE c.product_id = p.product_id AND c.transaction_type = 'checkpoint'
+                      ), 0)
+                    LIMIT ?
+                )
+              ) >= ?
+        ''', [transaction_date] + ids + [interval, interval])
+
+    def stock_at(self, product_id: int, timestamp: str) -> int:
+        """
+        Get a product's stock level at a past timestamp (ISO format)
+        Starts from the latest checkpoint at or before ``timestamp`` and adds
+        the movements recorded after it, so only a short tail is read.
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT transaction_id, quantity FROM inventory_transactions
+                WHERE product_id = ? AND transaction_type = 'checkpoint'
+                  AND transaction_date <= ?
+                ORDER BY transaction_id DESC
+                LIMIT 1
+            ''', (product_id, timestamp))
+            checkpoint = cursor.fetchone()
+
+            cursor.execute('''
+                SELECT COALESCE(SUM(quantity), 0) FROM inventory_transactions
+                WHERE product_id = ? AND transaction_id > ?
+                  AND transaction_type != 'checkpoint' AND transaction_date <= ?
+            ''', (product_id, checkpoint['transaction_id'] if checkpoint else 0, timestamp))
+            tail = cursor.fetchone()[0]
+
+            return (checkpoint['quantity'] if checkpoint else 0) + tail
+
+    def get_inventory_transactions(self, product_id: int, limit: int = 50) -> List[Dict[str, Any]]:
+        """Get a product's latest stock movements, newest first"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT * FROM inventory_transactions
+                WHERE product_id = ? AND transaction_type != 'checkpoint'
+                ORDER BY transaction_id DESC
+                LIMIT ?
+            ''', (product_id, limit))
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
 
     # ===== CUSTOMER OPERATIONS =====
     def create_customer(self, customer: Customer) -> Optional[int]:
         """Create a new customer"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute('''
-                INSERT INTO customers (user_id, phone, address, city, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (customer.user_id, customer.phone, customer.address, 
-                  customer.city, customer.created_at))
-            conn.commit()
-            return cursor.lastrowid
-        except:
-            return None
-        finally:
-            conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('''
+                    INSERT INTO customers (user_id, phone, address, city, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (customer.user_id, customer.phone, customer.address, 
+                      customer.city, customer.created_at))
+                conn.commit()
+                return cursor.lastrowid
+            except:
+                return None
 
     def get_customer_by_user_id(self, user_id: int) -> Optional[Customer]:
         """Get customer by user ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM customers WHERE user_id = ?', (user_id,))
-        row = cursor.fetchone()
-        conn.close()
-        if row:
-            return Customer(row['customer_id'], row['user_id'], row['phone'],
-                          row['address'], row['city'], row['created_at'])
-        return None
+        return self._fetch_model(Customer, f'SELECT {CUSTOMER_COLUMNS} FROM customers WHERE user_id = ?',
+                                 (user_id,))
 
     def get_all_customers(self) -> List[Dict[str, Any]]:
         """Get all customers with user information"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT c.*, u.name, u.email 
+                FROM customers c
+                JOIN users u ON c.user_id = u.user_id
+                ORDER BY c.created_at DESC
+            ''')
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    def get_customers_page(self, cursor: Optional[Tuple] = None, backwards: bool = False,
+                           limit: int = config.ITEMS_PER_PAGE) -> Page:
+        """Get one page of customers with user information, newest first"""
+        return self._keyset_page('''
             SELECT c.*, u.name, u.email 
             FROM customers c
             JOIN users u ON c.user_id = u.user_id
-            ORDER BY c.created_at DESC
+        ''', 'c.created_at', 'c.customer_id',
+            lambda c: (c['created_at'], c['customer_id']), cursor, backwards, limit)
+
+    def search_customers(self, query: str, limit: int = config.ITEMS_PER_PAGE,
+                         offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Search customers by email prefix, phone prefix or name, best matches first
+        Ranks (``match_rank``): exact email, email prefix, phone prefix, name
+        starting with the query, any name word. Each source is an index seek
+        capped at ``offset + limit`` rows, so the cost follows the page size.
+        """
+        email = query.strip().lower()
+        if not email:
+            return []
+        wanted = offset + limit
+        sources, params = [], []
+
+        sources.append('''
+            SELECT user_id, CASE WHEN email_norm = ? THEN 0 ELSE 1 END, email_norm, 0 FROM users
+            WHERE email_norm >= ? AND email_norm < ?
+            ORDER BY email_norm LIMIT ?
         ''')
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        params += [email, email, _prefix_upper_bound(email), wanted]
+
+        phone = migrations.normalise_phone(email)
+        # Any number of digits: each prefix is an index seek capped at ``wanted``
+        # rows, so "07" costs no more than a full number
+        if phone.isdigit():
+            # Numbers are stored with the leading 0, which staff often leave off
+            for prefix in (phone,) if phone.startswith('0') else (phone, '0' + phone):
+                sources.append('''
+                    SELECT user_id, 2, phone_norm, 0 FROM customers
+                    WHERE phone_norm >= ? AND phone_norm < ?
+                    ORDER BY phone_norm LIMIT ?
+                ''')
+                params += [prefix, _prefix_upper_bound(prefix), wanted]
+
+        match = self._fts_match_expression(query)
+        if match and self.customer_fts_enabled:
+            # Newest accounts first within a rank: rowid order needs no sort
+            for rank, expression in ((3, '^' + match), (4, match)):
+                sources.append(f'''
+                    SELECT rowid, {rank}, '', -rowid FROM users_fts
+                    WHERE users_fts MATCH ?
+                    ORDER BY rowid DESC LIMIT ?
+                ''')
+                params += [expression, wanted]
+        elif match:
+            sources.append('''
+                SELECT user_id, 4, '', -user_id FROM users
+                WHERE name LIKE ?
+                ORDER BY user_id DESC LIMIT ?
+            ''')
+            params += [f'%{query.strip()}%', wanted]
+
+        hits = ' UNION ALL '.join(f'SELECT * FROM ({source})' for source in sources)
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            # MIN() makes the bare sort keys come from each customer's best hit
+            cursor.execute(f'''
+                WITH hits (user_id, match_rank, sort_text, sort_id) AS ({hits})
+                SELECT c.*, u.name, u.email, MIN(h.match_rank) AS match_rank,
+                       h.sort_text AS sort_text, h.sort_id AS sort_id
+                FROM hits h
+                JOIN customers c ON c.user_id = h.user_id
+                JOIN users u ON u.user_id = h.user_id
+                GROUP BY c.customer_id
+                ORDER BY match_rank, sort_text, sort_id, c.customer_id
+                LIMIT ? OFFSET ?
+            ''', params + [limit, offset])
+            results = []
+            for row in cursor.fetchall():
+                customer = dict(row)
+                del customer['sort_text'], customer['sort_id']
+                results.append(customer)
+            return results
+
+    def search_customers_page(self, query: str, cursor: Optional[Tuple] = None, backwards: bool = False,
+                              limit: int = config.ITEMS_PER_PAGE) -> Page:
+        """
+        One page of search_customers results
+        Ranked results have no sort key to seek from, so the cursors here are
+        (offset,) positions: a page runs forwards or backwards from one.
+        """
+        position = cursor[0] if cursor else 0
+        if backwards and cursor is not None:
+            start = max(0, position - limit)
+            items = self.search_customers(query, position - start, start)
+            return Page(items, next_cursor=(position,), prev_cursor=(start,) if start > 0 else None)
+
+        rows = self.search_customers(query, limit + 1, position)
+        items = rows[:limit]
+        return Page(items,
+                    next_cursor=(position + limit,) if len(rows) > limit else None,
+                    prev_cursor=(position,) if position > 0 and items else None)
 
     def update_customer(self, customer: Customer) -> bool:
         """Update customer information"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute('''
-                UPDATE customers 
-                SET phone = ?, address = ?, city = ?
-                WHERE customer_id = ?
-            ''', (customer.phone, customer.address, customer.city, customer.customer_id))
-            conn.commit()
-            return True
-        except:
-            return False
-        finally:
-            conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('''
+                    UPDATE customers 
+                    SET phone = ?, address = ?, city = ?
+                    WHERE customer_id = ?
+                ''', (customer.phone, customer.address, customer.city, customer.customer_id))
+                conn.commit()
+                return True
+            except:
+                return False
 
     # ===== ORDER OPERATIONS =====
     def create_order(self, order: Order, order_items: List[OrderItem]) -> Optional[int]:
-        """Create a new order with items"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        """
+        Create a new order with items
+        Stock is reserved line by line with a guarded UPDATE inside the order
+        transaction, so concurrent checkouts can never drive it negative.
+        Raises InsufficientStockError naming the line that ran out.
+        """
         try:
-            # Insert order
-            cursor.execute('''
-                INSERT INTO orders (customer_id, user_id, order_date, total_amount, 
-                                   status, payment_method, shipping_address)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (order.customer_id, order.user_id, order.order_date, order.total_amount,
-                  order.status, order.payment_method, order.shipping_address))
-            order_id = cursor.lastrowid
+            with self.transaction() as conn:
+                cursor = conn.cursor()
 
-            # Insert order items
-            for item in order_items:
+                # Insert order
                 cursor.execute('''
+                    INSERT INTO orders (customer_id, user_id, order_date, total_amount, 
+                                       status, payment_method, shipping_address)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (order.customer_id, order.user_id, order.order_date, order.total_amount,
+                      order.status, order.payment_method, order.shipping_address))
+                order_id = cursor.lastrowid
+
+                # Reserve stock - each line only succeeds if enough is left
+                for item in order_items:
+                    self._reserve_stock(cursor, item.product_id, item.quantity)
+
+                # Insert order items in one batch
+                cursor.executemany('''
                     INSERT INTO order_items (order_id, product_id, quantity, unit_price, subtotal)
                     VALUES (?, ?, ?, ?, ?)
-                ''', (order_id, item.product_id, item.quantity, item.unit_price, item.subtotal))
+                ''', [(order_id, item.product_id, item.quantity, item.unit_price, item.subtotal)
+                      for item in order_items])
 
-                # Update stock
-                cursor.execute('''
-                    UPDATE products 
-                    SET stock_quantity = stock_quantity - ?
-                    WHERE product_id = ?
-                ''', (item.quantity, item.product_id))
+                # Log the sale, one batch per order
+                self._record_movements(cursor, [(item.product_id, 'sale', -item.quantity,
+                                                 f"Order #{order_id}") for item in order_items],
+                                       order.order_date)
 
-            conn.commit()
-            return order_id
+                return order_id
+        except CheckoutError:
+            raise
         except Exception as e:
             print(f"Error creating order: {e}")
-            conn.rollback()
             return None
-        finally:
-            conn.close()
+
+    def _reserve_stock(self, cursor, product_id: int, quantity: int):
+        """Decrement stock if enough is left, otherwise raise CheckoutError"""
+        cursor.execute('''
+            UPDATE products 
+            SET stock_quantity = stock_quantity - ?
+            WHERE product_id = ? AND stock_quantity >= ?
+        ''', (quantity, product_id, quantity))
+        if cursor.rowcount == 1:
+            return
+
+        cursor.execute('SELECT name, stock_quantity FROM products WHERE product_id = ?',
+                       (product_id,))
+        row = cursor.fetchone()
+        if not row:
+            raise CheckoutError(f"Product not found: {product_id}")
+        raise InsufficientStockError(product_id, row['name'], quantity, row['stock_quantity'])
+
+    def checkout_from_cart(self, user_id: int, payment_method: str,
+                           shipping_address: Optional[str] = None) -> int:
+        """
+        Turn the user's cart into a pending order in a single transaction
+        Validates stock, inserts the order and its items, decrements stock and
+        empties the cart with a fixed number of statements however many lines
+        the cart has. The shipping address defaults to the customer's address.
+        Returns the new order ID; raises CheckoutError (or its subclass
+        InsufficientStockError) after rolling back.
+        """
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+
+            # Validate every line at once
+            cursor.execute('''
+                SELECT c.product_id, p.name, SUM(c.quantity) AS requested,
+                       p.stock_quantity, p.product_id IS NULL AS missing
+                FROM cart c
+                LEFT JOIN products p ON p.product_id = c.product_id
+                WHERE c.user_id = ?
+                GROUP BY c.product_id
+                HAVING missing OR p.stock_quantity < SUM(c.quantity)
+                ORDER BY MIN(c.cart_id)
+                LIMIT 1
+            ''', (user_id,))
+            shortfall = cursor.fetchone()
+            if shortfall:
+                if shortfall['missing']:
+                    raise CheckoutError(f"Product not found: {shortfall['product_id']}")
+                raise InsufficientStockError(shortfall['product_id'], shortfall['name'],
+                                             shortfall['requested'], shortfall['stock_quantity'])
+
+            cursor.execute('''
+                SELECT COUNT(*) AS line_count, COUNT(DISTINCT c.product_id) AS product_count,
+                       SUM(c.quantity * p.price) AS total
+                FROM cart c
+                JOIN products p ON p.product_id = c.product_id
+                WHERE c.user_id = ?
+            ''', (user_id,))
+            totals = cursor.fetchone()
+            if not totals['line_count']:
+                raise CheckoutError("Cart is empty")
+
+            # Insert order
+            order_date = datetime.now().isoformat()
+            cursor.execute('''
+                INSERT INTO orders (customer_id, user_id, order_date, total_amount,
+                                   status, payment_method, shipping_address)
+                VALUES ((SELECT customer_id FROM customers WHERE user_id = ?), ?, ?, ?,
+                        'pending', ?,
+                        COALESCE(?, (SELECT address FROM customers WHERE user_id = ?), ''))
+            ''', (user_id, user_id, order_date, totals['total'],
+                  payment_method, shipping_address, user_id))
+            order_id = cursor.lastrowid
+
+            # Insert order items straight from the cart
+            cursor.execute('''
+                INSERT INTO order_items (order_id, product_id, quantity, unit_price, subtotal)
+                SELECT ?, c.product_id, c.quantity, p.price, p.price * c.quantity
+                FROM cart c
+                JOIN products p ON p.product_id = c.product_id
+                WHERE c.user_id = ?
+                ORDER BY c.cart_id
+            ''', (order_id, user_id))
+
+            # Update stock, guarded so no product can go negative
+            cursor.execute('''
+                WITH wanted AS (
+                    SELECT product_id, SUM(quantity) AS quantity
+                    FROM cart WHERE user_id = ?
+                    GROUP BY product_id
+                )
+                UPDATE products
+                SET stock_quantity = stock_quantity - (
+                    SELECT quantity FROM wanted WHERE wanted.product_id = products.product_id
+                )
+                WHERE product_id IN (SELECT product_id FROM wanted)
+                  AND stock_quantity >= (
+                    SELECT quantity FROM wanted WHERE wanted.product_id = products.product_id
+                )
+            ''', (user_id,))
+            # rowcount is -1 for WITH statements; changes() also leaves out trigger writes
+            cursor.execute('SELECT changes()')
+            if cursor.fetchone()[0] != totals['product_count']:
+                raise CheckoutError("Stock changed during checkout, please try again")
+
+            # Log the sale, one ledger row per product
+            cursor.execute('''
+                INSERT INTO inventory_transactions (product_id, transaction_type, quantity,
+                                                    transaction_date, notes)
+                SELECT product_id, 'sale', -SUM(quantity), ?, ?
+                FROM order_items WHERE order_id = ?
+                GROUP BY product_id
+            ''', (order_date, f"Order #{order_id}", order_id))
+            cursor.execute('SELECT DISTINCT product_id FROM order_items WHERE order_id = ?',
+                           (order_id,))
+            product_ids = [row['product_id'] for row in cursor.fetchall()]
+            self._products_changed(conn, product_ids)
+            self._checkpoint_stock(cursor, product_ids, order_date)
+
+            # Clear cart
+            cursor.execute('DELETE FROM cart WHERE user_id = ?', (user_id,))
+            return order_id
 
     def get_order_by_id(self, order_id: int) -> Optional[Dict[str, Any]]:
         """Get order by ID with items"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.connection() as conn:
+            cursor = conn.cursor()
         
-        # Get order
-        cursor.execute('SELECT * FROM orders WHERE order_id = ?', (order_id,))
-        order_row = cursor.fetchone()
+            # Get order
+            cursor.execute('SELECT * FROM orders WHERE order_id = ?', (order_id,))
+            order_row = cursor.fetchone()
         
-        if not order_row:
-            conn.close()
-            return None
+            if not order_row:
+                return None
 
-        # Get order items
-        cursor.execute('''
-            SELECT oi.*, p.name as product_name
-            FROM order_items oi
-            JOIN products p ON oi.product_id = p.product_id
-            WHERE oi.order_id = ?
-        ''', (order_id,))
-        items_rows = cursor.fetchall()
+            # Get order items
+            cursor.execute('''
+                SELECT oi.*, p.name as product_name
+                FROM order_items oi
+                JOIN products p ON oi.product_id = p.product_id
+                WHERE oi.order_id = ?
+            ''', (order_id,))
+            items_rows = cursor.fetchall()
         
-        conn.close()
 
-        order_dict = dict(order_row)
-        order_dict['items'] = [dict(row) for row in items_rows]
-        return order_dict
+            order_dict = dict(order_row)
+            order_dict['items'] = [dict(row) for row in items_rows]
+            return order_dict
 
     def get_all_orders(self) -> List[Dict[str, Any]]:
         """Get all orders"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT o.*, u.name as customer_name
+                FROM orders o
+                LEFT JOIN users u ON o.user_id = u.user_id
+                ORDER BY o.order_date DESC
+            ''')
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    def get_orders_page(self, cursor: Optional[Tuple] = None, backwards: bool = False,
+                        limit: int = config.ITEMS_PER_PAGE) -> Page:
+        """Get one page of orders, newest first"""
+        return self._keyset_page('''
             SELECT o.*, u.name as customer_name
             FROM orders o
             LEFT JOIN users u ON o.user_id = u.user_id
-            ORDER BY o.order_date DESC
-        ''')
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        ''', 'o.order_date', 'o.order_id',
+            lambda o: (o['order_date'], o['order_id']), cursor, backwards, limit)
 
     def get_orders_by_user(self, user_id: int) -> List[Dict[str, Any]]:
         """Get orders by user ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM orders 
-            WHERE user_id = ?
-            ORDER BY order_date DESC
-        ''', (user_id,))
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT * FROM orders 
+                WHERE user_id = ?
+                ORDER BY order_date DESC
+            ''', (user_id,))
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
 
     def update_order_status(self, order_id: int, status: str) -> bool:
-        """Update order status"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        """
+        Update order status
+        Cancelling puts the order's items back in stock and logs the return.
+        A cancelled order cannot be reopened, since its stock was released.
+        Raises OrderStatusError for a missing order or a reopened one.
+        """
         try:
-            cursor.execute('UPDATE orders SET status = ? WHERE order_id = ?', 
-                          (status, order_id))
-            conn.commit()
-            return True
-        except:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT status FROM orders WHERE order_id = ?', (order_id,))
+                row = cursor.fetchone()
+                if not row:
+                    raise OrderStatusError("Order not found")
+                if row['status'] == 'cancelled':
+                    if status != 'cancelled':
+                        raise OrderStatusError("Cancelled orders cannot be reopened")
+                    return True
+
+                cursor.execute('UPDATE orders SET status = ? WHERE order_id = ?', 
+                              (status, order_id))
+
+                if status == 'cancelled':
+                    cursor.execute('''
+                        UPDATE products
+                        SET stock_quantity = stock_quantity + (
+                            SELECT SUM(quantity) FROM order_items
+                            WHERE order_id = ? AND product_id = products.product_id
+                        )
+                        WHERE product_id IN (SELECT product_id FROM order_items WHERE order_id = ?)
+                    ''', (order_id, order_id))
+                    cursor.execute('''
+                        SELECT product_id, SUM(quantity) AS quantity FROM order_items
+                        WHERE order_id = ? GROUP BY product_id
+                    ''', (order_id,))
+                    self._record_movements(cursor, [(r['product_id'], 'cancellation', r['quantity'],
+                                                     f"Order #{order_id} cancelled")
+                                                    for r in cursor.fetchall()])
+                return True
+        except OrderStatusError:
+            raise
+        except Exception as e:
+            print(f"Error updating order status: {e}")
             return False
-        finally:
-            conn.close()
 
     # ===== CART OPERATIONS =====
     def add_to_cart(self, cart_item: CartItem) -> bool:
         """Add item to cart"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            # Check if item already in cart
-            cursor.execute('''
-                SELECT cart_id, quantity FROM cart 
-                WHERE user_id = ? AND product_id = ?
-            ''', (cart_item.user_id, cart_item.product_id))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update quantity
-                new_quantity = existing['quantity'] + cart_item.quantity
-                cursor.execute('''
-                    UPDATE cart SET quantity = ? 
-                    WHERE cart_id = ?
-                ''', (new_quantity, existing['cart_id']))
-            else:
-                # Insert new item
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                # Check if item already in cart
                 cursor.execute('''
-                    INSERT INTO cart (user_id, product_id, quantity, added_at)
-                    VALUES (?, ?, ?, ?)
-                ''', (cart_item.user_id, cart_item.product_id, 
-                      cart_item.quantity, cart_item.added_at))
+                    SELECT cart_id, quantity FROM cart 
+                    WHERE user_id = ? AND product_id = ?
+                ''', (cart_item.user_id, cart_item.product_id))
+                existing = cursor.fetchone()
+
+                if existing:
+                    # Update quantity
+                    new_quantity = existing['quantity'] + cart_item.quantity
+                    cursor.execute('''
+                        UPDATE cart SET quantity = ? 
+                        WHERE cart_id = ?
+                    ''', (new_quantity, existing['cart_id']))
+                else:
+                    # Insert new item
+                    cursor.execute('''
+                        INSERT INTO cart (user_id, product_id, quantity, added_at)
+                        VALUES (?, ?, ?, ?)
+                    ''', (cart_item.user_id, cart_item.product_id, 
+                          cart_item.quantity, cart_item.added_at))
             
-            conn.commit()
-            return True
-        except Exception as e:
-            print(f"Error adding to cart: {e}")
-            return False
-        finally:
-            conn.close()
+                conn.commit()
+                return True
+            except Exception as e:
+                print(f"Error adding to cart: {e}")
+                return False
 
     def get_cart_items(self, user_id: int) -> List[Dict[str, Any]]:
         """Get cart items for user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT c.*, p.name, p.price, p.stock_quantity, p.image_path
-            FROM cart c
-            JOIN products p ON c.product_id = p.product_id
-            WHERE c.user_id = ?
-            ORDER BY c.added_at DESC
-        ''', (user_id,))
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT c.*, p.name, p.price, p.stock_quantity, p.image_path
+                FROM cart c
+                JOIN products p ON c.product_id = p.product_id
+                WHERE c.user_id = ?
+                ORDER BY c.added_at DESC
+            ''', (user_id,))
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
 
     def update_cart_item_quantity(self, cart_id: int, quantity: int) -> bool:
         """Update cart item quantity"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute('UPDATE cart SET quantity = ? WHERE cart_id = ?', 
-                          (quantity, cart_id))
-            conn.commit()
-            return True
-        except:
-            return False
-        finally:
-            conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('UPDATE cart SET quantity = ? WHERE cart_id = ?', 
+                              (quantity, cart_id))
+                conn.commit()
+                return True
+            except:
+                return False
 
     def remove_from_cart(self, cart_id: int) -> bool:
         """Remove item from cart"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute('DELETE FROM cart WHERE cart_id = ?', (cart_id,))
-            conn.commit()
-            return True
-        except:
-            return False
-        finally:
-            conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('DELETE FROM cart WHERE cart_id = ?', (cart_id,))
+                conn.commit()
+                return True
+            except:
+                return False
 
     def clear_cart(self, user_id: int) -> bool:
         """Clear all items from user's cart"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute('DELETE FROM cart WHERE user_id = ?', (user_id,))
-            conn.commit()
-            return True
-        except:
-            return False
-        finally:
-            conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('DELETE FROM cart WHERE user_id = ?', (user_id,))
+                conn.commit()
+                return True
+            except:
+                return False
 
     # ===== SUPPLIER OPERATIONS =====
     def create_supplier(self, supplier: Supplier) -> Optional[int]:
         """Create a new supplier"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute('''
-                INSERT INTO suppliers (name, contact_person, email, phone, address, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (supplier.name, supplier.contact_person, supplier.email,
-                  supplier.phone, supplier.address, supplier.created_at))
-            conn.commit()
-            return cursor.lastrowid
-        except:
-            return None
-        finally:
-            conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('''
+                    INSERT INTO suppliers (name, contact_person, email, phone, address, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (supplier.name, supplier.contact_person, supplier.email,
+                      supplier.phone, supplier.address, supplier.created_at))
+                conn.commit()
+                return cursor.lastrowid
+            except:
+                return None
+
+    def create_suppliers_bulk(self, suppliers: List[Supplier],
+                              chunk_size: int = config.BULK_CHUNK_SIZE) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Insert many suppliers with executemany, one transaction per chunk
+        Returns: one (supplier_id, error) pair per input supplier, in order
+        """
+        rows = [(s.name, s.contact_person, s.email, s.phone, s.address, s.created_at)
+                for s in suppliers]
+        return self._insert_bulk('suppliers', ('name', 'contact_person', 'email', 'phone',
+                                               'address', 'created_at'), rows, chunk_size)
 
     def get_all_suppliers(self) -> List[Supplier]:
         """Get all suppliers"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM suppliers ORDER BY name')
-        rows = cursor.fetchall()
-        conn.close()
-        return [Supplier(row['supplier_id'], row['name'], row['contact_person'],
-                        row['email'], row['phone'], row['address'], row['created_at']) 
-                for row in rows]
+        return self._fetch_models(Supplier, f'SELECT {SUPPLIER_COLUMNS} FROM suppliers ORDER BY name')
 
     # ===== STATISTICS =====
     def get_dashboard_stats(self) -> Dict[str, Any]:
-        """Get dashboard statistics"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        """Get dashboard statistics from the trigger-maintained counters row"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM stats_counters WHERE id = 1')
+            counters = cursor.fetchone()
 
-        stats = {}
+        return {
+            'total_products': counters['total_products'],
+            'total_customers': counters['total_customers'],
+            'total_orders': counters['total_orders'],
+            'total_sales': counters['total_sales_cents'] / 100,
+            'low_stock_products': counters['low_stock_products'],
+            'pending_orders': counters['pending_orders']
+        }
 
-        # Total products
-        cursor.execute('SELECT COUNT(*) as count FROM products')
-        stats['total_products'] = cursor.fetchone()['count']
+    def verify_stats_counters(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Compare the stored counters with a fresh count
+        Returns: {counter: (stored, actual)} for every counter that drifted
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM stats_counters WHERE id = 1')
+            stored = cursor.fetchone()
+            if stored is None:
+                return {name: (None, None) for name in migrations.STATS_COUNTERS}
+            cursor.execute(migrations.STATS_COUNTERS_QUERY, (stored['low_stock_threshold'],))
+            actual = cursor.fetchone()
 
-        # Total customers
-        cursor.execute('SELECT COUNT(*) as count FROM customers')
-        stats['total_customers'] = cursor.fetchone()['count']
+        return {name: (stored[name], actual[name])
+                for name in migrations.STATS_COUNTERS if stored[name] != actual[name]}
 
-        # Total orders
-        cursor.execute('SELECT COUNT(*) as count FROM orders')
-        stats['total_orders'] = cursor.fetchone()['count']
+    def verify_sales_rollup(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Compare the daily sales rollup's totals with the completed orders
+        Returns: {total: (stored, actual)} for every total that drifted
+        """
+        with self.connection() as conn:
+            row = conn.execute(migrations.SALES_ROLLUP_QUERY).fetchone()
 
-        # Total sales
-        cursor.execute('SELECT SUM(total_amount) as total FROM orders WHERE status = "completed"')
-        result = cursor.fetchone()
-        stats['total_sales'] = result['total'] if result['total'] else 0
+        return {f"daily_sales.{name}": (row[f'stored_{name}'], row[f'actual_{name}'])
+                for name in migrations.SALES_ROLLUP_TOTALS
+                if row[f'stored_{name}'] != row[f'actual_{name}']}
 
-        # Low stock products
-        cursor.execute(f'SELECT COUNT(*) as count FROM products WHERE stock_quantity < {config.LOW_STOCK_THRESHOLD}')
-        stats['low_stock_products'] = cursor.fetchone()['count']
+    def rebuild_stats_counters(self, low_stock_threshold: int = config.LOW_STOCK_THRESHOLD) -> Dict[str, Tuple[int, int]]:
+        """
+        Recompute the dashboard counters from scratch, then verify them
+        Returns: the counters that still disagree (empty when the rebuild is good)
+        """
+        with self.transaction() as conn:
+            migrations.rebuild_stats_counters(conn, low_stock_threshold)
+        return self.verify_stats_counters()
 
-        # Recent orders
-        cursor.execute('SELECT COUNT(*) as count FROM orders WHERE status = "pending"')
-        stats['pending_orders'] = cursor.fetchone()['count']
+    def get_sales_data(self, start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
+        """Get daily sales for reports from the rollup kept by the order status triggers"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
 
-        conn.close()
-        return stats
+            query = '''
+                SELECT
+                    sale_date as date,
+                    order_count,
+                    revenue_cents / 100.0 as total_sales,
+                    units,
+                    profit_cents / 100.0 as profit
+                FROM daily_sales
+                WHERE 1 = 1
+            '''
 
-    def get_sales_data(self, start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
-        """Get sales data for reports"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        query = '''
-            SELECT 
-                DATE(order_date) as date,
-                COUNT(*) as order_count,
-                SUM(total_amount) as total_sales
-            FROM orders
-            WHERE status = "completed"
-        '''
-        
-        params = []
-        if start_date:
-            query += ' AND DATE(order_date) >= ?'
-            params.append(start_date)
-        if end_date:
-            query += ' AND DATE(order_date) <= ?'
-            params.append(end_date)
-            
-        query += ' GROUP BY DATE(order_date) ORDER BY date DESC'
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+            params = []
+            if start_date:
+                query += ' AND sale_date >= ?'
+                params.append(start_date)
+            if end_date:
+                query += ' AND sale_date <= ?'
+                params.append(end_date)
+
+            query += ' ORDER BY sale_date DESC'
+
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    def rebuild_sales_rollup(self):
+        """Recompute the sales rollup from completed orders"""
+        with self.transaction() as conn:
+            migrations.rebuild_sales_rollup(conn)
@@ -0,0 +1,39 @@
+"""
+Database maintenance commands for Girlush Collections
+Usage: python -m database.maintenance {rebuild-stats,verify-stats,rebuild-sales} [--db PATH]
+"""
+import argparse
+import sys
+import config
+from database.database_manager import DatabaseManager
+
+def report(drift) -> int:
+    """Print counter drift; return the process exit code"""
+    if not drift:
+        print("✓ Dashboard counters and sales rollup match the tables")
+        return 0
+    for name, (stored, actual) in drift.items():
+        print(f"✗ {name}: stored {stored}, actual {actual}")
+    return 1
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Database maintenance")
+    parser.add_argument('command', choices=['rebuild-stats', 'verify-stats', 'rebuild-sales'])
+    parser.add_argument('--db', default=config.DATABASE_PATH, help="database file")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db)
+    try:
+        if args.command == 'rebuild-stats':
+            print("Rebuilding dashboard counters...")
+            return report(db.rebuild_stats_counters())
+        if args.command == 'rebuild-sales':
+            db.rebuild_sales_rollup()
+            print(f"✓ Sales rollup rebuilt: {len(db.get_sales_data())} days")
+            return 0
+        return report({**db.verify_stats_counters(), **db.verify_sales_rollup()})
+    finally:
+        db.close()
+
+if __name__ == '__main__':
+    sys.exit(main())
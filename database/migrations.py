@@ -0,0 +1,627 @@
+"""
+Schema migrations for Girlush Collections Inventory Management System
+Each migration runs once; the applied version is kept in PRAGMA user_version
+"""
+import sqlite3
+from datetime import datetime
+from typing import Callable, List, Tuple, Union
+import config
+
+# A step is either an SQL statement or a callable taking the connection
+Step = Union[str, Callable[[sqlite3.Connection], None]]
+
+def _create_product_search_index(conn: sqlite3.Connection):
+    """Create the FTS5 product index when this SQLite build supports it"""
+    try:
+        conn.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+                name, description, category,
+                content='products', content_rowid='product_id',
+                prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+            )
+        ''')
+    except sqlite3.OperationalError:
+        return  # No FTS5 - product search falls back to LIKE
+
+    # Keep the external-content index in sync with products
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS products_fts_insert AFTER INSERT ON products BEGIN
+            INSERT INTO products_fts (rowid, name, description, category)
+            VALUES (new.product_id, new.name, new.description, new.category);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS products_fts_delete AFTER DELETE ON products BEGIN
+            INSERT INTO products_fts (products_fts, rowid, name, description, category)
+            VALUES ('delete', old.product_id, old.name, old.description, old.category);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS products_fts_update
+        AFTER UPDATE OF name, description, category ON products BEGIN
+            INSERT INTO products_fts (products_fts, rowid, name, description, category)
+            VALUES ('delete', old.product_id, old.name, old.description, old.category);
+            INSERT INTO products_fts (rowid, name, description, category)
+            VALUES (new.product_id, new.name, new.description, new.category);
+        END
+    ''')
+    conn.execute("INSERT INTO products_fts (products_fts) VALUES ('rebuild')")
+
+
+# Exact dashboard counters, recomputed from scratch. Sales are summed in whole
+# cents so the trigger-maintained total never drifts from a fresh SUM().
+# Parameter: low stock threshold
+STATS_COUNTERS = ('total_products', 'low_stock_products', 'total_customers',
+                  'total_orders', 'total_sales_cents', 'pending_orders')
+
+STATS_COUNTERS_QUERY = '''
+    SELECT
+        (SELECT COUNT(*) FROM products) AS total_products,
+        (SELECT COUNT(*) FROM products WHERE stock_quantity < ?) AS low_stock_products,
+        (SELECT COUNT(*) FROM customers) AS total_customers,
+        (SELECT COUNT(*) FROM orders) AS total_orders,
+        (SELECT COALESCE(SUM(CAST(ROUND(total_amount * 100) AS INTEGER)), 0)
+         FROM orders WHERE status = 'completed') AS total_sales_cents,
+        (SELECT COUNT(*) FROM orders WHERE status = 'pending') AS pending_orders
+'''
+
+def rebuild_stats_counters(conn: sqlite3.Connection, low_stock_threshold: int):
+    """Recompute every dashboard counter; run inside a write transaction"""
+    conn.execute('INSERT OR IGNORE INTO stats_counters (id, low_stock_threshold) VALUES (1, ?)',
+                 (low_stock_threshold,))
+    conn.execute(f'''
+        UPDATE stats_counters
+        SET low_stock_threshold = ?, ({', '.join(STATS_COUNTERS)}) = ({STATS_COUNTERS_QUERY})
+        WHERE id = 1
+    ''', (low_stock_threshold, low_stock_threshold))
+
+def _create_stats_counters(conn: sqlite3.Connection):
+    """Fill the counters for a database that already has data"""
+    rebuild_stats_counters(conn, config.LOW_STOCK_THRESHOLD)
+
+def rebuild_sales_rollup(conn: sqlite3.Connection):
+    """Recompute ``sales`` and ``daily_sales`` from completed orders; run inside a write transaction"""
+    conn.execute('DELETE FROM daily_sales')
+    conn.execute('DELETE FROM sales')
+    conn.execute('''
+        INSERT INTO sales (order_id, sale_date, total_amount, profit, units)
+        SELECT o.order_id, DATE(o.order_date), o.total_amount,
+               COALESCE(SUM(oi.subtotal - oi.quantity * COALESCE(p.cost, 0)), 0),
+               COALESCE(SUM(oi.quantity), 0)
+        FROM orders o
+        LEFT JOIN order_items oi ON oi.order_id = o.order_id
+        LEFT JOIN products p ON p.product_id = oi.product_id
+        WHERE o.status = 'completed'
+        GROUP BY o.order_id
+    ''')
+    conn.execute('''
+        INSERT INTO daily_sales (sale_date, order_count, revenue_cents, units, profit_cents)
+        SELECT sale_date, COUNT(*),
+               SUM(CAST(ROUND(total_amount * 100) AS INTEGER)),
+               SUM(units),
+               SUM(CAST(ROUND(profit * 100) AS INTEGER))
+        FROM sales
+        GROUP BY sale_date
+    ''')
+
+def _open_inventory_ledger(conn: sqlite3.Connection):
+    """Checkpoint every product's current stock so history starts from a known level"""
+    conn.execute('''
+        INSERT INTO inventory_transactions (product_id, transaction_type, quantity,
+                                            transaction_date, notes)
+        SELECT product_id, 'checkpoint', stock_quantity, ?, 'Ledger opened'
+        FROM products
+    ''', (datetime.now().isoformat(),))
+
+# Characters dropped from phone numbers before matching; a leading 256
+# (Uganda's country code) becomes the local 0 so +256 772... finds 0772...
+PHONE_SEPARATORS = (' ', '-', '+', '(', ')', '.', '/')
+
+def normalise_phone(phone: str) -> str:
+    """Python twin of _phone_norm_sql, for normalising search input"""
+    for separator in PHONE_SEPARATORS:
+        phone = phone.replace(separator, '')
+    return '0' + phone[3:] if phone.startswith('256') else phone
+
+def _phone_norm_sql(column: str) -> str:
+    digits = column
+    for separator in PHONE_SEPARATORS:
+        digits = f"REPLACE({digits}, '{separator}', '')"
+    return f"(SELECT CASE WHEN d LIKE '256%' THEN '0' || SUBSTR(d, 4) ELSE d END FROM (SELECT {digits} AS d))"
+
+def _create_customer_search_index(conn: sqlite3.Connection):
+    """Create the FTS5 index on user names when this SQLite build supports it"""
+    try:
+        conn.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+                name, content='users', content_rowid='user_id',
+                prefix='1 2 3', tokenize='unicode61 remove_diacritics 2'
+            )
+        ''')
+    except sqlite3.OperationalError:
+        return  # No FTS5 - name search falls back to LIKE
+
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+            INSERT INTO users_fts (rowid, name) VALUES (new.user_id, new.name);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+            INSERT INTO users_fts (users_fts, rowid, name) VALUES ('delete', old.user_id, old.name);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE OF name ON users BEGIN
+            INSERT INTO users_fts (users_fts, rowid, name) VALUES ('delete', old.user_id, old.name);
+            INSERT INTO users_fts (rowid, name) VALUES (new.user_id, new.name);
+        END
+    ''')
+
+def rebuild_customer_search(conn: sqlite3.Connection):
+    """Recompute normalised emails and phones and the name index; run inside a write transaction"""
+    conn.execute('UPDATE users SET email_norm = LOWER(TRIM(email))')
+    conn.execute(f'UPDATE customers SET phone_norm = {_phone_norm_sql("phone")}')
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_fts'").fetchone():
+        conn.execute("INSERT INTO users_fts (users_fts) VALUES ('rebuild')")
+
+_SALES_CENTS = "CASE WHEN {row}.status = 'completed' THEN CAST(ROUND({row}.total_amount * 100) AS INTEGER) ELSE 0 END"
+
+# Trigger body adding order NEW to ``sales`` and its day of ``daily_sales``
+_RECORD_SALE = '''
+            INSERT INTO sales (order_id, sale_date, total_amount, profit, units)
+            SELECT NEW.order_id, DATE(NEW.order_date), NEW.total_amount,
+                   COALESCE(SUM(oi.subtotal - oi.quantity * COALESCE(p.cost, 0)), 0),
+                   COALESCE(SUM(oi.quantity), 0)
+            FROM order_items oi
+            LEFT JOIN products p ON p.product_id = oi.product_id
+            WHERE oi.order_id = NEW.order_id;
+
+            INSERT INTO daily_sales (sale_date, order_count, revenue_cents, units, profit_cents)
+            SELECT sale_date, 1, CAST(ROUND(total_amount * 100) AS INTEGER), units,
+                   CAST(ROUND(profit * 100) AS INTEGER)
+            FROM sales WHERE order_id = NEW.order_id AND true
+            ON CONFLICT(sale_date) DO UPDATE SET
+                order_count = order_count + 1,
+                revenue_cents = revenue_cents + excluded.revenue_cents,
+                units = units + excluded.units,
+                profit_cents = profit_cents + excluded.profit_cents;'''
+
+# Profit of order item NEW at its product's current cost
+_ITEM_PROFIT = "(NEW.subtotal - NEW.quantity * COALESCE((SELECT cost FROM products WHERE product_id = NEW.product_id), 0))"
+
+# Completed orders and units in the rollup, against a fresh count from the orders.
+# Profit is left out: the rollup fixes it at completion, so later cost changes
+# rightly make it differ from a recount.
+SALES_ROLLUP_TOTALS = ('order_count', 'revenue_cents', 'units')
+
+SALES_ROLLUP_QUERY = '''
+    SELECT
+        (SELECT COALESCE(SUM(order_count), 0) FROM daily_sales) AS stored_order_count,
+        (SELECT COALESCE(SUM(revenue_cents), 0) FROM daily_sales) AS stored_revenue_cents,
+        (SELECT COALESCE(SUM(units), 0) FROM daily_sales) AS stored_units,
+        (SELECT COUNT(*) FROM orders WHERE status = 'completed') AS actual_order_count,
+        (SELECT COALESCE(SUM(CAST(ROUND(total_amount * 100) AS INTEGER)), 0)
+         FROM orders WHERE status = 'completed') AS actual_revenue_cents,
+        (SELECT COALESCE(SUM(oi.quantity), 0) FROM order_items oi
+         JOIN orders o ON o.order_id = oi.order_id WHERE o.status = 'completed') AS actual_units
+'''
+
+# Tables whose writes bump a row of table_changes, for the change detector
+TRACKED_TABLES = ('users', 'customers', 'suppliers', 'products', 'orders', 'order_items',
+                  'cart', 'inventory_transactions')
+
+def _create_change_counters(conn: sqlite3.Connection):
+    """One counter row per tracked table, bumped by every row written"""
+    conn.executemany('INSERT OR IGNORE INTO table_changes (table_name) VALUES (?)',
+                     [(table,) for table in TRACKED_TABLES])
+    for table in TRACKED_TABLES:
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_changes_{event.lower()} AFTER {event} ON {table} BEGIN
+                    UPDATE table_changes SET change_count = change_count + 1
+                    WHERE table_name = '{table}';
+                END
+            ''')
+
+MIGRATIONS: List[Tuple[int, str, List[Step]]] = [
+    (1, "Initial schema", [
+        # Users table
+        '''
+        CREATE TABLE IF NOT EXISTS users (
+            user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL,
+            name TEXT NOT NULL,
+            role TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        ''',
+
+        # Products table
+        '''
+        CREATE TABLE IF NOT EXISTS products (
+            product_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            description TEXT,
+            category TEXT,
+            price REAL NOT NULL,
+            cost REAL,
+            stock_quantity INTEGER NOT NULL,
+            supplier_id INTEGER,
+            image_path TEXT,
+            created_at TEXT NOT NULL,
+            FOREIGN KEY (supplier_id) REFERENCES suppliers(supplier_id)
+        )
+        ''',
+
+        # Customers table
+        '''
+        CREATE TABLE IF NOT EXISTS customers (
+            customer_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER UNIQUE,
+            phone TEXT,
+            address TEXT,
+            city TEXT,
+            created_at TEXT NOT NULL,
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+        ''',
+
+        # Orders table
+        '''
+        CREATE TABLE IF NOT EXISTS orders (
+            order_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            customer_id INTEGER,
+            user_id INTEGER,
+            order_date TEXT NOT NULL,
+            total_amount REAL NOT NULL,
+            status TEXT NOT NULL,
+            payment_method TEXT,
+            shipping_address TEXT,
+            FOREIGN KEY (customer_id) REFERENCES customers(customer_id),
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+        ''',
+
+        # Order Items table
+        '''
+        CREATE TABLE IF NOT EXISTS order_items (
+            item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            order_id INTEGER NOT NULL,
+            product_id INTEGER NOT NULL,
+            quantity INTEGER NOT NULL,
+            unit_price REAL NOT NULL,
+            subtotal REAL NOT NULL,
+            FOREIGN KEY (order_id) REFERENCES orders(order_id),
+            FOREIGN KEY (product_id) REFERENCES products(product_id)
+        )
+        ''',
+
+        # Suppliers table
+        '''
+        CREATE TABLE IF NOT EXISTS suppliers (
+            supplier_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            contact_person TEXT,
+            email TEXT,
+            phone TEXT,
+            address TEXT,
+            created_at TEXT NOT NULL
+        )
+        ''',
+
+        # Cart table
+        '''
+        CREATE TABLE IF NOT EXISTS cart (
+            cart_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            product_id INTEGER NOT NULL,
+            quantity INTEGER NOT NULL,
+            added_at TEXT NOT NULL,
+            FOREIGN KEY (user_id) REFERENCES users(user_id),
+            FOREIGN KEY (product_id) REFERENCES products(product_id)
+        )
+        ''',
+
+        # Sales table (for reporting)
+        '''
+        CREATE TABLE IF NOT EXISTS sales (
+            sale_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            order_id INTEGER NOT NULL,
+            sale_date TEXT NOT NULL,
+            total_amount REAL NOT NULL,
+            profit REAL,
+            FOREIGN KEY (order_id) REFERENCES orders(order_id)
+        )
+        ''',
+
+        # Inventory Transactions table
+        '''
+        CREATE TABLE IF NOT EXISTS inventory_transactions (
+            transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            product_id INTEGER NOT NULL,
+            transaction_type TEXT NOT NULL,
+            quantity INTEGER NOT NULL,
+            transaction_date TEXT NOT NULL,
+            notes TEXT,
+            FOREIGN KEY (product_id) REFERENCES products(product_id)
+        )
+        '''
+    ]),
+    (2, "Secondary indexes for lookups, joins and dashboard aggregates", [
+        # get_orders_by_user: WHERE user_id = ? ORDER BY order_date DESC
+        'CREATE INDEX IF NOT EXISTS idx_orders_user_date ON orders(user_id, order_date)',
+        # get_dashboard_stats: completed sales total and pending count
+        'CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status, total_amount)',
+        # get_all_orders / get_sales_data: ORDER BY and ranges on order_date
+        'CREATE INDEX IF NOT EXISTS idx_orders_date ON orders(order_date)',
+        # get_order_by_id: items of one order
+        'CREATE INDEX IF NOT EXISTS idx_order_items_order ON order_items(order_id)',
+        # get_cart_items / add_to_cart: one user's cart, one product in it
+        'CREATE INDEX IF NOT EXISTS idx_cart_user_product ON cart(user_id, product_id)',
+        # get_products_by_category: WHERE category = ? ORDER BY name
+        'CREATE INDEX IF NOT EXISTS idx_products_category_name ON products(category, name)',
+        # get_dashboard_stats: low stock count
+        'CREATE INDEX IF NOT EXISTS idx_products_stock ON products(stock_quantity)',
+        # get_all_products: ORDER BY created_at DESC
+        'CREATE INDEX IF NOT EXISTS idx_products_created ON products(created_at)'
+    ]),
+    (3, "Full-text product search", [
+        _create_product_search_index
+    ]),
+    (4, "Sort indexes for keyset pagination", [
+        # get_customers_page / get_users_page: ORDER BY created_at DESC, id DESC
+        'CREATE INDEX IF NOT EXISTS idx_customers_created ON customers(created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_users_created ON users(created_at)'
+    ]),
+    (5, "Trigger-maintained dashboard counters", [
+        '''
+        CREATE TABLE IF NOT EXISTS stats_counters (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_products INTEGER NOT NULL DEFAULT 0,
+            low_stock_products INTEGER NOT NULL DEFAULT 0,
+            total_customers INTEGER NOT NULL DEFAULT 0,
+            total_orders INTEGER NOT NULL DEFAULT 0,
+            total_sales_cents INTEGER NOT NULL DEFAULT 0,
+            pending_orders INTEGER NOT NULL DEFAULT 0,
+            low_stock_threshold INTEGER NOT NULL
+        )
+        ''',
+        _create_stats_counters,
+
+        # Products: count and low stock (threshold stored alongside the count)
+        '''
+        CREATE TRIGGER IF NOT EXISTS products_stats_insert AFTER INSERT ON products BEGIN
+            UPDATE stats_counters SET
+                total_products = total_products + 1,
+                low_stock_products = low_stock_products + (NEW.stock_quantity < low_stock_threshold)
+            WHERE id = 1;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS products_stats_delete AFTER DELETE ON products BEGIN
+            UPDATE stats_counters SET
+                total_products = total_products - 1,
+                low_stock_products = low_stock_products - (OLD.stock_quantity < low_stock_threshold)
+            WHERE id = 1;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS products_stats_update AFTER UPDATE OF stock_quantity ON products
+        WHEN NEW.stock_quantity IS NOT OLD.stock_quantity BEGIN
+            UPDATE stats_counters SET
+                low_stock_products = low_stock_products
+                    + (NEW.stock_quantity < low_stock_threshold)
+                    - (OLD.stock_quantity < low_stock_threshold)
+            WHERE id = 1;
+        END
+        ''',
+
+        # Customers: count
+        '''
+        CREATE TRIGGER IF NOT EXISTS customers_stats_insert AFTER INSERT ON customers BEGIN
+            UPDATE stats_counters SET total_customers = total_customers + 1 WHERE id = 1;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS customers_stats_delete AFTER DELETE ON customers BEGIN
+            UPDATE stats_counters SET total_customers = total_customers - 1 WHERE id = 1;
+        END
+        ''',
+
+        # Orders: count, completed sales and pending count
+        f'''
+        CREATE TRIGGER IF NOT EXISTS orders_stats_insert AFTER INSERT ON orders BEGIN
+            UPDATE stats_counters SET
+                total_orders = total_orders + 1,
+                total_sales_cents = total_sales_cents + {_SALES_CENTS.format(row='NEW')},
+                pending_orders = pending_orders + (NEW.status = 'pending')
+            WHERE id = 1;
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS orders_stats_delete AFTER DELETE ON orders BEGIN
+            UPDATE stats_counters SET
+                total_orders = total_orders - 1,
+                total_sales_cents = total_sales_cents - {_SALES_CENTS.format(row='OLD')},
+                pending_orders = pending_orders - (OLD.status = 'pending')
+            WHERE id = 1;
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS orders_stats_update AFTER UPDATE OF status, total_amount ON orders BEGIN
+            UPDATE stats_counters SET
+                total_sales_cents = total_sales_cents
+                    + {_SALES_CENTS.format(row='NEW')}
+                    - {_SALES_CENTS.format(row='OLD')},
+                pending_orders = pending_orders + (NEW.status = 'pending') - (OLD.status = 'pending')
+            WHERE id = 1;
+        END
+        '''
+    ]),
+    (6, "Daily sales rollup maintained from order status changes", [
+        'ALTER TABLE sales ADD COLUMN units INTEGER NOT NULL DEFAULT 0',
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_sales_order ON sales(order_id)',
+        '''
+        CREATE TABLE IF NOT EXISTS daily_sales (
+            sale_date TEXT PRIMARY KEY,
+            order_count INTEGER NOT NULL,
+            revenue_cents INTEGER NOT NULL,
+            units INTEGER NOT NULL,
+            profit_cents INTEGER NOT NULL
+        )
+        ''',
+        rebuild_sales_rollup,
+
+        # Completing an order records its sale and adds it to its day. Profit
+        # is fixed at completion so reversing it subtracts exactly what was added.
+        f'''
+        CREATE TRIGGER IF NOT EXISTS orders_sales_complete AFTER UPDATE OF status ON orders
+        WHEN NEW.status = 'completed' AND OLD.status IS NOT 'completed' BEGIN
+            {_RECORD_SALE}
+        END
+        ''',
+        # Cancelling (or otherwise leaving 'completed') takes it back out
+        '''
+        CREATE TRIGGER IF NOT EXISTS orders_sales_reverse AFTER UPDATE OF status ON orders
+        WHEN OLD.status = 'completed' AND NEW.status IS NOT 'completed' BEGIN
+            UPDATE daily_sales SET
+                order_count = order_count - 1,
+                revenue_cents = revenue_cents - (SELECT CAST(ROUND(total_amount * 100) AS INTEGER)
+                                                 FROM sales WHERE order_id = OLD.order_id),
+                units = units - (SELECT units FROM sales WHERE order_id = OLD.order_id),
+                profit_cents = profit_cents - (SELECT CAST(ROUND(profit * 100) AS INTEGER)
+                                               FROM sales WHERE order_id = OLD.order_id)
+            WHERE sale_date = (SELECT sale_date FROM sales WHERE order_id = OLD.order_id);
+            DELETE FROM daily_sales WHERE order_count = 0
+              AND sale_date = (SELECT sale_date FROM sales WHERE order_id = OLD.order_id);
+            DELETE FROM sales WHERE order_id = OLD.order_id;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS orders_sales_delete AFTER DELETE ON orders
+        WHEN OLD.status = 'completed' BEGIN
+            UPDATE daily_sales SET
+                order_count = order_count - 1,
+                revenue_cents = revenue_cents - (SELECT CAST(ROUND(total_amount * 100) AS INTEGER)
+                                                 FROM sales WHERE order_id = OLD.order_id),
+                units = units - (SELECT units FROM sales WHERE order_id = OLD.order_id),
+                profit_cents = profit_cents - (SELECT CAST(ROUND(profit * 100) AS INTEGER)
+                                               FROM sales WHERE order_id = OLD.order_id)
+            WHERE sale_date = (SELECT sale_date FROM sales WHERE order_id = OLD.order_id);
+            DELETE FROM daily_sales WHERE order_count = 0
+              AND sale_date = (SELECT sale_date FROM sales WHERE order_id = OLD.order_id);
+            DELETE FROM sales WHERE order_id = OLD.order_id;
+        END
+        '''
+    ]),
+    (7, "Inventory ledger with stock checkpoints", [
+        # Both indexes end in the rowid (transaction_id): the latest checkpoint
+        # of a product and the movements after it are each one index range
+        'CREATE INDEX IF NOT EXISTS idx_inventory_product_type ON inventory_transactions(product_id, transaction_type)',
+        'CREATE INDEX IF NOT EXISTS idx_inventory_product ON inventory_transactions(product_id)',
+        _open_inventory_ledger
+    ]),
+    (8, "Customer search on normalised email, phone and an indexed name", [
+        'ALTER TABLE users ADD COLUMN email_norm TEXT',
+        'ALTER TABLE customers ADD COLUMN phone_norm TEXT',
+        # Prefix searches are range seeks on these: col >= 'abc' AND col < 'abd'
+        'CREATE INDEX IF NOT EXISTS idx_users_email_norm ON users(email_norm)',
+        'CREATE INDEX IF NOT EXISTS idx_customers_phone_norm ON customers(phone_norm)',
+        '''
+        CREATE TRIGGER IF NOT EXISTS users_email_norm_insert AFTER INSERT ON users BEGIN
+            UPDATE users SET email_norm = LOWER(TRIM(NEW.email)) WHERE user_id = NEW.user_id;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS users_email_norm_update AFTER UPDATE OF email ON users BEGIN
+            UPDATE users SET email_norm = LOWER(TRIM(NEW.email)) WHERE user_id = NEW.user_id;
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS customers_phone_norm_insert AFTER INSERT ON customers BEGIN
+            UPDATE customers SET phone_norm = {_phone_norm_sql('NEW.phone')}
+            WHERE customer_id = NEW.customer_id;
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS customers_phone_norm_update AFTER UPDATE OF phone ON customers BEGIN
+            UPDATE customers SET phone_norm = {_phone_norm_sql('NEW.phone')}
+            WHERE customer_id = NEW.customer_id;
+        END
+        ''',
+        _create_customer_search_index,
+        rebuild_customer_search
+    ]),
+    (9, "Per-table change counters for cross-process change detection", [
+        '''
+        CREATE TABLE IF NOT EXISTS table_changes (
+            table_name TEXT PRIMARY KEY,
+            change_count INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        ''',
+        _create_change_counters
+    ]),
+    (10, "Sales rollup also records orders inserted as completed", [
+        f'''
+        CREATE TRIGGER IF NOT EXISTS orders_sales_insert AFTER INSERT ON orders
+        WHEN NEW.status = 'completed' BEGIN
+            {_RECORD_SALE}
+        END
+        ''',
+        # Such orders usually get their items after the order row; add each
+        # item to the sale, re-rounding the day's profit the way a rebuild does
+        f'''
+        CREATE TRIGGER IF NOT EXISTS order_items_sales_insert AFTER INSERT ON order_items
+        WHEN EXISTS (SELECT 1 FROM sales WHERE order_id = NEW.order_id) BEGIN
+            UPDATE daily_sales SET
+                units = units + NEW.quantity,
+                profit_cents = profit_cents
+                    - (SELECT CAST(ROUND(profit * 100) AS INTEGER) FROM sales WHERE order_id = NEW.order_id)
+                    + (SELECT CAST(ROUND((profit + {_ITEM_PROFIT}) * 100) AS INTEGER)
+                       FROM sales WHERE order_id = NEW.order_id)
+            WHERE sale_date = (SELECT sale_date FROM sales WHERE order_id = NEW.order_id);
+            UPDATE sales SET units = units + NEW.quantity, profit = profit + {_ITEM_PROFIT}
+            WHERE order_id = NEW.order_id;
+        END
+        ''',
+        # Orders inserted as completed before this migration are missing
+        rebuild_sales_rollup
+    ])
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Get the schema version stored in the database header"""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Apply pending migrations, each in its own transaction
+    Returns: number of migrations applied (0 on a warm start)
+    """
+    if get_schema_version(conn) >= LATEST_VERSION:
+        return 0
+
+    applied = 0
+    for version, description, steps in MIGRATIONS:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Another process may have migrated while we waited for the lock
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            for step in steps:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.execute(step)
+            conn.execute(f'PRAGMA user_version = {version}')
+            conn.commit()
+            applied += 1
+        except Exception:
+            conn.rollback()
+            raise
+    return applied
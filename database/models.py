@@ -2,9 +2,15 @@
 Database models for Girlush Collections Inventory Management System
 """
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+# Every model lists its __slots__ in constructor order, which is also the
+# column order of its table, so rows can be mapped with model_cls(*row)
 
 class User:
+    __slots__ = ('user_id', 'email', 'password', 'name', 'role', 'created_at')
+
     def __init__(self, user_id: Optional[int] = None, email: str = "", password: str = "", 
                  name: str = "", role: str = "customer", created_at: Optional[str] = None):
         self.user_id = user_id
@@ -24,6 +30,9 @@ class User:
         }
 
 class Product:
+    __slots__ = ('product_id', 'name', 'description', 'category', 'price', 'cost',
+                 'stock_quantity', 'supplier_id', 'image_path', 'created_at')
+
     def __init__(self, product_id: Optional[int] = None, name: str = "", description: str = "",
                  category: str = "", price: float = 0.0, cost: float = 0.0, stock_quantity: int = 0,
                  supplier_id: Optional[int] = None, image_path: str = "", created_at: Optional[str] = None):
@@ -53,6 +62,8 @@ class Product:
         }
 
 class Customer:
+    __slots__ = ('customer_id', 'user_id', 'phone', 'address', 'city', 'created_at')
+
     def __init__(self, customer_id: Optional[int] = None, user_id: Optional[int] = None,
                  phone: str = "", address: str = "", city: str = "", created_at: Optional[str] = None):
         self.customer_id = customer_id
@@ -73,6 +84,9 @@ class Customer:
         }
 
 class Order:
+    __slots__ = ('order_id', 'customer_id', 'user_id', 'order_date', 'total_amount', 'status',
+                 'payment_method', 'shipping_address')
+
     def __init__(self, order_id: Optional[int] = None, customer_id: int = 0, user_id: Optional[int] = None,
                  order_date: Optional[str] = None, total_amount: float = 0.0, status: str = "pending",
                  payment_method: str = "cash", shipping_address: str = ""):
@@ -98,6 +112,8 @@ class Order:
         }
 
 class OrderItem:
+    __slots__ = ('item_id', 'order_id', 'product_id', 'quantity', 'unit_price', 'subtotal')
+
     def __init__(self, item_id: Optional[int] = None, order_id: int = 0, product_id: int = 0,
                  quantity: int = 0, unit_price: float = 0.0, subtotal: float = 0.0):
         self.item_id = item_id
@@ -118,6 +134,8 @@ class OrderItem:
         }
 
 class Supplier:
+    __slots__ = ('supplier_id', 'name', 'contact_person', 'email', 'phone', 'address', 'created_at')
+
     def __init__(self, supplier_id: Optional[int] = None, name: str = "", contact_person: str = "",
                  email: str = "", phone: str = "", address: str = "", created_at: Optional[str] = None):
         self.supplier_id = supplier_id
@@ -140,6 +158,8 @@ class Supplier:
         }
 
 class CartItem:
+    __slots__ = ('cart_id', 'user_id', 'product_id', 'quantity', 'added_at')
+
     def __init__(self, cart_id: Optional[int] = None, user_id: int = 0, product_id: int = 0,
                  quantity: int = 0, added_at: Optional[str] = None):
         self.cart_id = cart_id
@@ -156,3 +176,41 @@ class CartItem:
             'quantity': self.quantity,
             'added_at': self.added_at
         }
+
+class Page:
+    """
+    One page of a keyset-paginated listing
+    Cursors are (sort_value, id) tuples; pass them back to the *_page method
+    (with backwards=True for prev_cursor) to fetch the neighbouring page.
+    """
+    __slots__ = ('items', 'next_cursor', 'prev_cursor')
+
+    def __init__(self, items: List[Any], next_cursor: Optional[Tuple] = None,
+                 prev_cursor: Optional[Tuple] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+@lru_cache(maxsize=None)
+def row_factory(model_cls) -> Callable:
+    """
+    Build a sqlite3 row factory that creates ``model_cls`` objects straight
+    from cursor tuples. Select the columns with model_columns(model_cls).
+    """
+    def factory(cursor, row):
+        return model_cls(*row)
+    return factory
+
+@lru_cache(maxsize=None)
+def model_columns(model_cls, alias: str = "") -> str:
+    """Column list matching the model's constructor order, e.g. 'p.product_id, p.name, ...'"""
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(prefix + column for column in model_cls.__slots__)
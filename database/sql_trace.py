@@ -0,0 +1,229 @@
+"""
+SQL tracing for Girlush Collections Inventory Management System
+Times every statement, tags it with the DatabaseManager method that ran it
+and keeps a slow-query log with query plans
+"""
+import contextlib
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Pattern
+import config
+
+_DATABASE_PACKAGE = os.path.dirname(os.path.abspath(__file__))
+_MANAGER_FILE = os.path.join(_DATABASE_PACKAGE, 'database_manager.py')
+_CONTEXTLIB_FILE = contextlib.__file__
+
+def _calling_method() -> str:
+    """
+    Name the DatabaseManager method that ran the statement: the outermost one
+    on the stack, so helpers report as the public method that called them
+    """
+    frame = sys._getframe(2)
+    method = None
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if os.path.dirname(filename) == _DATABASE_PACKAGE:
+            name = frame.f_code.co_name
+            if filename == _MANAGER_FILE and not name.startswith('__'):
+                method = name
+        elif filename != _CONTEXTLIB_FILE:
+            # Left the database layer ("with self.connection()" goes through contextlib)
+            break
+        frame = frame.f_back
+    return f"DatabaseManager.{method}" if method else "<unknown>"
+
+# ?, ?NNN, :name, @name and $name
+_PLACEHOLDER = re.compile(r'\?\d*|[:@$][A-Za-z_]\w*')
+
+def _one_line(sql: str) -> str:
+    return ' '.join(sql.split())
+
+def _statement_pattern(sql: str) -> Pattern:
+    """Match the traced text of ``sql``, whatever values its parameters were bound to"""
+    parts = _PLACEHOLDER.split(_one_line(sql))
+    return re.compile('.*?'.join(re.escape(part) for part in parts), re.DOTALL)
+
+class SqlTracer:
+    """
+    Collects per-statement timings from TracingConnection objects.
+
+    The trace callback supplies the statement text with its parameters bound;
+    the timing wraps execute plus the fetch of every row, so a SELECT's
+    duration covers the whole query.
+    """
+    def __init__(self, log_file: str = config.LOG_FILE, slow_log_file: str = config.SLOW_QUERY_LOG,
+                 slow_ms: float = config.SLOW_QUERY_MS):
+        self.slow_ms = slow_ms
+        self.logger = self._file_logger('girlush.sql', log_file)
+        self.slow_logger = self._file_logger('girlush.sql.slow', slow_log_file)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _file_logger(name: str, path: str) -> logging.Logger:
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        path = os.path.abspath(path)
+        if not any(getattr(h, 'baseFilename', None) == path for h in logger.handlers):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handler = logging.FileHandler(path, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            logger.addHandler(handler)
+        return logger
+
+    def connect(self, db_path: str, **kwargs) -> 'TracingConnection':
+        """Open a connection whose statements report to this tracer"""
+        conn = sqlite3.connect(db_path, factory=TracingConnection, **kwargs)
+        conn.tracer = self
+        conn.set_trace_callback(conn.traced.append)
+        return conn
+
+    def record(self, conn: 'TracingConnection', sql: str, params, duration: float,
+               rowcount: int, method: str):
+        """Log one finished statement and update the per-method totals"""
+        # The trace also holds implicit BEGINs and statements run by triggers
+        # and FTS; the statement itself is ``sql`` with its parameters bound
+        pattern = _statement_pattern(sql)
+        expanded = next((text for text in map(_one_line, conn.traced) if pattern.fullmatch(text)), None)
+        if expanded is None:
+            expanded = _one_line(sql) + (f" -- params {params!r}" if params else '')
+        conn.traced.clear()
+        ms = duration * 1000
+
+        with self._lock:
+            stats = self._stats.setdefault(method, {'statements': 0, 'total_ms': 0.0,
+                                                    'max_ms': 0.0, 'rows': 0})
+            stats['statements'] += 1
+            stats['total_ms'] += ms
+            stats['max_ms'] = max(stats['max_ms'], ms)
+            stats['rows'] += max(rowcount, 0)
+
+        self.logger.info("%s %.2fms rows=%d | %s", method, ms, rowcount, expanded)
+        if ms >= self.slow_ms:
+            plan = self._query_plan(conn, sql, params)
+            self.slow_logger.info("%s %.2fms rows=%d\n    %s\n%s", method, ms, rowcount,
+                                  expanded, plan)
+
+    def _query_plan(self, conn: sqlite3.Connection, sql: str, params) -> str:
+        if not sql.lstrip().upper().startswith(('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')):
+            return "    (no query plan)"
+        conn.set_trace_callback(None)
+        try:
+            rows = sqlite3.Cursor.execute(sqlite3.Cursor(conn), f'EXPLAIN QUERY PLAN {sql}',
+                                          params or ()).fetchall()
+            if not rows:
+                return "    (no query plan)"
+            return '\n'.join(f"    {'  ' * self._depth(rows, row)}{row[3]}" for row in rows)
+        except sqlite3.Error as e:
+            return f"    (no query plan: {e})"
+        finally:
+            conn.set_trace_callback(conn.traced.append)
+
+    @staticmethod
+    def _depth(rows, row) -> int:
+        parents = {r[0]: r[1] for r in rows}
+        depth, parent = 0, row[1]
+        while parent in parents:
+            depth += 1
+            parent = parents[parent]
+        return depth
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-method statement counts and timings, slowest total first"""
+        with self._lock:
+            return dict(sorted(((m, dict(s)) for m, s in self._stats.items()),
+                               key=lambda item: item[1]['total_ms'], reverse=True))
+
+class TracingCursor(sqlite3.Cursor):
+    """Cursor that times each statement, reading a query's rows up front"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rows: Optional[List] = None
+
+    def execute(self, sql, parameters=()):
+        method = _calling_method()
+        started = time.perf_counter()
+        super().execute(sql, parameters)
+        if self.description is not None:
+            self._rows = super().fetchall()
+            rowcount = len(self._rows)
+        else:
+            self._rows = None
+            rowcount = self.rowcount
+        self.connection.tracer.record(self.connection, sql, parameters,
+                                      time.perf_counter() - started, rowcount, method)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        method = _calling_method()
+        seq_of_parameters = list(seq_of_parameters)
+        started = time.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        self._rows = None
+        self.connection.tracer.record(self.connection, sql,
+                                      seq_of_parameters[0] if seq_of_parameters else (),
+                                      time.perf_counter() - started, self.rowcount, method)
+        return self
+
+    def fetchone(self):
+        if self._rows is None:
+            return super().fetchone()
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=None):
+        if self._rows is None:
+            return super().fetchmany(size or self.arraysize)
+        size = size or self.arraysize
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self):
+        if self._rows is None:
+            return super().fetchall()
+        rows, self._rows = self._rows, []
+        return rows
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+class TracingConnection(sqlite3.Connection):
+    """Connection whose cursors, commits and rollbacks are timed"""
+    tracer: SqlTracer
+    traced: List[str]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.traced = []
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or TracingCursor)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        self._timed(super().commit, 'COMMIT')
+
+    def rollback(self):
+        self._timed(super().rollback, 'ROLLBACK')
+
+    def _timed(self, action, sql: str):
+        method = _calling_method()
+        started = time.perf_counter()
+        action()
+        self.tracer.record(self, sql, None, time.perf_counter() - started, -1, method)
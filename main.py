@@ -12,6 +12,8 @@ from controllers.product_controller import ProductController
 from controllers.customer_controller import CustomerController
 from controllers.order_controller import OrderController
 from controllers.cart_controller import CartController
+from utils.background import DatabaseWorker
+from utils.thumbnails import ThumbnailService
 from views.login_view import LoginView
 from views.signup_view import SignupView
 from views.admin_dashboard_view import AdminDashboardView
@@ -38,6 +40,8 @@ class Application(tk.Tk):
         
         # Show login view
         self.show_login()
+        
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def center_window(self):
         """Center the window on screen"""
@@ -63,8 +67,13 @@ class Application(tk.Tk):
             'product': ProductController(self.db_manager),
             'customer': CustomerController(self.db_manager),
             'order': OrderController(self.db_manager),
-            'cart': CartController(self.db_manager)
+            'cart': CartController(self.db_manager),
+            'worker': DatabaseWorker(),
+            'thumbnails': ThumbnailService()
         }
+        
+        # Notice writes made by other terminals sharing the database
+        self.db_manager.changes.start(self)
     
     def clear_window(self):
         """Clear all widgets from window"""
@@ -135,6 +144,13 @@ class Application(tk.Tk):
         
         self.current_view.pack(fill=tk.BOTH, expand=True)
     
+    def on_close(self):
+        """Stop background work and close the database before exiting"""
+        self.controllers['worker'].shutdown()
+        self.controllers['thumbnails'].shutdown()
+        self.db_manager.close()
+        self.destroy()
+    
     def handle_logout(self):
         """Handle logout"""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
@@ -0,0 +1,125 @@
+"""
+Concurrent checkout stress test
+Fires thousands of checkouts from several processes at a few hot products
+and checks that stock never drops below zero and every unit is accounted for
+Usage: python stress_test_checkout.py [--processes 8] [--checkouts 3000]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+from database.database_manager import DatabaseManager
+from database.models import Product
+from controllers.auth_controller import AuthController
+from controllers.cart_controller import CartController
+from controllers.order_controller import OrderController
+
+def worker(db_path: str, worker_id: int, checkouts: int, hot_products: int, results):
+    """Run checkouts for one customer, alternating both order paths"""
+    db = DatabaseManager(db_path)
+    auth = AuthController(db)
+    cart = CartController(db)
+    orders = OrderController(db)
+    rng = random.Random(worker_id)
+
+    email = f"stress{worker_id}@example.com"
+    auth.register(email, "password", f"Stress Customer {worker_id}")
+    user = db.get_user_by_email(email)
+    customer = db.get_customer_by_user_id(user.user_id)
+
+    placed = rejected = 0
+    for n in range(checkouts):
+        product_id = rng.randint(1, hot_products)
+        quantity = rng.randint(1, 3)
+        if n % 2 == 0:
+            # Cart checkout: one transaction, set-based stock check
+            cart.clear_cart(user.user_id)
+            cart_ok, _ = cart.add_to_cart(user.user_id, product_id, quantity)
+            if not cart_ok:
+                rejected += 1
+                continue
+            success, _, _ = orders.checkout_from_cart(user.user_id, 'cash')
+        else:
+            # Direct order: guarded per-line reservation
+            success, _, _ = orders.create_order(
+                user.user_id, customer.customer_id,
+                [{'product_id': product_id, 'quantity': quantity}], 'cash')
+        if success:
+            placed += 1
+        else:
+            rejected += 1
+    db.close()
+    results.put((placed, rejected))
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent checkout stress test")
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--checkouts', type=int, default=3000, help="total checkouts")
+    parser.add_argument('--hot-products', type=int, default=3)
+    parser.add_argument('--stock', type=int, default=500, help="starting stock per product")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="girlush_stress_")
+    db_path = os.path.join(work_dir, "stress.db")
+    try:
+        db = DatabaseManager(db_path)
+        for i in range(args.hot_products):
+            db.create_product(Product(name=f"Hot Bag {i + 1}", category="Stress", price=1000,
+                                      cost=500, stock_quantity=args.stock))
+        db.close()
+
+        print("=" * 60)
+        print("CONCURRENT CHECKOUT STRESS TEST")
+        print("=" * 60)
+        print(f"{args.processes} processes, {args.checkouts} checkouts, "
+              f"{args.hot_products} products x {args.stock} units")
+
+        results = multiprocessing.Queue()
+        per_worker = args.checkouts // args.processes
+        processes = [multiprocessing.Process(target=worker,
+                                             args=(db_path, i, per_worker, args.hot_products, results))
+                     for i in range(args.processes)]
+        for process in processes:
+            process.start()
+        totals = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        placed = sum(t[0] for t in totals)
+        rejected = sum(t[1] for t in totals)
+        print(f"\nOrders placed: {placed}")
+        print(f"Checkouts rejected: {rejected}")
+
+        db = DatabaseManager(db_path)
+        failures = []
+        with db.connection() as conn:
+            rows = conn.execute('''
+                SELECT p.product_id, p.name, p.stock_quantity,
+                       COALESCE((SELECT SUM(quantity) FROM order_items oi
+                                 WHERE oi.product_id = p.product_id), 0) AS sold
+                FROM products p
+            ''').fetchall()
+        for row in rows:
+            print(f"   {row['name']}: stock {row['stock_quantity']}, sold {row['sold']}")
+            if row['stock_quantity'] < 0:
+                failures.append(f"{row['name']} went negative ({row['stock_quantity']})")
+            if row['stock_quantity'] + row['sold'] != args.stock:
+                failures.append(f"{row['name']} lost units: {row['stock_quantity']} + "
+                                f"{row['sold']} != {args.stock}")
+        db.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("\n" + "=" * 60)
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        sys.exit(1)
+    print("✓ Stock never dropped below zero and every unit is accounted for")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
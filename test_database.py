@@ -1,8 +1,13 @@
 """
 Test database and login functionality
 """
+import os
+import tempfile
 from database.database_manager import DatabaseManager
+from database.sql_trace import SqlTracer
 from controllers.auth_controller import AuthController
+from controllers.product_controller import ProductController
+from database.models import Product
 
 print("="*60)
 print("DATABASE & LOGIN TEST")
@@ -46,6 +51,10 @@ print(f"   Total Products: {stats['total_products']}")
 print(f"   Total Customers: {stats['total_customers']}")
 print(f"   Total Orders: {stats['total_orders']}")
 print(f"   Total Sales: ₱{stats['total_sales']:,.2f}")
+drift = db.verify_stats_counters()
+print(f"   {'✓ Counters match the tables' if not drift else f'✗ Counters drifted: {drift}'}")
+drift = db.verify_sales_rollup()
+print(f"   {'✓ Sales rollup matches the orders' if not drift else f'✗ Sales rollup drifted: {drift}'}")
 
 # Test 5: Test Signup
 print("\n5. Testing Signup...")
@@ -68,6 +77,73 @@ if success:
 else:
     print(f"   Note: {msg} (may already exist from previous test)")
 
+# Test 6: Connection Pool
+print("\n6. Connection Pool Statistics:")
+pool_stats = db.get_pool_stats()
+print(f"   Checkouts: {pool_stats['checkouts']}")
+print(f"   Live Connections: {pool_stats['live_connections']}")
+print(f"   Connections Created: {pool_stats['connections_created']}")
+print(f"   Total Wait Time: {pool_stats['total_wait_time']:.4f}s")
+
+# Test 7: Keyset Pagination
+print("\n7. Paginated Products:")
+page = db.get_products_page(limit=5)
+print(f"   First page: {len(page.items)} products, has next: {page.has_next}")
+if page.has_next:
+    next_page = db.get_products_page(page.next_cursor, limit=5)
+    back_page = db.get_products_page(next_page.prev_cursor, backwards=True, limit=5)
+    same = [p.product_id for p in back_page.items] == [p.product_id for p in page.items]
+    print(f"   {'✓' if same else '✗'} Next then Prev returns the first page")
+
+# Test 8: Search Narrowing
+print("\n8. Narrowed Search Matches the Database:")
+products = ProductController(db)
+test_products = [Product(name='Nova Bag', description=None, category=None, price=100.0, stock_quantity=1),
+                 Product(name='Straße Tote', description='Weiße Leder', category='Tote Bags',
+                         price=100.0, stock_quantity=1)]
+product_ids = [db.create_product(product) for product in test_products]
+if all(product_ids):
+    # Each query is narrowed from the cached one before it
+    for typed, query, case in (('n', 'none', "NULL description and category"),
+                               ('n', 'nova', "NULL description and category"),
+                               ('stra', 'strass', "'ß' is not 'ss' in the index"),
+                               ('b', 'bag', "ranked for the new query")):
+        products.search_products(typed)
+        narrowed = [p.product_id for p in products.search_products(query)]
+        expected = [p.product_id for p in db.search_products(query)]
+        print(f"   {'✓' if narrowed == expected else '✗'} '{query}' after '{typed}', {case}: "
+              f"{len(narrowed)} narrowed, {len(expected)} from SQL")
+else:
+    print("   ✗ Could not create the test products")
+for product_id in filter(None, product_ids):
+    db.delete_product(product_id)
+
+# Test 9: Slow Query Log
+print("\n9. Slow Query Log Names the Statement:")
+traced = DatabaseManager(trace=True)
+slow_log = os.path.join(tempfile.mkdtemp(), 'slow_queries.log')
+traced.tracer.slow_ms = 0  # Every statement counts as slow
+traced.tracer.slow_logger = SqlTracer._file_logger('girlush.sql.slow.test', slow_log)
+traced.search_products_with_snippets('bag')
+with open(slow_log, encoding='utf-8') as log:
+    entries = [entry for entry in log.read().split('\n20') if 'search_products_with_snippets' in entry]
+search = next((entry for entry in entries if 'products_fts MATCH' in entry), None)
+if not traced.fts_enabled:
+    print("   Note: full-text search is not available")
+elif search and '"bag"*' in search and '_config' not in search:
+    print("   ✓ The FTS search is logged with its own text and bound query")
+else:
+    print(f"   ✗ Logged instead: {entries[:1]}")
+traced.close()
+
+# Test 10: Short Phone Prefixes
+print("\n10. Customer Search by Short Phone Prefix:")
+# The customer registered in test 5 has phone 09171234567
+for query in ('09', '9', '+2569'):
+    found = db.search_customers(query)
+    by_phone = bool(found) and all(customer['phone_norm'].startswith('09') for customer in found)
+    print(f"   {'✓' if by_phone else '✗'} '{query}' finds {len(found)} customers by phone")
+
 print("\n" + "="*60)
 print("ALL TESTS COMPLETED!")
 print("="*60)
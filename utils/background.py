@@ -0,0 +1,205 @@
+"""
+Background database work for Girlush Collections
+Runs controller calls on worker threads so the Tk mainloop never waits on SQL
+"""
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Dict, List, Optional
+import config
+
+class BackgroundTask:
+    """A call running on a worker thread whose result is delivered on the Tk thread"""
+    def __init__(self, future: Future, owner: tk.Misc, on_done: Optional[Callable],
+                 on_error: Optional[Callable]):
+        self.future = future
+        self.owner = owner
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = False
+
+    def cancel(self):
+        """Drop the result; the call itself is skipped if it has not started yet"""
+        self.cancelled = True
+        self.future.cancel()
+
+    @property
+    def pending(self) -> bool:
+        return not self.cancelled and not self.future.done()
+
+class DatabaseWorker:
+    """
+    Thread pool for database calls made by the views.
+
+    ``run`` returns a BackgroundTask straight away. The result is handed to
+    ``on_done`` on the Tk thread (polled with after()), but only while the
+    owning widget still exists and the task has not been cancelled, so a
+    view that has been closed or has issued a newer request never sees a
+    stale result.
+    """
+    def __init__(self, max_workers: int = config.DB_WORKER_THREADS,
+                 poll_interval: int = config.DB_WORKER_POLL_MS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='db-worker')
+        self.poll_interval = poll_interval
+        self._tasks: List[BackgroundTask] = []
+        self._root: Optional[tk.Misc] = None
+        self._after_id = None
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Run ``fn(*args, **kwargs)`` on a worker thread and return its future"""
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def run(self, owner: tk.Misc, fn: Callable, *args, on_done: Optional[Callable] = None,
+            on_error: Optional[Callable] = None, **kwargs) -> BackgroundTask:
+        """Run ``fn`` in the background and call ``on_done(result)`` on the Tk thread"""
+        task = BackgroundTask(self.submit(fn, *args, **kwargs), owner, on_done, on_error)
+        self._tasks.append(task)
+        if self._after_id is None:
+            # Poll on the root window, which outlives every view
+            self._root = owner.nametowidget('.')
+            self._after_id = self._root.after(self.poll_interval, self._poll)
+        return task
+
+    def cancel_within(self, container: tk.Misc):
+        """Cancel tasks owned by ``container`` or any widget inside it"""
+        path = str(container)
+        for task in self._tasks:
+            owner = str(task.owner)
+            if owner == path or owner.startswith(path.rstrip('.') + '.'):
+                task.cancel()
+
+    def shutdown(self):
+        """Cancel everything outstanding and stop the worker threads"""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        self._executor.shutdown(wait=False)
+
+    def _poll(self):
+        self._after_id = None
+        tasks, self._tasks = self._tasks, []
+        remaining = []
+        for task in tasks:
+            if task.cancelled:
+                continue
+            if not self._owner_exists(task.owner):
+                task.cancel()
+            elif task.future.done():
+                self._deliver(task)
+            else:
+                remaining.append(task)
+        # Callbacks may have queued new tasks (and a poll) while delivering
+        self._tasks = remaining + self._tasks
+        if self._tasks and self._after_id is None and self._owner_exists(self._root):
+            self._after_id = self._root.after(self.poll_interval, self._poll)
+
+    def _deliver(self, task: BackgroundTask):
+        error = task.future.exception()
+        if error is None:
+            if task.on_done:
+                task.on_done(task.future.result())
+        elif task.on_error:
+            task.on_error(error)
+        else:
+            print(f"Background task failed: {error}")
+
+    @staticmethod
+    def _owner_exists(widget: Optional[tk.Misc]) -> bool:
+        try:
+            return widget is not None and bool(widget.winfo_exists())
+        except tk.TclError:
+            return False
+
+class DebouncedSearch:
+    """
+    Search-as-you-type on the worker threads.
+
+    schedule() is called on every keystroke and waits ``delay_ms`` for the
+    typing to pause before issuing the query. A newer query cancels the
+    older one, whether it is still waiting, queued or running, so only the
+    newest result reaches ``apply(query, result)``. An empty query skips
+    SQL and calls ``on_empty()`` straight away.
+    """
+    def __init__(self, owner: tk.Misc, worker: DatabaseWorker, search: Callable[[str], Any],
+                 apply: Callable[[str, Any], None], on_empty: Optional[Callable[[], None]] = None,
+                 delay_ms: int = config.SEARCH_DEBOUNCE_MS):
+        self.owner = owner
+        self.worker = worker
+        self.search = search
+        self.apply = apply
+        self.on_empty = on_empty
+        self.delay_ms = delay_ms
+        self.query: Optional[str] = None  # newest query scheduled or issued
+        self._after_id = None
+        self._task: Optional[BackgroundTask] = None
+
+        # Statistics
+        self._keystrokes = 0
+        self._issued = 0
+        self._applied = 0
+        self._superseded = 0
+
+    def schedule(self, query: str):
+        """Search for ``query`` once the typing pauses; repeats of the current query are ignored"""
+        self._keystrokes += 1
+        if query == self.query:
+            return
+        self._cancel_pending()
+        self.query = query
+        if not query:
+            self._show_empty()
+            return
+        self._after_id = self.owner.after(self.delay_ms, self._issue)
+
+    def run_now(self, query: str):
+        """Search for ``query`` immediately, e.g. to refresh results after an edit"""
+        self._cancel_pending()
+        self.query = query
+        if not query:
+            self._show_empty()
+            return
+        self._issue()
+
+    def cancel(self):
+        """Drop the waiting or running search"""
+        self._cancel_pending()
+        self.query = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get search statistics: keystrokes seen, searches issued, applied and superseded"""
+        return {
+            'keystrokes': self._keystrokes,
+            'issued': self._issued,
+            'applied': self._applied,
+            'superseded': self._superseded
+        }
+
+    def _cancel_pending(self):
+        if self._after_id is not None:
+            self.owner.after_cancel(self._after_id)
+            self._after_id = None
+        if self._task is not None:
+            if self._task.pending:
+                self._task.cancel()
+                self._superseded += 1
+            self._task = None
+
+    def _show_empty(self):
+        if self.on_empty:
+            self.on_empty()
+
+    def _issue(self):
+        self._after_id = None
+        if not DatabaseWorker._owner_exists(self.owner):
+            return
+        query = self.query
+        self._issued += 1
+        self._task = self.worker.run(self.owner, self.search, query,
+                                     on_done=lambda result: self._deliver(query, result))
+
+    def _deliver(self, query: str, result):
+        self._task = None
+        if query != self.query:
+            self._superseded += 1
+            return
+        self._applied += 1
+        self.apply(query, result)
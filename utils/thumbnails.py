@@ -0,0 +1,169 @@
+"""
+Product image thumbnails for Girlush Collections
+Generates fixed-size thumbnails off the UI thread, keeps them in a
+content-hashed disk cache and holds recently shown ones in memory
+"""
+import hashlib
+import os
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import config
+from utils.background import DatabaseWorker
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; products then show no image
+    Image = None
+
+class ThumbnailService:
+    """
+    Thumbnails of product images for the shop cards and the product dialog.
+
+    request() answers from an LRU of PhotoImage objects when it can.
+    Otherwise a worker thread hashes the image file and looks for
+    ``<sha1>_<w>x<h>.png`` in the disk cache. If that is missing, the
+    worker decodes the image with Pillow, fits it into ``size`` and
+    writes it there. The PhotoImage is then built on the Tk thread. The
+    cache is keyed by content, so a renamed file is still a disk hit and
+    an edited one gets a new thumbnail. Concurrent requests for one image
+    share a single job.
+
+    Callers must keep a reference to the PhotoImage they display; the LRU
+    may drop it at any time.
+    """
+    def __init__(self, cache_dir: str = config.THUMBNAIL_CACHE_DIR,
+                 size: Tuple[int, int] = config.THUMBNAIL_SIZE,
+                 max_images: int = config.THUMBNAIL_MEMORY_ITEMS,
+                 max_workers: int = config.THUMBNAIL_THREADS):
+        self.cache_dir = cache_dir
+        self.size = tuple(size)
+        self.max_images = max_images
+        self.enabled = Image is not None
+        self.worker = DatabaseWorker(max_workers=max_workers)
+        self._images: "OrderedDict[Tuple, tk.PhotoImage]" = OrderedDict()
+        self._waiting: Dict[Tuple, List[Callable[[tk.PhotoImage], None]]] = {}
+        self._hashes: Dict[Tuple, str] = {}  # (path, mtime, size) -> content hash
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._generated = 0
+        self._failures = 0
+
+    def request(self, owner: tk.Misc, image_path: str, on_ready: Callable[[tk.PhotoImage], None]):
+        """
+        Call ``on_ready(photo)`` with the thumbnail of ``image_path``: straight
+        away when it is in memory, otherwise on the Tk thread once it is
+        ready - unless ``owner`` has been destroyed. Missing or unreadable
+        images never call back.
+        """
+        if not self.enabled or not image_path:
+            return
+        key = self._key(image_path)
+        if key is None:
+            return
+        photo = self._images.get(key)
+        if photo is not None:
+            self._images.move_to_end(key)
+            self._memory_hits += 1
+            on_ready(photo)
+            return
+
+        def deliver(photo: tk.PhotoImage):
+            if DatabaseWorker._owner_exists(owner):
+                on_ready(photo)
+
+        waiting = self._waiting.get(key)
+        if waiting is not None:
+            waiting.append(deliver)
+            return
+        self._waiting[key] = [deliver]
+        # The job belongs to the root window: other requests may be waiting on it
+        self.worker.run(owner.nametowidget('.'), self._thumbnail_file, key,
+                        on_done=lambda thumbnail: self._deliver(key, thumbnail),
+                        on_error=lambda error: self._failed(key, error))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get thumbnail cache statistics"""
+        return {
+            'enabled': self.enabled,
+            'in_memory': len(self._images),
+            'max_images': self.max_images,
+            'memory_hits': self._memory_hits,
+            'disk_hits': self._disk_hits,
+            'generated': self._generated,
+            'failures': self._failures
+        }
+
+    def shutdown(self):
+        """Stop the worker threads and drop the in-memory images"""
+        self.worker.shutdown()
+        self._images.clear()
+        self._waiting.clear()
+
+    def _key(self, image_path: str) -> Optional[Tuple]:
+        """(absolute path, mtime, file size); None if the file is missing"""
+        path = image_path if os.path.isabs(image_path) else os.path.join(config.BASE_DIR, image_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (path, stat.st_mtime_ns, stat.st_size)
+
+    def _thumbnail_file(self, key: Tuple) -> str:
+        """Path of the cached thumbnail PNG for ``key``, generating it if needed (worker thread)"""
+        path = key[0]
+        with self._lock:
+            digest = self._hashes.get(key)
+        if digest is None:
+            sha1 = hashlib.sha1()
+            with open(path, 'rb') as image_file:
+                for block in iter(lambda: image_file.read(1 << 16), b''):
+                    sha1.update(block)
+            digest = sha1.hexdigest()
+            with self._lock:
+                self._hashes[key] = digest
+
+        width, height = self.size
+        thumbnail = os.path.join(self.cache_dir, f"{digest}_{width}x{height}.png")
+        if os.path.exists(thumbnail):
+            with self._lock:
+                self._disk_hits += 1
+            return thumbnail
+
+        with Image.open(path) as image:
+            image.draft('RGB', self.size)  # JPEGs decode straight at a reduced scale
+            image = image.convert('RGBA')
+            image.thumbnail(self.size)
+        # Pad to exactly ``size`` so every card lays out the same
+        canvas = Image.new('RGBA', self.size, (255, 255, 255, 0))
+        canvas.paste(image, ((width - image.width) // 2, (height - image.height) // 2))
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        partial = f"{thumbnail}.{threading.get_ident()}.tmp"
+        canvas.save(partial, 'PNG')
+        os.replace(partial, thumbnail)  # Readers never see a half-written file
+        with self._lock:
+            self._generated += 1
+        return thumbnail
+
+    def _deliver(self, key: Tuple, thumbnail: str):
+        callbacks = self._waiting.pop(key, [])
+        try:
+            photo = tk.PhotoImage(file=thumbnail)
+        except tk.TclError as e:
+            self._failed(key, e)
+            return
+        self._images[key] = photo
+        while len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+        for on_ready in callbacks:
+            on_ready(photo)
+
+    def _failed(self, key: Tuple, error: Exception):
+        self._waiting.pop(key, None)
+        self._failures += 1
+        print(f"Could not create thumbnail for {key[0]}: {error}")
@@ -7,6 +7,7 @@ import config
 from assets.styles import *
 from utils.helpers import format_currency
 from components.dialogs import show_info
+from components.view_cache import ViewCache
 
 class AdminDashboardView(tk.Frame):
     def __init__(self, parent, user, controllers, on_logout):
@@ -89,6 +90,8 @@ class AdminDashboardView(tk.Frame):
         canvas = tk.Canvas(content_container, bg=config.BG_COLOR, highlightthickness=0)
         scrollbar = tk.Scrollbar(content_container, orient='vertical', command=canvas.yview)
         self.content_area = tk.Frame(canvas, bg=config.BG_COLOR)
+        # Views visited before stay built and are shown again as they were
+        self.views = ViewCache(self.content_area, self.controllers['db'].changes, self.controllers['worker'])
         
         self.content_area.bind(
             "<Configure>",
@@ -117,7 +120,12 @@ class AdminDashboardView(tk.Frame):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=20)
     
     def clear_content(self):
+        self.views.hide()
         for widget in self.content_area.winfo_children():
+            if self.views.holds(widget):
+                continue  # Kept for later; its pending results still apply
+            # Results still on their way belong to the view being replaced
+            self.controllers['worker'].cancel_within(widget)
             widget.destroy()
     
     def load_dashboard(self):
@@ -129,8 +137,29 @@ class AdminDashboardView(tk.Frame):
             **LABEL_TITLE_STYLE
         ).pack(anchor='w', pady=(0, 20))
         
-        # Get stats
+        loading_label = tk.Label(
+            self.content_area,
+            text="Loading dashboard...",
+            font=(config.FONT_FAMILY, config.FONT_SIZE_NORMAL),
+            bg=config.BG_COLOR,
+            fg='gray'
+        )
+        loading_label.pack(anchor='w')
+        
+        self.controllers['worker'].run(
+            loading_label,
+            self.fetch_dashboard_data,
+            on_done=lambda data: self.show_dashboard(loading_label, *data)
+        )
+    
+    def fetch_dashboard_data(self):
+        """Runs on a worker thread"""
         stats = self.controllers['db'].get_dashboard_stats()
+        recent_orders = self.controllers['db'].get_orders_page(limit=10).items
+        return stats, recent_orders
+    
+    def show_dashboard(self, loading_label, stats, recent_orders):
+        loading_label.destroy()
         
         # Quick Actions
         tk.Label(
@@ -224,8 +253,6 @@ class AdminDashboardView(tk.Frame):
         orders_frame = tk.Frame(self.content_area, bg='white', relief='solid', borderwidth=1)
         orders_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        recent_orders = self.controllers['order'].get_all_orders()[:10]
-        
         if recent_orders:
             for order in recent_orders:
                 order_frame = tk.Frame(orders_frame, bg='white')
@@ -302,22 +329,26 @@ class AdminDashboardView(tk.Frame):
     def load_products(self):
         from views.products_view import ProductsView
         self.clear_content()
-        ProductsView(self.content_area, self.controllers).pack(fill=tk.BOTH, expand=True)
+        self.views.show('products', lambda: ProductsView(self.content_area, self.controllers),
+                        ('products',), lambda view: view.refresh_products())
     
     def load_customers(self):
         from views.customers_view import CustomersView
         self.clear_content()
-        CustomersView(self.content_area, self.controllers).pack(fill=tk.BOTH, expand=True)
+        self.views.show('customers', lambda: CustomersView(self.content_area, self.controllers),
+                        ('customers', 'users'), lambda view: view.pagination.reload())
     
     def load_orders(self):
         from views.orders_view import OrdersView
         self.clear_content()
-        OrdersView(self.content_area, self.controllers).pack(fill=tk.BOTH, expand=True)
+        self.views.show('orders', lambda: OrdersView(self.content_area, self.controllers),
+                        ('orders', 'customers', 'users'), lambda view: view.pagination.reload())
     
     def load_sales(self):
         from views.sales_view import SalesView
         self.clear_content()
-        SalesView(self.content_area, self.controllers)
+        self.views.show('sales', lambda: SalesView(self.content_area, self.controllers),
+                        ('orders',), lambda view: view.load_sales())
     
     def load_suppliers(self):
         self.clear_content()
@@ -6,6 +6,7 @@ from tkinter import ttk
 import config
 from assets.styles import *
 from components.dialogs import show_error, show_success, confirm, PaymentMethodDialog
+from components.tree_binder import TreeBinder
 from utils.helpers import format_currency
 
 class CartView(tk.Frame):
@@ -80,6 +81,14 @@ class CartView(tk.Frame):
         # Context menu
         self.tree.bind('<Button-3>', self.show_context_menu)
         
+        self.rows = TreeBinder(self.tree, key=lambda item: item['cart_id'], values=lambda item: (
+            item['cart_id'],
+            item['name'],
+            format_currency(item['price']),
+            item['quantity'],
+            format_currency(item['price'] * item['quantity'])
+        ))
+        
         # Total frame
         total_frame = tk.Frame(self, bg='white', relief='solid', borderwidth=1)
         total_frame.pack(fill=tk.X, pady=10)
@@ -104,26 +113,11 @@ class CartView(tk.Frame):
         self.total_label.pack(side=tk.LEFT)
     
     def load_cart(self):
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         # Get cart items
         cart_items = self.controllers['cart'].get_cart_items(self.user.user_id)
+        self.rows.update(cart_items)
         
-        total = 0
-        for item in cart_items:
-            subtotal = item['price'] * item['quantity']
-            total += subtotal
-            
-            self.tree.insert('', 'end', values=(
-                item['cart_id'],
-                item['name'],
-                format_currency(item['price']),
-                item['quantity'],
-                format_currency(subtotal)
-            ))
-        
+        total = sum(item['price'] * item['quantity'] for item in cart_items)
         self.total_label.config(text=format_currency(total))
         self.update_cart_callback()
     
@@ -209,17 +203,10 @@ class CartView(tk.Frame):
         
         payment_method = result['payment_method']
         
-        # Get customer info
-        customer = self.controllers['customer'].get_customer_by_user_id(self.user.user_id)
-        customer_id = customer.customer_id if customer else None
-        
-        # Create order with pay on delivery
-        success, message, order_id = self.controllers['order'].create_order(
+        # Create order with pay on delivery (ships to the customer's address)
+        success, message, order_id = self.controllers['order'].checkout_from_cart(
             user_id=self.user.user_id,
-            customer_id=customer_id,
-            cart_items=cart_items,
-            payment_method=payment_method,
-            shipping_address=customer.address if customer else ''
+            payment_method=payment_method
         )
         
         if success:
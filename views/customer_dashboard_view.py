@@ -5,6 +5,7 @@ import tkinter as tk
 from tkinter import ttk
 import config
 from assets.styles import *
+from components.view_cache import ViewCache
 
 class CustomerDashboardView(tk.Frame):
     def __init__(self, parent, user, controllers, on_logout):
@@ -97,6 +98,8 @@ class CustomerDashboardView(tk.Frame):
         canvas = tk.Canvas(content_container, bg=config.BG_COLOR, highlightthickness=0)
         scrollbar = tk.Scrollbar(content_container, orient='vertical', command=canvas.yview)
         self.content_area = tk.Frame(canvas, bg=config.BG_COLOR)
+        # Views visited before stay built and are shown again as they were
+        self.views = ViewCache(self.content_area, self.controllers['db'].changes, self.controllers['worker'])
         
         self.content_area.bind(
             "<Configure>",
@@ -125,7 +128,12 @@ class CustomerDashboardView(tk.Frame):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=20)
     
     def clear_content(self):
+        self.views.hide()
         for widget in self.content_area.winfo_children():
+            if self.views.holds(widget):
+                continue  # Kept for later; its pending results still apply
+            # Results still on their way belong to the view being replaced
+            self.controllers['worker'].cancel_within(widget)
             widget.destroy()
     
     def update_cart_count(self):
@@ -281,19 +289,23 @@ class CustomerDashboardView(tk.Frame):
     def load_shop(self):
         from views.shop_view import ShopView
         self.clear_content()
-        ShopView(self.content_area, self.user, self.controllers, self.update_cart_count).pack(fill=tk.BOTH, expand=True)
+        self.views.show('shop', lambda: ShopView(self.content_area, self.user, self.controllers, self.update_cart_count),
+                        ('products',), lambda view: view.refresh_products())
     
     def load_cart(self):
         from views.cart_view import CartView
         self.clear_content()
-        CartView(self.content_area, self.user, self.controllers, self.update_cart_count).pack(fill=tk.BOTH, expand=True)
+        self.views.show('cart', lambda: CartView(self.content_area, self.user, self.controllers, self.update_cart_count),
+                        ('cart', 'products'), lambda view: view.load_cart())
     
     def load_orders(self):
         from views.orders_view import CustomerOrdersView
         self.clear_content()
-        CustomerOrdersView(self.content_area, self.user, self.controllers).pack(fill=tk.BOTH, expand=True)
+        self.views.show('orders', lambda: CustomerOrdersView(self.content_area, self.user, self.controllers),
+                        ('orders',), lambda view: view.load_orders())
     
     def load_profile(self):
         from views.profile_view import ProfileView
         self.clear_content()
-        ProfileView(self.content_area, self.user, self.controllers).pack(fill=tk.BOTH, expand=True)
+        self.views.show('profile', lambda: ProfileView(self.content_area, self.user, self.controllers),
+                        ('customers',), lambda view: view.load_profile())
@@ -5,12 +5,15 @@ import tkinter as tk
 from tkinter import ttk
 import config
 from assets.styles import *
+from components.pagination import PaginationBar
+from components.tree_binder import TreeBinder
 from utils.helpers import format_date_short
 
 class CustomersView(tk.Frame):
     def __init__(self, parent, controllers):
         super().__init__(parent, bg=config.BG_COLOR)
         self.controllers = controllers
+        self.search_query = ""
         
         self.create_widgets()
         self.load_customers()
@@ -23,6 +26,16 @@ class CustomersView(tk.Frame):
             **LABEL_TITLE_STYLE
         ).pack(anchor='w', pady=(0, 20))
         
+        # Search
+        search_frame = tk.Frame(self, bg=config.BG_COLOR)
+        search_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        tk.Label(search_frame, text="Search:", **LABEL_STYLE).pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.search_entry = tk.Entry(search_frame, **ENTRY_STYLE, width=30)
+        self.search_entry.pack(side=tk.LEFT)
+        self.search_entry.bind('<KeyRelease>', lambda e: self.search_customers())
+        
         # Customers table
         table_frame = tk.Frame(self, bg='white')
         table_frame.pack(fill=tk.BOTH, expand=True)
@@ -58,21 +71,41 @@ class CustomersView(tk.Frame):
         # Pack
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    
-    def load_customers(self):
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
         
-        # Get customers
-        customers = self.controllers['customer'].get_all_customers()
+        self.rows = TreeBinder(self.tree, key=lambda customer: customer['customer_id'], values=lambda customer: (
+            customer.get('customer_id', ''),
+            customer.get('name', ''),
+            customer.get('email', ''),
+            customer.get('phone', ''),
+            customer.get('city', ''),
+            format_date_short(customer.get('created_at', ''))
+        ))
         
-        for customer in customers:
-            self.tree.insert('', 'end', values=(
-                customer.get('customer_id', ''),
-                customer.get('name', ''),
-                customer.get('email', ''),
-                customer.get('phone', ''),
-                customer.get('city', ''),
-                format_date_short(customer.get('created_at', ''))
-            ))
+        # Pagination
+        self.pagination = PaginationBar(
+            self,
+            self.fetch_customers,
+            self.show_customers,
+            worker=self.controllers['worker']
+        )
+        self.pagination.pack(pady=(10, 0))
+    
+    def load_customers(self):
+        """Load the first page of customers"""
+        self.pagination.first_page()
+    
+    def fetch_customers(self, cursor, backwards):
+        """Page through search results while a search is active, else all customers"""
+        if self.search_query:
+            return self.controllers['customer'].search_customers_page(self.search_query, cursor, backwards)
+        return self.controllers['customer'].get_customers_page(cursor, backwards)
+    
+    def search_customers(self):
+        query = self.search_entry.get().strip()
+        if query == self.search_query:
+            return
+        self.search_query = query
+        self.load_customers()
+    
+    def show_customers(self, customers):
+        self.rows.update(customers)
@@ -6,6 +6,8 @@ from tkinter import ttk
 import config
 from assets.styles import *
 from components.dialogs import show_error, show_success, confirm
+from components.pagination import PaginationBar
+from components.tree_binder import TreeBinder
 from utils.helpers import format_currency, format_date_short, get_status_color
 
 class OrdersView(tk.Frame):
@@ -63,24 +65,31 @@ class OrdersView(tk.Frame):
         
         # Context menu
         self.tree.bind('<Button-3>', self.show_context_menu)
+        
+        self.rows = TreeBinder(self.tree, key=lambda order: order['order_id'], values=lambda order: (
+            order.get('order_id', ''),
+            order.get('customer_name', 'N/A'),
+            format_date_short(order.get('order_date', '')),
+            format_currency(order.get('total_amount', 0)),
+            order.get('status', '').upper(),
+            order.get('payment_method', '')
+        ), tags=lambda order: (order.get('status', ''),))
+        
+        # Pagination
+        self.pagination = PaginationBar(
+            self,
+            self.controllers['order'].get_orders_page,
+            self.show_orders,
+            worker=self.controllers['worker']
+        )
+        self.pagination.pack(pady=(10, 0))
     
     def load_orders(self):
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get orders
-        orders = self.controllers['order'].get_all_orders()
-        
-        for order in orders:
-            self.tree.insert('', 'end', values=(
-                order.get('order_id', ''),
-                order.get('customer_name', 'N/A'),
-                format_date_short(order.get('order_date', '')),
-                format_currency(order.get('total_amount', 0)),
-                order.get('status', '').upper(),
-                order.get('payment_method', '')
-            ), tags=(order.get('status', ''),))
+        """Load the first page of orders"""
+        self.pagination.first_page()
+    
+    def show_orders(self, orders):
+        self.rows.update(orders)
     
     def show_context_menu(self, event):
         selection = self.tree.selection()
@@ -109,7 +118,7 @@ class OrdersView(tk.Frame):
         
         if success:
             show_success(message)
-            self.load_orders()
+            self.pagination.reload()
         else:
             show_error(message)
 
@@ -162,19 +171,15 @@ class CustomerOrdersView(tk.Frame):
         # Pack
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.rows = TreeBinder(self.tree, key=lambda order: order['order_id'], values=lambda order: (
+            order.get('order_id', ''),
+            format_date_short(order.get('order_date', '')),
+            format_currency(order.get('total_amount', 0)),
+            order.get('status', '').upper()
+        ))
     
     def load_orders(self):
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         # Get user orders
         orders = self.controllers['order'].get_user_orders(self.user.user_id)
-        
-        for order in orders:
-            self.tree.insert('', 'end', values=(
-                order.get('order_id', ''),
-                format_date_short(order.get('order_date', '')),
-                format_currency(order.get('total_amount', 0)),
-                order.get('status', '').upper()
-            ))
+        self.rows.update(orders)
@@ -6,6 +6,9 @@ from tkinter import ttk
 import config
 from assets.styles import *
 from components.dialogs import show_error, show_success, confirm, ProductDialog
+from components.pagination import PaginationBar
+from components.tree_binder import TreeBinder
+from utils.background import DebouncedSearch
 from utils.helpers import format_currency
 
 class ProductsView(tk.Frame):
@@ -42,7 +45,16 @@ class ProductsView(tk.Frame):
         
         self.search_entry = tk.Entry(search_frame, **ENTRY_STYLE, width=30)
         self.search_entry.pack(side=tk.LEFT)
-        self.search_entry.bind('<KeyRelease>', lambda e: self.search_products())
+        self.search_entry.bind('<KeyRelease>', lambda e: self.search.schedule(self.search_entry.get().strip()))
+        
+        # Search as you type, on the worker threads
+        self.search = DebouncedSearch(
+            self,
+            self.controllers['worker'],
+            self.controllers['product'].search_products,
+            self.show_search_results,
+            on_empty=self.show_all_products
+        )
         
         # Products table
         table_frame = tk.Frame(self, bg='white')
@@ -90,51 +102,55 @@ class ProductsView(tk.Frame):
         # Context menu
         self.tree.bind('<Button-3>', self.show_context_menu)
         self.tree.bind('<Double-1>', lambda e: self.edit_product())
+        
+        self.rows = TreeBinder(self.tree, key=lambda product: product.product_id, values=lambda product: (
+            product.product_id,
+            product.name,
+            product.category,
+            format_currency(product.price),
+            format_currency(product.cost),
+            product.stock_quantity
+        ))
+        
+        # Pagination
+        self.pagination = PaginationBar(
+            self,
+            self.controllers['product'].get_products_page,
+            self.show_products,
+            worker=self.controllers['worker']
+        )
+        self.pagination.pack(pady=(10, 0))
     
     def load_products(self):
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get products
-        products = self.controllers['product'].get_all_products()
-        
-        for product in products:
-            self.tree.insert('', 'end', values=(
-                product.product_id,
-                product.name,
-                product.category,
-                format_currency(product.price),
-                format_currency(product.cost),
-                product.stock_quantity
-            ))
+        """Load the first page of products"""
+        self.pagination.first_page()
+    
+    def refresh_products(self):
+        """Reload whatever is on screen after a change"""
+        if self.search_entry.get().strip():
+            self.search_products()
+        else:
+            self.pagination.reload()
+    
+    def show_products(self, products):
+        self.rows.update(products)
     
     def search_products(self):
-        query = self.search_entry.get().strip()
-        
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        if not query:
-            self.load_products()
-            return
-        
-        # Search products
-        products = self.controllers['product'].search_products(query)
-        
-        for product in products:
-            self.tree.insert('', 'end', values=(
-                product.product_id,
-                product.name,
-                product.category,
-                format_currency(product.price),
-                format_currency(product.cost),
-                product.stock_quantity
-            ))
+        """Search for what is in the search box without waiting for typing to pause"""
+        self.search.run_now(self.search_entry.get().strip())
+    
+    def show_search_results(self, query, products):
+        # Search results are ranked, not paged
+        self.pagination.cancel()
+        self.pagination.pack_forget()
+        self.show_products(products)
+    
+    def show_all_products(self):
+        self.pagination.pack(pady=(10, 0))
+        self.load_products()
     
     def add_product(self):
-        dialog = ProductDialog(self, "Add Product")
+        dialog = ProductDialog(self, "Add Product", thumbnails=self.controllers['thumbnails'])
         result = dialog.show()
         
         if result:
@@ -144,12 +160,16 @@ class ProductsView(tk.Frame):
                 category=result['category'],
                 price=result['price'],
                 cost=result['cost'],
-                stock_quantity=result['stock_quantity']
+                stock_quantity=result['stock_quantity'],
+                image_path=result['image_path']
             )
             
             if success:
                 show_success(message)
-                self.load_products()
+                if self.search_entry.get().strip():
+                    self.search_products()  # Keep the search; the new product is listed if it matches
+                else:
+                    self.load_products()  # Newest first, so the new product is on the first page
             else:
                 show_error(message)
     
@@ -167,7 +187,7 @@ class ProductsView(tk.Frame):
             show_error("Product not found")
             return
         
-        dialog = ProductDialog(self, "Edit Product", product)
+        dialog = ProductDialog(self, "Edit Product", product, thumbnails=self.controllers['thumbnails'])
         result = dialog.show()
         
         if result:
@@ -178,12 +198,13 @@ class ProductsView(tk.Frame):
                 category=result['category'],
                 price=result['price'],
                 cost=result['cost'],
-                stock_quantity=result['stock_quantity']
+                stock_quantity=result['stock_quantity'],
+                image_path=result['image_path']
             )
             
             if success:
                 show_success(message)
-                self.load_products()
+                self.refresh_products()
             else:
                 show_error(message)
     
@@ -202,7 +223,7 @@ class ProductsView(tk.Frame):
             
             if success:
                 show_success(message)
-                self.load_products()
+                self.refresh_products()
             else:
                 show_error(message)
     
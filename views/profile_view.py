@@ -113,9 +113,11 @@ class ProfileView(tk.Frame):
         
         if customer:
             self.customer_id = customer.customer_id
-            self.phone_entry.insert(0, customer.phone or '')
-            self.address_entry.insert(0, customer.address or '')
-            self.city_entry.insert(0, customer.city or '')
+            for entry, value in ((self.phone_entry, customer.phone),
+                                 (self.address_entry, customer.address),
+                                 (self.city_entry, customer.city)):
+                entry.delete(0, tk.END)  # Also called again to refresh the form
+                entry.insert(0, value or '')
         else:
             self.customer_id = None
     
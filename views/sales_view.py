@@ -11,6 +11,7 @@ class SalesView(tk.Frame):
     def __init__(self, parent, controllers):
         super().__init__(parent, bg=config.BG_COLOR)
         self.controllers = controllers
+        self._sales_task = None  # Newest sales load; older ones are cancelled
         
         self.create_widgets()
         self.load_sales()
@@ -26,12 +27,13 @@ class SalesView(tk.Frame):
             **LABEL_TITLE_STYLE
         ).pack(side=tk.LEFT)
         
-        tk.Button(
+        self.report_button = tk.Button(
             header_frame,
             text="📊 Generate Report",
             **BUTTON_PRIMARY_STYLE,
             command=self.generate_report
-        ).pack(side=tk.RIGHT)
+        )
+        self.report_button.pack(side=tk.RIGHT)
         
         # Summary cards
         summary_frame = tk.Frame(self, bg=config.BG_COLOR)
@@ -73,7 +75,7 @@ class SalesView(tk.Frame):
         # Treeview
         self.tree = ttk.Treeview(
             table_frame,
-            columns=('Date', 'Orders', 'Total Sales'),
+            columns=('Date', 'Orders', 'Units', 'Total Sales', 'Profit'),
             show='headings',
             yscrollcommand=v_scrollbar.set
         )
@@ -83,24 +85,50 @@ class SalesView(tk.Frame):
         # Define columns
         self.tree.heading('Date', text='Date')
         self.tree.heading('Orders', text='Number of Orders')
+        self.tree.heading('Units', text='Units Sold')
         self.tree.heading('Total Sales', text='Total Sales')
+        self.tree.heading('Profit', text='Profit')
         
         self.tree.column('Date', width=150)
         self.tree.column('Orders', width=150)
+        self.tree.column('Units', width=100)
         self.tree.column('Total Sales', width=150)
+        self.tree.column('Profit', width=150)
         
         # Pack
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
     def load_sales(self):
+        # Loading state until the worker thread returns
+        self.total_sales_label.config(text="Total Sales: Loading...")
+        self.total_orders_label.config(text="Total Orders: Loading...")
+        
+        # Only the newest load may reach the table
+        if self._sales_task is not None:
+            self._sales_task.cancel()
+        self._sales_task = self.controllers['worker'].run(
+            self,
+            self.controllers['db'].get_sales_data,
+            on_done=self.show_sales,
+            on_error=self.sales_failed
+        )
+    
+    def sales_failed(self, error):
+        from tkinter import messagebox
+        
+        self._sales_task = None
+        self.total_sales_label.config(text="Total Sales: unavailable")
+        self.total_orders_label.config(text="Total Orders: unavailable")
+        messagebox.showerror("Sales", f"Could not load sales: {error}")
+    
+    def show_sales(self, sales_data):
+        self._sales_task = None
+        
         # Clear tree
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # Get sales data
-        sales_data = self.controllers['db'].get_sales_data()
-        
         total_sales = 0
         total_orders = 0
         
@@ -108,7 +136,9 @@ class SalesView(tk.Frame):
             self.tree.insert('', 'end', values=(
                 format_date_short(sale.get('date', '')),
                 sale.get('order_count', 0),
-                format_currency(sale.get('total_sales', 0))
+                sale.get('units', 0),
+                format_currency(sale.get('total_sales', 0)),
+                format_currency(sale.get('profit', 0))
             ))
             
             total_sales += sale.get('total_sales', 0)
@@ -120,11 +150,28 @@ class SalesView(tk.Frame):
     
     def generate_report(self):
         """Generate detailed sales report"""
+        self.report_button.config(state=tk.DISABLED, text="⏳ Generating...")
+        
+        # Get all orders in the background
+        self.controllers['worker'].run(
+            self,
+            self.controllers['order'].get_all_orders,
+            on_done=self.show_report,
+            on_error=self.report_failed
+        )
+    
+    def report_failed(self, error):
+        from tkinter import messagebox
+        
+        self.report_button.config(state=tk.NORMAL, text="📊 Generate Report")
+        messagebox.showerror("Sales Report", f"Could not generate report: {error}")
+    
+    def show_report(self, orders):
+        """Show the report dialog for the fetched orders"""
         from tkinter import messagebox
         import datetime
         
-        # Get all orders
-        orders = self.controllers['order'].get_all_orders()
+        self.report_button.config(state=tk.NORMAL, text="📊 Generate Report")
         
         if not orders:
             messagebox.showinfo("Sales Report", "No sales data available to generate report.")
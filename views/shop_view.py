@@ -2,12 +2,16 @@
 Shop View for Girlush Collections - Customer
 """
 import tkinter as tk
-from tkinter import ttk
 import config
 from assets.styles import *
 from components.dialogs import show_error, show_success
+from components.virtual_grid import VirtualGrid
+from utils.background import DebouncedSearch
 from utils.helpers import format_currency
 
+# Fixed card height, so the grid can place rows without measuring them
+CARD_HEIGHT = 340 + config.THUMBNAIL_SIZE[1]
+
 class ShopView(tk.Frame):
     def __init__(self, parent, user, controllers, update_cart_callback):
         super().__init__(parent, bg=config.BG_COLOR)
@@ -37,109 +41,172 @@ class ShopView(tk.Frame):
         
         self.search_entry = tk.Entry(search_frame, **ENTRY_STYLE, width=30)
         self.search_entry.pack(side=tk.LEFT)
-        self.search_entry.bind('<KeyRelease>', lambda e: self.search_products())
-        
-        # Products grid
-        canvas = tk.Canvas(self, bg=config.BG_COLOR, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = tk.Frame(canvas, bg=config.BG_COLOR)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        self.search_entry.bind('<KeyRelease>', lambda e: self.search.schedule(self.search_entry.get().strip()))
+        
+        # Search as you type, on the worker threads
+        self.search = DebouncedSearch(
+            self,
+            self.controllers['worker'],
+            self.controllers['product'].search_products_with_snippets,
+            self.show_search_results,
+            on_empty=self.load_products
         )
         
-        canvas_window = canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Products grid: only the cards on screen exist, rebound as the user scrolls
+        self.grid_view = VirtualGrid(
+            self,
+            lambda parent: ProductCard(parent, self.add_to_cart, self.controllers['thumbnails']),
+            lambda card, entry: card.show(*entry),
+            row_height=CARD_HEIGHT,
+            columns=3,
+            load_more=self.load_more_products
+        )
+        self.grid_view.pack(fill=tk.BOTH, expand=True)
         
-        # Bind canvas resize
-        def on_canvas_configure(event):
-            canvas.itemconfig(canvas_window, width=event.width)
-        canvas.bind('<Configure>', on_canvas_configure)
+        # In-stock listing, loaded a page at a time
+        self._cursor = None
+        self._has_more = False
+        self._page_task = None
+    
+    def load_products(self):
+        """Show in-stock products from the first page"""
+        self._cancel_page()
+        self._cursor = None
+        self._has_more = True
+        self.grid_view.set_items([])
+        self.load_more_products()
+    
+    def refresh_products(self):
+        """Reload whatever is on screen after a change"""
+        if self.search.query:
+            self.search_products()
+        else:
+            self.load_products()
+    
+    def load_more_products(self):
+        """Fetch the next page of the listing in the background"""
+        if not self._has_more or self._page_task is not None or self.search.query:
+            return
+        self._page_task = self.controllers['worker'].run(
+            self,
+            self.controllers['product'].get_in_stock_products_page,
+            self._cursor,
+            on_done=self.show_page
+        )
+    
+    def show_page(self, page):
+        self._page_task = None
+        self._cursor = page.next_cursor
+        self._has_more = page.has_next
+        self.grid_view.extend([(product, None) for product in page.items])
+    
+    def _cancel_page(self):
+        if self._page_task is not None:
+            self._page_task.cancel()
+            self._page_task = None
+    
+    def add_to_cart(self, product, quantity):
+        if quantity < 1:
+            show_error("Quantity must be at least 1")
+            return
         
-        # Enable mousewheel scrolling
-        def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        if quantity > product.stock_quantity:
+            show_error(f"Only {product.stock_quantity} items available in stock")
+            return
         
-        # Cleanup
-        def on_destroy(event):
-            canvas.unbind_all("<MouseWheel>")
-        self.bind('<Destroy>', on_destroy)
+        success, message = self.controllers['cart'].add_to_cart(
+            self.user.user_id,
+            product.product_id,
+            quantity
+        )
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        if success:
+            show_success(f"{quantity} x {product.name} added to cart")
+            self.update_cart_callback()
+        else:
+            show_error(message)
     
-    def load_products(self):
-        # Clear products
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        # Get products
-        products = self.controllers['product'].get_all_products()
-        
-        # Display products in grid
-        row = 0
-        col = 0
-        max_cols = 3
-        
-        for product in products:
-            if product.stock_quantity > 0:  # Only show in-stock products
-                product_card = self.create_product_card(product)
-                product_card.grid(row=row, column=col, padx=10, pady=10, sticky='ew')
-                
-                col += 1
-                if col >= max_cols:
-                    col = 0
-                    row += 1
-        
-        # Configure grid columns
-        for i in range(max_cols):
-            self.scrollable_frame.grid_columnconfigure(i, weight=1)
+    def search_products(self):
+        """Search for what is in the search box without waiting for typing to pause"""
+        self.search.run_now(self.search_entry.get().strip())
     
-    def create_product_card(self, product):
-        card = tk.Frame(self.scrollable_frame, bg='white', relief='solid', borderwidth=1)
+    def show_search_results(self, query, results):
+        # Ranked, with highlighted matches; search results arrive whole
+        self._cancel_page()
+        self._has_more = False
+        self.grid_view.set_items([(result['product'], result['snippet']) for result in results
+                                  if result['product'].stock_quantity > 0])
+
+
+class ProductCard(tk.Frame):
+    """Shop card for one product; show() rebinds it to another product"""
+    def __init__(self, parent, add_to_cart, thumbnails):
+        super().__init__(parent, bg='white', relief='solid', borderwidth=1)
+        self.add_to_cart = add_to_cart
+        self.thumbnails = thumbnails
+        self.product = None
+        self.photo = None
         
         # Product info
-        info_frame = tk.Frame(card, bg='white')
+        info_frame = tk.Frame(self, bg='white')
         info_frame.pack(padx=15, pady=15, fill=tk.BOTH, expand=True)
         
+        # Image, in a fixed-size box so cards line up with or without one
+        width, height = config.THUMBNAIL_SIZE
+        image_box = tk.Frame(info_frame, width=width, height=height, bg='white')
+        image_box.pack_propagate(False)
+        image_box.pack(anchor='w', pady=(0, 5))
+        self.image_label = tk.Label(image_box, bg='white')
+        self.image_label.pack(fill=tk.BOTH, expand=True)
+        
         # Name
-        tk.Label(
+        self.name_label = tk.Label(
             info_frame,
-            text=product.name,
             font=(config.FONT_FAMILY, config.FONT_SIZE_MEDIUM, 'bold'),
             bg='white',
             fg=config.TEXT_COLOR,
-            wraplength=200
-        ).pack(anchor='w', pady=(0, 5))
+            wraplength=200,
+            justify='left'
+        )
+        self.name_label.pack(anchor='w', pady=(0, 5))
         
         # Category
-        tk.Label(
+        self.category_label = tk.Label(
             info_frame,
-            text=product.category,
             font=(config.FONT_FAMILY, config.FONT_SIZE_SMALL),
             bg='white',
             fg='gray'
-        ).pack(anchor='w', pady=(0, 5))
+        )
+        self.category_label.pack(anchor='w', pady=(0, 5))
+        
+        # Search match
+        self.snippet_label = tk.Label(
+            info_frame,
+            font=(config.FONT_FAMILY, config.FONT_SIZE_SMALL, 'italic'),
+            bg='white',
+            fg=config.TEXT_COLOR,
+            wraplength=200,
+            justify='left'
+        )
+        self.snippet_label.pack(anchor='w', pady=(0, 5))
         
         # Price
-        tk.Label(
+        self.price_label = tk.Label(
             info_frame,
-            text=format_currency(product.price),
             font=(config.FONT_FAMILY, config.FONT_SIZE_LARGE, 'bold'),
             bg='white',
             fg=config.PRIMARY_COLOR
-        ).pack(anchor='w', pady=(10, 5))
+        )
+        self.price_label.pack(anchor='w', pady=(10, 5))
         
         # Stock
-        tk.Label(
+        self.stock_label = tk.Label(
             info_frame,
-            text=f"In Stock: {product.stock_quantity}",
             font=(config.FONT_FAMILY, config.FONT_SIZE_SMALL),
             bg='white',
             fg=config.SUCCESS_COLOR
-        ).pack(anchor='w', pady=(0, 10))
+        )
+        self.stock_label.pack(anchor='w', pady=(0, 10))
         
         # Quantity selector
         qty_frame = tk.Frame(info_frame, bg='white')
@@ -152,79 +219,45 @@ class ShopView(tk.Frame):
             bg='white'
         ).pack(side=tk.LEFT, padx=(0, 5))
         
-        qty_var = tk.IntVar(value=1)
-        qty_spinbox = tk.Spinbox(
+        self.qty_var = tk.IntVar(value=1)
+        self.qty_spinbox = tk.Spinbox(
             qty_frame,
             from_=1,
-            to=product.stock_quantity,
-            textvariable=qty_var,
+            to=1,
+            textvariable=self.qty_var,
             width=8,
             font=(config.FONT_FAMILY, config.FONT_SIZE_NORMAL),
             relief='solid',
             borderwidth=1
         )
-        qty_spinbox.pack(side=tk.LEFT)
+        self.qty_spinbox.pack(side=tk.LEFT)
         
         # Add to cart button
-        add_btn = tk.Button(
+        tk.Button(
             info_frame,
             text="Add to Cart",
-            command=lambda p=product, q=qty_var: self.add_to_cart(p, q.get()),
+            command=lambda: self.add_to_cart(self.product, self.qty_var.get()),
             **BUTTON_STYLE
-        )
-        add_btn.pack(fill=tk.X)
-        
-        return card
+        ).pack(fill=tk.X)
     
-    def add_to_cart(self, product, quantity):
-        if quantity < 1:
-            show_error("Quantity must be at least 1")
-            return
-        
-        if quantity > product.stock_quantity:
-            show_error(f"Only {product.stock_quantity} items available in stock")
-            return
-        
-        success, message = self.controllers['cart'].add_to_cart(
-            self.user.user_id,
-            product.product_id,
-            quantity
-        )
-        
-        if success:
-            show_success(f"{quantity} x {product.name} added to cart")
-            self.update_cart_callback()
-        else:
-            show_error(message)
+    def show(self, product, snippet=None):
+        """Display ``product`` (and its search snippet) on this card"""
+        self.product = product
+        self.name_label.config(text=product.name)
+        self.category_label.config(text=product.category)
+        self.snippet_label.config(text=snippet or '')
+        self.price_label.config(text=format_currency(product.price))
+        self.stock_label.config(text=f"In Stock: {product.stock_quantity}")
+        self.qty_spinbox.config(to=product.stock_quantity)
+        self.qty_var.set(1)
+        
+        self.photo = None
+        self.image_label.config(image='')
+        self.thumbnails.request(self, product.image_path,
+                                lambda photo: self.set_image(product.product_id, photo))
     
-    def search_products(self):
-        query = self.search_entry.get().strip()
-        
-        # Clear products
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        if not query:
-            self.load_products()
-            return
-        
-        # Search products
-        products = self.controllers['product'].search_products(query)
-        
-        # Display results
-        row = 0
-        col = 0
-        max_cols = 3
-        
-        for product in products:
-            if product.stock_quantity > 0:
-                product_card = self.create_product_card(product)
-                product_card.grid(row=row, column=col, padx=10, pady=10, sticky='ew')
-                
-                col += 1
-                if col >= max_cols:
-                    col = 0
-                    row += 1
-        
-        for i in range(max_cols):
-            self.scrollable_frame.grid_columnconfigure(i, weight=1)
+    def set_image(self, product_id, photo):
+        # The card may have been rebound to another product while the thumbnail loaded
+        if self.product is not None and self.product.product_id == product_id:
+            self.photo = photo
+            self.image_label.config(image=photo)